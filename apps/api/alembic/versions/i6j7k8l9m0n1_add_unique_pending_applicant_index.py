@@ -0,0 +1,94 @@
+"""add unique partial index on pending applications per applicant email and school
+
+Revision ID: i6j7k8l9m0n1
+Revises: h5i6j7k8l9m0
+Create Date: 2026-10-16
+
+Lets submission detect an applicant's duplicate pending application with a
+single INSERT ... ON CONFLICT DO NOTHING instead of SELECT-then-INSERT.
+Together with ix_school_applications_unique_pending (school name + city),
+both duplicate rules are enforced atomically by the database.
+
+The indexed email mirrors get_effective_applicant_email_from_model: the
+principal's email when the applicant is the principal, otherwise the
+applicant's email.
+
+Before this index, duplicates were caught by SELECTs that could race and
+did not lower-case the effective email, so existing pending rows may
+already collide. The upgrade checks for such rows first and stops with a
+list of them instead of failing inside CREATE UNIQUE INDEX.
+
+Manual remediation: for each listed group, keep one application pending and
+move the others out of the pending set (e.g. set status to 'EXPIRED' or
+'REJECTED' after confirming with the applicant), then re-run the upgrade.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "i6j7k8l9m0n1"
+down_revision = "h5i6j7k8l9m0"
+branch_labels = None
+depends_on = None
+
+
+# Effective applicant email as indexed below (lower-cased)
+_EFFECTIVE_EMAIL = """
+    LOWER(
+        CASE WHEN applicant_is_principal THEN principal_email
+        ELSE COALESCE(applicant_email, principal_email) END
+    )
+"""
+
+
+def upgrade() -> None:
+    # Refuse to proceed if existing pending applications would violate the index
+    collisions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"""
+                SELECT {_EFFECTIVE_EMAIL} AS email, LOWER(school_name) AS school,
+                       array_agg(id::text ORDER BY submitted_at) AS ids
+                FROM school_applications
+                WHERE status NOT IN ('APPROVED', 'REJECTED', 'EXPIRED')
+                GROUP BY 1, 2
+                HAVING COUNT(*) > 1
+                """
+            )
+        )
+        .all()
+    )
+    if collisions:
+        groups = "\n".join(
+            f"  {row.email} / {row.school}: {', '.join(row.ids)}" for row in collisions
+        )
+        raise RuntimeError(
+            "Cannot create ix_school_applications_unique_pending_applicant: these pending "
+            "applications share an applicant email and school name (case-insensitive). "
+            "Keep one per group pending and expire or reject the rest, then re-run the "
+            f"upgrade:\n{groups}"
+        )
+
+    # Only one pending application per (effective applicant email, school name)
+    # The LOWER() functions make the comparison case-insensitive
+    op.execute(
+        """
+        CREATE UNIQUE INDEX ix_school_applications_unique_pending_applicant
+        ON school_applications (
+            LOWER(
+                CASE WHEN applicant_is_principal THEN principal_email
+                ELSE COALESCE(applicant_email, principal_email) END
+            ),
+            LOWER(school_name)
+        )
+        WHERE status NOT IN ('APPROVED', 'REJECTED', 'EXPIRED')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_school_applications_unique_pending_applicant", table_name="school_applications"
+    )
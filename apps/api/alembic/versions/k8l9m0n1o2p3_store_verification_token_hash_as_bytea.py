@@ -0,0 +1,47 @@
+"""Store verification token hashes as raw SHA-256 digests
+
+Revision ID: k8l9m0n1o2p3
+Revises: i6j7k8l9m0n1
+Create Date: 2026-10-16
+
+Tokens were already stored hashed, but as 64-character hex strings in a
+VARCHAR(255) column with both a unique constraint and a redundant index.
+This migration replaces the column with a fixed-length 32-byte BYTEA
+token_hash column (unique), converting existing rows in place.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "k8l9m0n1o2p3"
+down_revision = "i6j7k8l9m0n1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("verification_tokens", sa.Column("token_hash", sa.LargeBinary(length=32)))
+
+    # Existing values are hex-encoded SHA-256 digests
+    op.execute("UPDATE verification_tokens SET token_hash = decode(token, 'hex')")
+
+    op.alter_column("verification_tokens", "token_hash", nullable=False)
+    op.create_unique_constraint(
+        "uq_verification_tokens_token_hash", "verification_tokens", ["token_hash"]
+    )
+
+    # Dropping the column also drops its unique constraint
+    op.drop_index("ix_verification_tokens_token", table_name="verification_tokens")
+    op.drop_column("verification_tokens", "token")
+
+
+def downgrade() -> None:
+    op.add_column("verification_tokens", sa.Column("token", sa.String(length=255)))
+    op.execute("UPDATE verification_tokens SET token = encode(token_hash, 'hex')")
+    op.alter_column("verification_tokens", "token", nullable=False)
+    op.create_unique_constraint(None, "verification_tokens", ["token"])
+    op.create_index("ix_verification_tokens_token", "verification_tokens", ["token"], unique=False)
+
+    op.drop_constraint("uq_verification_tokens_token_hash", "verification_tokens", type_="unique")
+    op.drop_column("verification_tokens", "token_hash")
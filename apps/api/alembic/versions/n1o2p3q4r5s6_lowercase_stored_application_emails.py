@@ -0,0 +1,39 @@
+"""Lowercase stored school application emails
+
+Revision ID: n1o2p3q4r5s6
+Revises: k8l9m0n1o2p3
+Create Date: 2026-10-16
+
+Emails are now lowercased by the request schemas before they are stored.
+This migration canonicalizes existing rows the same way, so duplicate checks
+and email matching can compare values directly. The unique pending-applicant
+index already compared LOWER() values, so no row can conflict.
+
+There is no downgrade: the original casing is not kept.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "n1o2p3q4r5s6"
+down_revision = "k8l9m0n1o2p3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE school_applications
+        SET principal_email = LOWER(principal_email),
+            applicant_email = LOWER(applicant_email),
+            school_email = LOWER(school_email)
+        WHERE principal_email <> LOWER(principal_email)
+           OR applicant_email <> LOWER(applicant_email)
+           OR school_email <> LOWER(school_email)
+        """
+    )
+
+
+def downgrade() -> None:
+    pass
@@ -162,7 +162,7 @@ async def _validate_jwt_token(token: str) -> AdminUser:
         # Verify token type is access token
         token_type = payload.get("type", "access")
         if token_type != "access":
-            logger.warning(f"Invalid token type: {token_type}")
+            logger.warning("Invalid token type: %s", token_type)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={
@@ -180,7 +180,7 @@ async def _validate_jwt_token(token: str) -> AdminUser:
         )
 
     except (ValueError, KeyError) as e:
-        logger.warning(f"Invalid token claims: {e}")
+        logger.warning("Invalid token claims: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -225,8 +225,10 @@ async def get_current_admin_user(
     # Verify user has platform_admin role
     if user.role != "platform_admin":
         logger.warning(
-            f"Access denied: User {user.id} ({user.email}) has role '{user.role}', "
-            "but 'platform_admin' is required"
+            "Access denied: User %s (%s) has role '%s', but 'platform_admin' is required",
+            user.id,
+            user.email,
+            user.role,
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -236,7 +238,7 @@ async def get_current_admin_user(
             },
         )
 
-    logger.debug(f"Authenticated admin: {user.id} ({user.email})")
+    logger.debug("Authenticated admin: %s (%s)", user.id, user.email)
     return user
 
 
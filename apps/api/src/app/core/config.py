@@ -52,6 +52,11 @@ class Settings(BaseSettings):
     postgres_password: str = "eksms_dev_password"
     postgres_db: str = "eksms_dev"
 
+    # Connection pool (per worker process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
+
     @computed_field
     @property
     def database_url(self) -> str:
@@ -116,6 +121,9 @@ class Settings(BaseSettings):
     smtp_password: str = ""
     smtp_from_email: str = "noreply@eksms.local"
     smtp_from_name: str = "EK-SMS"
+    # Run full RFC email validation (email-validator) on submitted applications
+    # in addition to the cheap format check applied to every request.
+    strict_email_validation: bool = False
 
     # ==========================================
     # Two-Factor Authentication
@@ -0,0 +1,25 @@
+"""
+Countries
+
+Static country reference data shared by the API and service layers.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Targeting West Africa Countries for MVP
+SUPPORTED_COUNTRIES: tuple[dict[str, str], ...] = (
+    {"code": "LR", "name": "Liberia"},
+    {"code": "SL", "name": "Sierra Leone"},
+    {"code": "GN", "name": "Guinea"},
+    {"code": "GH", "name": "Ghana"},
+    {"code": "CI", "name": "Côte d'Ivoire"},
+    {"code": "NG", "name": "Nigeria"},
+    {"code": "SN", "name": "Senegal"},
+    {"code": "GM", "name": "Gambia"},
+)
+
+# Country code to name mapping, built once at import and read-only
+COUNTRY_NAMES: Mapping[str, str] = MappingProxyType(
+    {country["code"]: country["name"] for country in SUPPORTED_COUNTRIES}
+)
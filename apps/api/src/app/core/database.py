@@ -15,13 +15,14 @@ from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
-# Create async engine
+# Create async engine (async engines default to AsyncAdaptedQueuePool)
 engine = create_async_engine(
     settings.database_url,
     echo=settings.is_development,  # Log SQL in development
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,  # Replace connections before server timeouts
 )
 
 # Session factory
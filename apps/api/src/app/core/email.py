@@ -7,9 +7,15 @@ Handles sending emails for the school registration flow.
 import asyncio
 import logging
 import os
+from collections.abc import Mapping
 from html import escape
+from typing import Any
 
+import httpx
 import resend
+from resend.http_client import HTTPClient
+
+from app.core import email_batcher
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,69 @@ resend.api_key = os.getenv("RESEND_API_KEY")
 EMAIL_FROM = os.getenv("EMAIL_FROM", "EK-SMS <noreply@eksms.dev>")
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
+# Keep-alive connections held open to the Resend API
+EMAIL_HTTP_POOL_SIZE = 20
+EMAIL_HTTP_TIMEOUT_SECONDS = 30
+
+
+class _PooledHTTPClient(HTTPClient):
+    """
+    Resend HTTP client backed by one shared httpx.Client.
+
+    The SDK's default client opens a new TLS connection for every send;
+    reusing pooled keep-alive connections skips the handshake on each email.
+    """
+
+    def __init__(self) -> None:
+        self._client = httpx.Client(
+            timeout=EMAIL_HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=EMAIL_HTTP_POOL_SIZE,
+                max_keepalive_connections=EMAIL_HTTP_POOL_SIZE,
+            ),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: dict[str, object] | list[object] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, str] | None = None,
+    ) -> tuple[bytes, int, Mapping[str, str]]:
+        try:
+            if files is not None:
+                resp = self._client.request(method, url, headers=headers, files=files, data=data)
+            else:
+                resp = self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json if data is None else None,
+                    data=data,
+                )
+            return resp.content, resp.status_code, resp.headers
+        except httpx.RequestError as e:
+            # Resend wraps RuntimeError from the HTTP client in a ResendError
+            raise RuntimeError(f"Request failed: {e}") from e
+
+    def close(self) -> None:
+        self._client.close()
+
+
+_http_client = _PooledHTTPClient()
+resend.default_http_client = _http_client
+
+
+def close_email_client() -> None:
+    """
+    Close pooled connections to the Resend API.
+
+    Call this on application shutdown.
+    """
+    _http_client.close()
+
 
 async def send_email(
     to_email: str,
@@ -39,7 +108,7 @@ async def send_email(
     """
     if not resend.api_key:
         logger.warning("RESEND_API_KEY not set - logging email instead of sending")
-        logger.info(f"EMAIL TO: {to_email} | SUBJECT: {subject}")
+        logger.info("EMAIL TO: %s | SUBJECT: %s", to_email, subject)
         return True
 
     try:
@@ -50,12 +119,16 @@ async def send_email(
             "html": html_content,
         }
 
-        # Run sync Resend call in thread pool to avoid blocking event loop
-        email = await asyncio.to_thread(resend.Emails.send, params)
-        logger.info(f"Email sent successfully to {to_email}, id: {email['id']}")
+        if email_batcher.is_running():
+            # Coalesce with other sends in flight into one batch request
+            email_id = await email_batcher.enqueue_email(params)
+        else:
+            # Run sync Resend call in thread pool to avoid blocking event loop
+            email_id = (await asyncio.to_thread(resend.Emails.send, params))["id"]
+        logger.info("Email sent successfully to %s, id: %s", to_email, email_id)
         return True
     except Exception as e:
-        logger.error(f"Failed to send email to {to_email}: {e}")
+        logger.error("Failed to send email to %s: %s", to_email, e)
         return False
 
 
@@ -0,0 +1,184 @@
+"""
+Email Batcher
+
+Coalesces outbound emails into Resend batch requests. Sends queued within
+a short window go out in a single API call (up to Resend's batch limit)
+instead of one round trip each; a lone send still uses the single-email
+endpoint.
+"""
+
+import asyncio
+import logging
+
+import resend
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 100  # Resend batch endpoint limit
+BATCH_WINDOW_SECONDS = 0.05  # How long to wait for more sends to join a batch
+
+# Batch failures that mean nothing was sent, so single sends are safe to retry
+BATCH_REJECTED_ERRORS = (
+    resend.exceptions.ValidationError,
+    resend.exceptions.MissingRequiredFieldsError,
+)
+
+# Queued email and the future its caller is waiting on. None is queued by
+# stop_email_batcher() to end the drain loop after the current flush.
+_QueueItem = tuple[resend.Emails.SendParams, asyncio.Future[str]] | None
+
+# Queue and drain task (started on application startup)
+_queue: asyncio.Queue[_QueueItem] | None = None
+_worker: asyncio.Task | None = None
+
+
+def is_running() -> bool:
+    """Return True if the batcher is accepting sends."""
+    return _worker is not None
+
+
+def start_email_batcher() -> None:
+    """
+    Start the background task that drains queued emails.
+
+    Call this on application startup. Safe to call more than once.
+    """
+    global _queue, _worker
+    if _worker is not None:
+        return
+
+    _queue = asyncio.Queue()
+    _worker = asyncio.create_task(_drain_loop(_queue))
+
+
+async def stop_email_batcher() -> None:
+    """
+    Stop the drain task and send anything still queued.
+
+    The worker is told to stop with a sentinel rather than cancelled, so a
+    flush already in flight finishes and resolves its callers' futures.
+
+    Call this on application shutdown.
+    """
+    global _queue, _worker
+    if _worker is None or _queue is None:
+        return
+
+    worker, queue = _worker, _queue
+    _worker, _queue = None, None
+
+    await queue.put(None)
+    await worker
+
+    remaining = []
+    while not queue.empty():
+        item = queue.get_nowait()
+        if item is not None:
+            remaining.append(item)
+    if remaining:
+        await _flush(remaining)
+
+
+async def enqueue_email(params: resend.Emails.SendParams) -> str:
+    """
+    Queue an email for the next batch and wait for it to be sent.
+
+    Args:
+        params: Resend send parameters for a single email
+
+    Returns:
+        The Resend email id
+
+    Raises:
+        RuntimeError: If the batcher is not running
+        Exception: Whatever the provider raised for this email
+    """
+    if _queue is None:
+        raise RuntimeError("Email batcher is not running")
+
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    await _queue.put((params, future))
+    return await future
+
+
+async def _drain_loop(queue: asyncio.Queue[_QueueItem]) -> None:
+    """Collect queued emails into batches and send them until told to stop."""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        batch = [item]
+        stopping = False
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        await _flush(batch)
+        if stopping:
+            return
+
+
+async def _flush(batch: list[tuple[resend.Emails.SendParams, asyncio.Future[str]]]) -> None:
+    """
+    Send a batch and resolve each caller's future with its email id.
+
+    If the batch is rejected as invalid (strict validation rejects the whole
+    batch when any one email is invalid), each email is retried on its own so
+    a single bad recipient doesn't fail the others. Any other failure (rate
+    limit, provider error, timeout) may mean the batch was accepted, so it is
+    reported to every caller instead of retried, to avoid sending twice.
+    """
+    if len(batch) > 1:
+        try:
+            response = await asyncio.to_thread(resend.Batch.send, [p for p, _ in batch])
+        except BATCH_REJECTED_ERRORS as e:
+            logger.warning(
+                "Batch of %s emails rejected as invalid, sending individually: %s", len(batch), e
+            )
+        except Exception as e:
+            logger.error("Batch send of %s emails failed: %s", len(batch), e)
+            _fail_all(batch, e)
+            return
+        else:
+            email_ids = [email["id"] for email in response["data"]]
+            if len(email_ids) != len(batch):
+                # Accepted, but the ids can't be matched to callers
+                _fail_all(batch, ValueError(f"expected {len(batch)} ids, got {len(email_ids)}"))
+                return
+            for (_, future), email_id in zip(batch, email_ids, strict=True):
+                if not future.done():
+                    future.set_result(email_id)
+            return
+
+    await asyncio.gather(*(_send_one(params, future) for params, future in batch))
+
+
+def _fail_all(
+    batch: list[tuple[resend.Emails.SendParams, asyncio.Future[str]]], error: Exception
+) -> None:
+    """Resolve every caller's future in the batch with the same error."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+
+async def _send_one(params: resend.Emails.SendParams, future: asyncio.Future[str]) -> None:
+    """Send a single email through the regular endpoint and resolve its future."""
+    try:
+        email = await asyncio.to_thread(resend.Emails.send, params)
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(email["id"])
@@ -0,0 +1,53 @@
+"""
+Logging Configuration
+
+Routes all log records through a QueueHandler so request handlers never
+block the event loop on slow stream I/O. A QueueListener running in a
+background thread drains the queue and writes to stderr.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# Listener instance (started on application startup)
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """
+    Configure the root logger with a non-blocking queue handler.
+
+    Call this on application startup. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(settings.log_level.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Flush pending log records and stop the queue listener.
+
+    Call this on application shutdown.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -10,17 +10,44 @@ SECURITY: Rate limiting prevents abuse of sensitive endpoints like:
 - Email-sending endpoints (prevents spam)
 """
 
+import hashlib
 import logging
+import math
+import random
+import time
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
+from uuid import UUID
 
 from fastapi import HTTPException, Request, status
+from redis.exceptions import NoScriptError
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Rolling-window limiter executed atomically on the Redis server.
+# KEYS[1] = limit key
+# ARGV = [window_start, limit, now, ttl_seconds]
+# Returns nil when the request is allowed, otherwise {oldest_member, oldest_score}
+SLIDING_WINDOW_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local n = redis.call('ZCARD', KEYS[1])
+if n >= tonumber(ARGV[2]) then
+    return redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return nil
+"""
+# Scripts are invoked by SHA (EVALSHA) so the body is only sent when the
+# server's script cache doesn't have it yet
+SLIDING_WINDOW_SCRIPT_SHA = hashlib.sha1(SLIDING_WINDOW_SCRIPT.encode()).hexdigest()
+
+# Resend limit keys are the prefix plus the application UUID's 16 raw bytes
+RESEND_LIMIT_KEY_PREFIX = b"rl:resend:"
+
 # In-memory rate limit storage (fallback when Redis unavailable)
 # Format: {key: [(timestamp, count), ...]}
 _memory_store: dict[str, list[tuple[float, int]]] = {}
@@ -51,7 +78,7 @@ async def _get_redis_client():
         await client.ping()
         return client
     except Exception as e:
-        logger.warning(f"Redis unavailable for rate limiting, using memory: {e}")
+        logger.warning("Redis unavailable for rate limiting, using memory: %s", e)
         return None
 
 
@@ -170,13 +197,55 @@ async def check_rate_limit(
             await redis_client.close()
             return result
         except Exception as e:
-            logger.warning(f"Redis rate limit check failed: {e}")
+            logger.warning("Redis rate limit check failed: %s", e)
             await redis_client.close()
 
     # Fallback to memory
     return await _check_rate_limit_memory(key, limit, window_seconds)
 
 
+async def check_resend_limit(
+    client,
+    application_id: UUID,
+    limit: int,
+    window_seconds: int,
+    jitter_seconds: int = 0,
+) -> int | None:
+    """
+    Enforce the resend-verification rolling window for an application.
+
+    Trims expired entries, counts, records the request and refreshes the
+    key expiry in one atomic server-side script (a single round trip,
+    sent by SHA once the server has it cached).
+
+    Args:
+        client: Redis client
+        application_id: UUID of the application
+        limit: Maximum requests allowed in the window
+        window_seconds: Time window in seconds
+        jitter_seconds: Upper bound of random delay added to the retry hint,
+            so clients limited together don't all retry at the same instant
+
+    Returns:
+        None if the request is allowed, otherwise seconds until the oldest
+        request leaves the window (plus jitter)
+    """
+    now = time.time()
+    key = RESEND_LIMIT_KEY_PREFIX + application_id.bytes
+    args = (key, now - window_seconds, limit, now, window_seconds)
+    try:
+        oldest = await client.evalsha(SLIDING_WINDOW_SCRIPT_SHA, 1, *args)
+    except NoScriptError:
+        # Not cached on this server yet (or flushed); EVAL loads it
+        oldest = await client.eval(SLIDING_WINDOW_SCRIPT, 1, *args)
+
+    if not oldest:
+        return None
+
+    retry_after = float(oldest[1]) + window_seconds - now + random.uniform(0, jitter_seconds)
+    return max(math.ceil(retry_after), 1)
+
+
 def rate_limit(
     limit: int = 10,
     window_seconds: int = 60,
@@ -216,7 +285,7 @@ def rate_limit(
             if not request:
                 # No request object found, skip rate limiting
                 logger.warning(
-                    f"Rate limit decorator on {func.__name__} couldn't find Request object"
+                    "Rate limit decorator on %s couldn't find Request object", func.__name__
                 )
                 return await func(*args, **kwargs)
 
@@ -232,7 +301,7 @@ def rate_limit(
             allowed = await check_rate_limit(key, limit, window_seconds)
 
             if not allowed:
-                logger.warning(f"Rate limit exceeded for {key}: {limit}/{window_seconds}s")
+                logger.warning("Rate limit exceeded for %s: %s/%ss", key, limit, window_seconds)
                 raise RateLimitExceeded(limit, window_seconds)
 
             return await func(*args, **kwargs)
@@ -269,6 +338,7 @@ def admin_action_rate_limit(request: Request) -> str:
 __all__ = [
     "rate_limit",
     "check_rate_limit",
+    "check_resend_limit",
     "admin_action_rate_limit",
     "RateLimitExceeded",
 ]
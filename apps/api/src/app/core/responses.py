@@ -0,0 +1,35 @@
+"""
+Response Classes
+
+orjson-backed JSON response used as the application's default response class.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Naive datetimes are stored/treated as UTC; emit a compact "Z" suffix
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="python")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson in a single pass.
+
+    UUID, datetime and enum values are encoded natively, so handlers can
+    return them without a jsonable_encoder round-trip.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
@@ -78,11 +78,15 @@ def _job_listener(event: JobExecutionEvent) -> None:
     """
     if event.exception:
         logger.error(
-            f"Job {event.job_id} failed with exception: {event.exception}",
+            "Job %s failed with exception: %s",
+            event.job_id,
+            event.exception,
             exc_info=event.exception,
         )
     else:
-        logger.info(f"Job {event.job_id} executed successfully at {datetime.now(UTC).isoformat()}")
+        logger.info(
+            "Job %s executed successfully at %s", event.job_id, datetime.now(UTC).isoformat()
+        )
 
 
 def get_scheduler() -> AsyncIOScheduler | None:
@@ -188,7 +192,7 @@ def register_job(
     _job_registry[job_id] = func
 
     if _scheduler is None:
-        logger.debug(f"Scheduler not initialized, job {job_id} will be registered later")
+        logger.debug("Scheduler not initialized, job %s will be registered later", job_id)
         return
 
     _scheduler.add_job(
@@ -197,7 +201,7 @@ def register_job(
         id=job_id,
         replace_existing=replace_existing,
     )
-    logger.info(f"Registered job: {job_id}")
+    logger.info("Registered job: %s", job_id)
 
 
 def register_jobs_from_registry() -> None:
@@ -213,7 +217,7 @@ def register_jobs_from_registry() -> None:
         logger.warning("Cannot register jobs: scheduler not initialized")
         return
 
-    logger.info(f"Registering {len(_job_registry)} jobs from registry...")
+    logger.info("Registering %s jobs from registry...", len(_job_registry))
 
 
 async def trigger_job_manually(job_id: str) -> dict[str, Any]:
@@ -247,18 +251,18 @@ async def trigger_job_manually(job_id: str) -> dict[str, Any]:
     func = _job_registry[job_id]
     executed_at = datetime.now(UTC)
 
-    logger.info(f"Manually triggering job: {job_id}")
+    logger.info("Manually triggering job: %s", job_id)
 
     try:
         await func()
-        logger.info(f"Manual execution of job {job_id} completed successfully")
+        logger.info("Manual execution of job %s completed successfully", job_id)
         return {
             "job_id": job_id,
             "status": "success",
             "executed_at": executed_at.isoformat(),
         }
     except Exception as e:
-        logger.error(f"Manual execution of job {job_id} failed: {e}", exc_info=True)
+        logger.error("Manual execution of job %s failed: %s", job_id, e, exc_info=True)
         return {
             "job_id": job_id,
             "status": "error",
@@ -322,10 +326,10 @@ def pause_job(job_id: str) -> bool:
     job = _scheduler.get_job(job_id)
     if job:
         _scheduler.pause_job(job_id)
-        logger.info(f"Paused job: {job_id}")
+        logger.info("Paused job: %s", job_id)
         return True
 
-    logger.warning(f"Job not found for pausing: {job_id}")
+    logger.warning("Job not found for pausing: %s", job_id)
     return False
 
 
@@ -348,8 +352,8 @@ def resume_job(job_id: str) -> bool:
     job = _scheduler.get_job(job_id)
     if job:
         _scheduler.resume_job(job_id)
-        logger.info(f"Resumed job: {job_id}")
+        logger.info("Resumed job: %s", job_id)
         return True
 
-    logger.warning(f"Job not found for resuming: {job_id}")
+    logger.warning("Job not found for resuming: %s", job_id)
     return False
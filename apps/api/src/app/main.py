@@ -18,9 +18,14 @@ from sqlalchemy import text
 from app.api import api_router
 from app.core.config import settings
 from app.core.database import async_session_maker, close_db, init_db
+from app.core.email import close_email_client
+from app.core.email_batcher import start_email_batcher, stop_email_batcher
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.core.redis import close_redis, init_redis, redis_client
+from app.core.responses import ORJSONResponse
 from app.core.scheduler import start_scheduler, stop_scheduler
 from app.modules.school_applications.jobs import register_school_application_jobs
+from app.modules.school_applications.service import drain_pending_emails
 
 
 @asynccontextmanager
@@ -29,11 +34,14 @@ async def lifespan(_app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events including:
+    - Queue-based logging
     - Redis connection
     - Database connection
+    - Outbound email batching
     - Background job scheduler
     """
     # Startup
+    setup_logging()
     print(f"Starting EK-SMS API in {settings.python_env} mode...")
 
     # Initialize Redis (optional - app can run without it)
@@ -53,6 +61,9 @@ async def lifespan(_app: FastAPI):
         if settings.is_production:
             raise
 
+    # Start coalescing outbound emails into batch requests
+    start_email_batcher()
+
     # Initialize Background Job Scheduler
     try:
         # Register jobs before starting the scheduler
@@ -75,10 +86,17 @@ async def lifespan(_app: FastAPI):
     await stop_scheduler()
     print("[OK] Background scheduler stopped")
 
+    # Let background email sends from recent requests finish
+    await drain_pending_emails()
+    await stop_email_batcher()
+
     await close_redis()
     await close_db()
+    close_email_client()
     print("[OK] Cleanup complete")
 
+    shutdown_logging()
+
 
 app = FastAPI(
     title="EK-SMS API",
@@ -87,6 +105,8 @@ app = FastAPI(
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     lifespan=lifespan,
+    # orjson serializes UUID/datetime natively and is much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -1,5 +1,6 @@
 """Authentication router."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -47,7 +48,7 @@ async def login(
     user = await UserRepository.get_by_email(db, credentials.email)
 
     if not user:
-        logger.warning(f"Login attempt for non-existent email: {credentials.email}")
+        logger.warning("Login attempt for non-existent email: %s", credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -56,9 +57,9 @@ async def login(
             },
         )
 
-    # Verify password
-    if not verify_password(credentials.password, user.password_hash):
-        logger.warning(f"Invalid password for user: {credentials.email}")
+    # Verify password (Argon2 is CPU-bound; keep it off the event loop)
+    if not await asyncio.to_thread(verify_password, credentials.password, user.password_hash):
+        logger.warning("Invalid password for user: %s", credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -69,7 +70,7 @@ async def login(
 
     # Check if account is active
     if not user.is_active:
-        logger.warning(f"Login attempt for inactive account: {credentials.email}")
+        logger.warning("Login attempt for inactive account: %s", credentials.email)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -91,7 +92,7 @@ async def login(
     )
     refresh_token = create_refresh_token(subject=str(user.id))
 
-    logger.info(f"User logged in: {user.email} (role: {user.role.value})")
+    logger.info("User logged in: %s (role: %s)", user.email, user.role.value)
 
     return LoginResponse(
         access_token=access_token,
@@ -23,26 +23,31 @@ Security:
 """
 
 import logging
-from datetime import datetime
+import time
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import AdminUser, get_current_admin_user
 from app.core.database import get_db
 from app.core.rate_limit import RateLimitExceeded, check_rate_limit
+from app.core.redis import get_redis
+from app.core.responses import ORJSONResponse
 from app.modules.school_applications import service
 from app.modules.school_applications.models import ApplicationStatus
 from app.modules.school_applications.schemas import (
     AddNoteRequest,
     AddNoteResponse,
     ApplicationDetailResponse,
-    ApplicationListItem,
     ApplicationListResponse,
     ApproveResponse,
     DashboardStats,
     InternalNote,
+    OnlinePresenceItem,
     RejectRequest,
     RejectResponse,
     RequestInfoRequest,
@@ -97,16 +102,33 @@ async def _check_admin_rate_limit(
 
     if not allowed:
         logger.warning(
-            f"Rate limit exceeded for admin {admin.id} on action '{action}': "
-            f"{limit}/{window_seconds}s"
+            "Rate limit exceeded for admin %s on action '%s': %s/%ss",
+            admin.id,
+            action,
+            limit,
+            window_seconds,
         )
         raise RateLimitExceeded(limit, window_seconds)
 
 
+# ============================================
+# Dashboard Stats Cache
+# ============================================
+
+# Stats change on the order of minutes, so serve pre-serialized bytes
+# for a short window instead of re-running the aggregate queries per poll.
+STATS_CACHE_TTL_SECONDS = 15
+_stats_cache: tuple[float, bytes] | None = None  # (expires_at, body)
+
+
 # ============================================
 # Helper Functions
 # ============================================
 
+# Reusable validators for the JSON list columns (schema is built once)
+_ONLINE_PRESENCE_ADAPTER = TypeAdapter(list[OnlinePresenceItem])
+_INTERNAL_NOTES_ADAPTER = TypeAdapter(list[InternalNote])
+
 
 def _handle_service_error(e: ApplicationServiceError) -> None:
     """Convert service errors to HTTPExceptions."""
@@ -119,37 +141,18 @@ def _handle_service_error(e: ApplicationServiceError) -> None:
     )
 
 
-def _application_to_list_item(app) -> ApplicationListItem:
-    """Convert SchoolApplication model to ApplicationListItem schema."""
-    return ApplicationListItem(
-        id=app.id,
-        school_name=app.school_name,
-        school_type=app.school_type,
-        student_population=app.student_population,
-        country_code=app.country_code,
-        city=app.city,
-        status=app.status,
-        submitted_at=app.submitted_at,
-        applicant_verified_at=app.applicant_verified_at,
-        principal_confirmed_at=app.principal_confirmed_at,
-        reviewed_at=app.reviewed_at,
-        reviewed_by=app.reviewed_by,
-    )
-
-
 def _application_to_detail(app) -> ApplicationDetailResponse:
     """Convert SchoolApplication model to ApplicationDetailResponse schema."""
-    # Convert internal_notes from JSON to InternalNote schemas
-    internal_notes = None
-    if app.internal_notes:
-        internal_notes = [
-            InternalNote(
-                note=note["note"],
-                created_by=UUID(note["created_by"]),
-                created_at=datetime.fromisoformat(note["created_at"].replace("Z", "+00:00")),
-            )
-            for note in app.internal_notes
-        ]
+    # Convert JSON columns in one validation pass each. Pydantic parses the
+    # stored UUID and ISO-8601 timestamp strings (including a "Z" suffix).
+    internal_notes = (
+        _INTERNAL_NOTES_ADAPTER.validate_python(app.internal_notes) if app.internal_notes else None
+    )
+    online_presence = (
+        _ONLINE_PRESENCE_ADAPTER.validate_python(app.online_presence)
+        if app.online_presence
+        else None
+    )
 
     return ApplicationDetailResponse(
         id=app.id,
@@ -171,7 +174,7 @@ def _application_to_detail(app) -> ApplicationDetailResponse:
         applicant_phone=app.applicant_phone,
         applicant_role=app.applicant_role,
         admin_choice=app.admin_choice,
-        online_presence=app.online_presence,
+        online_presence=online_presence,
         reasons=app.reasons,
         other_reason=app.other_reason,
         status=app.status,
@@ -192,7 +195,7 @@ def _application_to_detail(app) -> ApplicationDetailResponse:
 
 @router.get(
     "",
-    response_model=ApplicationListResponse,
+    response_class=ORJSONResponse,
     summary="List Applications",
     description="""
 Get paginated list of school applications with optional filters.
@@ -207,7 +210,8 @@ Get paginated list of school applications with optional filters.
 - `sort_order`: Sort direction (asc, desc). Default: asc (oldest first for fairness)
 
 **Pagination:**
-- `skip`: Number of records to skip. Default: 0
+- `cursor`: `next_cursor` from the previous page. Each page costs the same at any depth
+- `skip`: Number of records to skip (deprecated, ignored with `cursor`). Default: 0
 - `limit`: Maximum records to return (1-100). Default: 20
 
 **Access:** Platform admin only
@@ -254,6 +258,7 @@ async def list_applications(
         0,
         ge=0,
         description="Records to skip",
+        deprecated=True,
     ),
     limit: int = Query(
         20,
@@ -261,13 +266,21 @@ async def list_applications(
         le=100,
         description="Maximum records to return",
     ),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description="next_cursor from the previous page",
+    ),
     db: AsyncSession = Depends(get_db),
     admin: AdminUser = Depends(get_current_admin_user),
-) -> ApplicationListResponse:
+) -> ORJSONResponse:
     """
     List applications with filters and pagination.
 
     Returns a paginated list of applications for the admin dashboard.
+    The response shape is documented as ApplicationListResponse but rows
+    are fetched as column mappings and serialized directly, skipping
+    per-row model construction and response_model validation.
     """
     try:
         result = await service.admin_get_applications_list(
@@ -279,27 +292,31 @@ async def list_applications(
             sort_order=sort_order,
             skip=skip,
             limit=limit,
+            cursor=cursor,
         )
 
         logger.info(
-            f"Admin {admin.id} listed applications: "
-            f"total={result['total']}, returned={len(result['applications'])}"
+            "Admin %s listed applications: total=%s, returned=%s",
+            admin.id,
+            result["total"],
+            len(result["applications"]),
         )
 
-        # Convert to schema objects
-        applications = [_application_to_list_item(app) for app in result["applications"]]
-
-        return ApplicationListResponse(
-            applications=applications,
-            total=result["total"],
-            skip=result["skip"],
-            limit=result["limit"],
+        return ORJSONResponse(
+            content={
+                # Column mappings go straight to orjson (UUID/datetime/enum are native)
+                "applications": [dict(row) for row in result["applications"]],
+                "total": result["total"],
+                "skip": result["skip"],
+                "limit": result["limit"],
+                "next_cursor": result["next_cursor"],
+            }
         )
 
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error listing applications: {e}")
+        logger.exception("Error listing applications: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -342,21 +359,28 @@ Get aggregated statistics for the admin dashboard.
 async def get_stats(
     db: AsyncSession = Depends(get_db),
     admin: AdminUser = Depends(get_current_admin_user),
-) -> DashboardStats:
+) -> Response:
     """
     Get aggregated statistics for the admin dashboard.
+
+    Results are cached as serialized JSON for STATS_CACHE_TTL_SECONDS.
     """
+    global _stats_cache
     try:
-        stats = await service.admin_get_dashboard_stats(db)
+        now = time.monotonic()
+        if _stats_cache is None or now >= _stats_cache[0]:
+            stats = await service.admin_get_dashboard_stats(db)
+            body = orjson.dumps(DashboardStats(**stats).model_dump(mode="json"))
+            _stats_cache = (now + STATS_CACHE_TTL_SECONDS, body)
 
-        logger.info(f"Admin {admin.id} fetched dashboard stats")
+        logger.info("Admin %s fetched dashboard stats", admin.id)
 
-        return DashboardStats(**stats)
+        return Response(content=_stats_cache[1], media_type="application/json")
 
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error getting dashboard stats: {e}")
+        logger.exception("Error getting dashboard stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -415,12 +439,12 @@ async def get_application_detail(
     try:
         application = await service.admin_get_application_detail(db, application_id)
 
-        logger.info(f"Admin {admin.id} viewed application {application_id}")
+        logger.info("Admin %s viewed application %s", admin.id, application_id)
 
         return _application_to_detail(application)
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -431,7 +455,7 @@ async def get_application_detail(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error getting application detail: {e}")
+        logger.exception("Error getting application detail: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -495,7 +519,7 @@ async def start_review(
     try:
         application = await service.admin_start_review(db, application_id, admin.id)
 
-        logger.info(f"Admin {admin.id} started review of application {application_id}")
+        logger.info("Admin %s started review of application %s", admin.id, application_id)
 
         return StartReviewResponse(
             id=application.id,
@@ -506,7 +530,7 @@ async def start_review(
         )
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -515,7 +539,7 @@ async def start_review(
             },
         ) from e
     except CannotReviewApplicationError as e:
-        logger.warning(f"Cannot review application {application_id}: {e.message}")
+        logger.warning("Cannot review application %s: %s", application_id, e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -526,7 +550,7 @@ async def start_review(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error starting review: {e}")
+        logger.exception("Error starting review: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -601,7 +625,7 @@ async def request_more_info(
             db, application_id, admin.id, data.message
         )
 
-        logger.info(f"Admin {admin.id} requested info for application {application_id}")
+        logger.info("Admin %s requested info for application %s", admin.id, application_id)
 
         return RequestInfoResponse(
             id=application.id,
@@ -610,7 +634,7 @@ async def request_more_info(
         )
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -619,7 +643,7 @@ async def request_more_info(
             },
         ) from e
     except CannotDecideApplicationError as e:
-        logger.warning(f"Cannot request info for application {application_id}: {e.message}")
+        logger.warning("Cannot request info for application %s: %s", application_id, e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -630,7 +654,7 @@ async def request_more_info(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error requesting more info: {e}")
+        logger.exception("Error requesting more info: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -695,14 +719,10 @@ async def add_note(
     try:
         note_dict = await service.admin_add_internal_note(db, application_id, admin.id, data.note)
 
-        logger.info(f"Admin {admin.id} added note to application {application_id}")
+        logger.info("Admin %s added note to application %s", admin.id, application_id)
 
         # Convert dict to InternalNote schema
-        note = InternalNote(
-            note=note_dict["note"],
-            created_by=UUID(note_dict["created_by"]),
-            created_at=datetime.fromisoformat(note_dict["created_at"].replace("Z", "+00:00")),
-        )
+        note = InternalNote.model_validate(note_dict)
 
         return AddNoteResponse(
             id=application_id,
@@ -711,7 +731,7 @@ async def add_note(
         )
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -722,7 +742,7 @@ async def add_note(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error adding note: {e}")
+        logger.exception("Error adding note: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -788,6 +808,7 @@ This is an atomic operation that:
 async def approve_application(
     application_id: UUID,
     db: AsyncSession = Depends(get_db),
+    redis: Redis | None = Depends(get_redis),
     admin: AdminUser = Depends(get_current_admin_user),
 ) -> ApproveResponse:
     """
@@ -797,11 +818,16 @@ async def approve_application(
     await _check_admin_rate_limit(admin, "approve", *RATE_LIMIT_APPROVE)
 
     try:
-        result = await service.admin_approve_application(db, application_id, admin.id)
+        result = await service.admin_approve_application(
+            db, application_id, admin.id, redis_client=redis
+        )
 
         logger.info(
-            f"Admin {admin.id} approved application {application_id}. "
-            f"School: {result['school_id']}, Admin: {result['admin_user_id']}"
+            "Admin %s approved application %s. School: %s, Admin: %s",
+            admin.id,
+            application_id,
+            result["school_id"],
+            result["admin_user_id"],
         )
 
         return ApproveResponse(
@@ -813,7 +839,7 @@ async def approve_application(
         )
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -822,7 +848,7 @@ async def approve_application(
             },
         ) from e
     except CannotDecideApplicationError as e:
-        logger.warning(f"Cannot approve application {application_id}: {e.message}")
+        logger.warning("Cannot approve application %s: %s", application_id, e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -831,7 +857,7 @@ async def approve_application(
             },
         ) from e
     except SchoolProvisioningError as e:
-        logger.error(f"School provisioning failed: {e.message}")
+        logger.error("School provisioning failed: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -842,7 +868,7 @@ async def approve_application(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error approving application: {e}")
+        logger.exception("Error approving application: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -906,6 +932,7 @@ async def reject_application(
     application_id: UUID,
     data: RejectRequest,
     db: AsyncSession = Depends(get_db),
+    redis: Redis | None = Depends(get_redis),
     admin: AdminUser = Depends(get_current_admin_user),
 ) -> RejectResponse:
     """
@@ -916,10 +943,10 @@ async def reject_application(
 
     try:
         application = await service.admin_reject_application(
-            db, application_id, admin.id, data.reason
+            db, application_id, admin.id, data.reason, redis_client=redis
         )
 
-        logger.info(f"Admin {admin.id} rejected application {application_id}")
+        logger.info("Admin %s rejected application %s", admin.id, application_id)
 
         return RejectResponse(
             id=application.id,
@@ -928,7 +955,7 @@ async def reject_application(
         )
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -937,7 +964,7 @@ async def reject_application(
             },
         ) from e
     except CannotDecideApplicationError as e:
-        logger.warning(f"Cannot reject application {application_id}: {e.message}")
+        logger.warning("Cannot reject application %s: %s", application_id, e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -948,7 +975,7 @@ async def reject_application(
     except ApplicationServiceError as e:
         _handle_service_error(e)
     except Exception as e:
-        logger.exception(f"Error rejecting application: {e}")
+        logger.exception("Error rejecting application: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -5,9 +5,73 @@ Common utility functions used across the school applications module.
 These helpers are extracted to avoid code duplication between service.py and jobs.py.
 """
 
+import base64
+import hashlib
+import os
+import secrets
+from collections import deque
+
 from app.modules.school_applications.models import SchoolApplication
 from app.modules.school_applications.schemas import SchoolApplicationCreate
 
+TOKEN_LENGTH = 32  # 256 bits of entropy
+TOKEN_POOL_BATCH = 256  # Tokens generated per refill
+
+# Pre-generated tokens, refilled from one CSPRNG read per batch
+_token_pool: deque[str] = deque()
+
+# A forked worker must never hand out tokens its parent (or siblings) also hold
+os.register_at_fork(after_in_child=_token_pool.clear)
+
+# Bound once so hash_token skips the module attribute lookup on every call
+_sha256 = hashlib.sha256
+
+
+def _refill_token_pool() -> None:
+    """Generate TOKEN_POOL_BATCH tokens from a single secrets.token_bytes call."""
+    raw = secrets.token_bytes(TOKEN_LENGTH * TOKEN_POOL_BATCH)
+    _token_pool.extend(
+        base64.urlsafe_b64encode(raw[i : i + TOKEN_LENGTH]).rstrip(b"=").decode("ascii")
+        for i in range(0, len(raw), TOKEN_LENGTH)
+    )
+
+
+def generate_secure_token() -> str:
+    """
+    Generate a cryptographically secure token for email verification.
+
+    Each token is TOKEN_LENGTH bytes from secrets.token_bytes encoded as
+    unpadded URL-safe base64 (the same output as secrets.token_urlsafe),
+    giving sufficient entropy for security-critical operations. Tokens are
+    drawn from a pool filled in batches, so the CSPRNG read is amortized
+    across TOKEN_POOL_BATCH calls; each token is handed out once.
+
+    Returns:
+        A secure random token string (43 characters for 32 bytes of entropy)
+    """
+    try:
+        return _token_pool.popleft()
+    except IndexError:
+        _refill_token_pool()
+        return _token_pool.popleft()
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Hash a token for secure storage using SHA-256.
+
+    Tokens are hashed before storage so that even if the database is
+    compromised, the plain tokens cannot be recovered and used. The raw
+    32-byte digest is stored (and indexed) rather than its hex encoding.
+
+    Args:
+        token: The plain text token to hash
+
+    Returns:
+        SHA-256 digest of the token (32 bytes)
+    """
+    return _sha256(token.encode()).digest()
+
 
 def get_effective_applicant_email_from_model(application: SchoolApplication) -> str:
     """
@@ -79,3 +143,21 @@ def get_effective_applicant_name_from_schema(data: SchoolApplicationCreate) -> s
     if data.applicant.is_principal:
         return data.contact.principal_name
     return data.applicant.name  # type: ignore - validated in schema
+
+
+def get_effective_applicant_from_schema(data: SchoolApplicationCreate) -> tuple[str, str]:
+    """
+    Get the effective applicant email and name from a create schema.
+
+    Same result as the separate email/name helpers, but resolves the
+    is_principal branch once.
+
+    Args:
+        data: The application create request data
+
+    Returns:
+        Tuple of (email, name) to use for the applicant
+    """
+    if data.applicant.is_principal:
+        return data.contact.principal_email, data.contact.principal_name
+    return data.applicant.email, data.applicant.name  # type: ignore - validated in schema
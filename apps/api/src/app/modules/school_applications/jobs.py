@@ -27,17 +27,21 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import async_session_maker
 from app.core.email import (
     send_application_expired,
     send_verification_reminder,
 )
+from app.core.redis import get_redis
 from app.core.scheduler import register_job
 from app.modules.school_applications import repository
 from app.modules.school_applications.helpers import (
+    generate_secure_token,
     get_effective_applicant_email_from_model,
     get_effective_applicant_name_from_model,
+    hash_token,
 )
 from app.modules.school_applications.models import (
     ApplicationStatus,
@@ -45,6 +49,7 @@ from app.modules.school_applications.models import (
     TokenType,
     VerificationToken,
 )
+from app.modules.school_applications.service import forget_duplicate_rejections
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +63,51 @@ JOB_ID_SEND_REMINDERS = "school_applications_send_reminders"
 JOB_ID_EXPIRE_APPLICATIONS = "school_applications_expire_applications"
 
 
+async def _send_reminder_with_reissued_token(
+    db: AsyncSession,
+    token: VerificationToken,
+    *,
+    to_email: str,
+    recipient_name: str,
+    school_name: str,
+) -> bool:
+    """
+    Re-issue a verification token and email it in a reminder.
+
+    Only the SHA-256 digest of a token is stored, so the original plain token
+    cannot be recovered. A fresh plain token replaces it (same expiry) and is
+    persisted when the reminder is marked as sent. If the email fails, the
+    replacement is rolled back so the link from the original email keeps
+    working.
+
+    Args:
+        db: Database session
+        token: The token to re-issue
+        to_email: Reminder recipient
+        recipient_name: Name used in the greeting
+        school_name: School the application is for
+
+    Returns:
+        True if the reminder was sent
+    """
+    plain_token = generate_secure_token()
+    await repository.replace_token_hash(db, token.id, hash_token(plain_token))
+
+    email_sent = await send_verification_reminder(
+        to_email=to_email,
+        applicant_name=recipient_name,
+        school_name=school_name,
+        token=plain_token,
+        hours_remaining=HOURS_REMAINING_AT_REMINDER,
+    )
+
+    if not email_sent:
+        # Nothing was delivered; keep the previously emailed token valid
+        await db.rollback()
+
+    return email_sent
+
+
 async def _process_applicant_verification_reminder(
     application: SchoolApplication,
 ) -> dict[str, Any]:
@@ -80,8 +130,9 @@ async def _process_applicant_verification_reminder(
 
         if not token:
             logger.warning(
-                f"No valid token found for application {application.id}, "
-                "skipping reminder (token may have expired)"
+                "No valid token found for application %s, "
+                "skipping reminder (token may have expired)",
+                application.id,
             )
             return {
                 "application_id": str(application.id),
@@ -93,24 +144,24 @@ async def _process_applicant_verification_reminder(
         applicant_email = get_effective_applicant_email_from_model(application)
         applicant_name = get_effective_applicant_name_from_model(application)
 
-        # Send reminder email
-        email_sent = await send_verification_reminder(
+        # Send reminder email with a re-issued token (the reminder needs a usable link)
+        email_sent = await _send_reminder_with_reissued_token(
+            db,
+            token,
             to_email=applicant_email,
-            applicant_name=applicant_name,
+            recipient_name=applicant_name,
             school_name=application.school_name,
-            token=token.token,
-            hours_remaining=HOURS_REMAINING_AT_REMINDER,
         )
 
         if not email_sent:
-            logger.error(f"Failed to send reminder email for application {application.id}")
-            # Still mark as sent to prevent retry loops - the token is still valid
-            # and they can use it if they find the original email
+            logger.error("Failed to send reminder email for application %s", application.id)
+            # Still mark as sent to prevent retry loops - the token re-issue was
+            # rolled back, so the link in the original email still works
 
         # Mark reminder as sent (idempotency)
         await repository.mark_reminder_sent(db, application.id)
 
-        logger.info(f"Processed applicant verification reminder for application {application.id}")
+        logger.info("Processed applicant verification reminder for application %s", application.id)
 
         return {
             "application_id": str(application.id),
@@ -141,8 +192,8 @@ async def _process_principal_confirmation_reminder(
 
         if not token:
             logger.warning(
-                f"No valid principal token found for application {application.id}, "
-                "skipping reminder"
+                "No valid principal token found for application %s, skipping reminder",
+                application.id,
             )
             return {
                 "application_id": str(application.id),
@@ -150,24 +201,24 @@ async def _process_principal_confirmation_reminder(
                 "reason": "no_valid_token",
             }
 
-        # Send reminder email to principal
-        email_sent = await send_verification_reminder(
+        # Send reminder email to principal with a re-issued token
+        email_sent = await _send_reminder_with_reissued_token(
+            db,
+            token,
             to_email=application.principal_email,
-            applicant_name=application.principal_name,
+            recipient_name=application.principal_name,
             school_name=application.school_name,
-            token=token.token,
-            hours_remaining=HOURS_REMAINING_AT_REMINDER,
         )
 
         if not email_sent:
             logger.error(
-                f"Failed to send principal reminder email for application {application.id}"
+                "Failed to send principal reminder email for application %s", application.id
             )
 
         # Mark reminder as sent
         await repository.mark_reminder_sent(db, application.id)
 
-        logger.info(f"Processed principal confirmation reminder for application {application.id}")
+        logger.info("Processed principal confirmation reminder for application %s", application.id)
 
         return {
             "application_id": str(application.id),
@@ -194,24 +245,24 @@ async def _process_principal_confirmation_reminder_with_token(
         Dict with processing result
     """
     async with async_session_maker() as db:
-        # Send reminder email to principal
-        email_sent = await send_verification_reminder(
+        # Send reminder email to principal with a re-issued token
+        email_sent = await _send_reminder_with_reissued_token(
+            db,
+            token,
             to_email=application.principal_email,
-            applicant_name=application.principal_name,
+            recipient_name=application.principal_name,
             school_name=application.school_name,
-            token=token.token,
-            hours_remaining=HOURS_REMAINING_AT_REMINDER,
         )
 
         if not email_sent:
             logger.error(
-                f"Failed to send principal reminder email for application {application.id}"
+                "Failed to send principal reminder email for application %s", application.id
             )
 
         # Mark reminder as sent
         await repository.mark_reminder_sent(db, application.id)
 
-        logger.info(f"Processed principal confirmation reminder for application {application.id}")
+        logger.info("Processed principal confirmation reminder for application %s", application.id)
 
         return {
             "application_id": str(application.id),
@@ -245,8 +296,8 @@ async def send_verification_reminders() -> dict[str, Any]:
     reminder_threshold = executed_at - timedelta(hours=REMINDER_THRESHOLD_HOURS)
 
     logger.info(
-        f"Starting verification reminder job. "
-        f"Looking for applications submitted before {reminder_threshold.isoformat()}"
+        "Starting verification reminder job. Looking for applications submitted before %s",
+        reminder_threshold.isoformat(),
     )
 
     results = {
@@ -266,7 +317,7 @@ async def send_verification_reminders() -> dict[str, Any]:
         )
 
     logger.info(
-        f"Found {len(applicant_applications)} applications needing applicant verification reminder"
+        "Found %s applications needing applicant verification reminder", len(applicant_applications)
     )
 
     for application in applicant_applications:
@@ -276,7 +327,9 @@ async def send_verification_reminders() -> dict[str, Any]:
             results["total_processed"] += 1
         except Exception as e:
             logger.error(
-                f"Error processing applicant reminder for application {application.id}: {e}",
+                "Error processing applicant reminder for application %s: %s",
+                application.id,
+                e,
                 exc_info=True,
             )
             results["applicant_reminders"].append(
@@ -298,7 +351,7 @@ async def send_verification_reminders() -> dict[str, Any]:
         )
 
     logger.info(
-        f"Found {len(principal_tokens)} applications needing principal confirmation reminder"
+        "Found %s applications needing principal confirmation reminder", len(principal_tokens)
     )
 
     for application, token in principal_tokens:
@@ -308,7 +361,9 @@ async def send_verification_reminders() -> dict[str, Any]:
             results["total_processed"] += 1
         except Exception as e:
             logger.error(
-                f"Error processing principal reminder for application {application.id}: {e}",
+                "Error processing principal reminder for application %s: %s",
+                application.id,
+                e,
                 exc_info=True,
             )
             results["principal_reminders"].append(
@@ -321,8 +376,9 @@ async def send_verification_reminders() -> dict[str, Any]:
             results["total_errors"] += 1
 
     logger.info(
-        f"Verification reminder job completed. "
-        f"Processed: {results['total_processed']}, Errors: {results['total_errors']}"
+        "Verification reminder job completed. Processed: %s, Errors: %s",
+        results["total_processed"],
+        results["total_errors"],
     )
 
     return results
@@ -343,6 +399,7 @@ async def _process_application_expiry(
     async with async_session_maker() as db:
         # Mark application as expired
         await repository.mark_application_expired(db, application.id)
+        await forget_duplicate_rejections(await get_redis(), application)
 
         # Get applicant details for notification
         applicant_email = get_effective_applicant_email_from_model(application)
@@ -356,9 +413,11 @@ async def _process_application_expiry(
         )
 
         if not email_sent:
-            logger.error(f"Failed to send expiration email for application {application.id}")
+            logger.error("Failed to send expiration email for application %s", application.id)
 
-        logger.info(f"Expired application {application.id} for school '{application.school_name}'")
+        logger.info(
+            "Expired application %s for school '%s'", application.id, application.school_name
+        )
 
         return {
             "application_id": str(application.id),
@@ -394,7 +453,7 @@ async def expire_unverified_applications() -> dict[str, Any]:
     executed_at = datetime.now(UTC)
     expiry_threshold = executed_at - timedelta(hours=EXPIRY_THRESHOLD_HOURS)
 
-    logger.info(f"Starting application expiry job. Threshold: {expiry_threshold.isoformat()}")
+    logger.info("Starting application expiry job. Threshold: %s", expiry_threshold.isoformat())
 
     results = {
         "executed_at": executed_at.isoformat(),
@@ -411,7 +470,7 @@ async def expire_unverified_applications() -> dict[str, Any]:
             before_datetime=expiry_threshold,
         )
 
-    logger.info(f"Found {len(applicant_applications)} applicant verifications to expire")
+    logger.info("Found %s applicant verifications to expire", len(applicant_applications))
 
     for application in applicant_applications:
         try:
@@ -419,10 +478,7 @@ async def expire_unverified_applications() -> dict[str, Any]:
             results["applicant_expired"].append(result)
             results["total_expired"] += 1
         except Exception as e:
-            logger.error(
-                f"Error expiring application {application.id}: {e}",
-                exc_info=True,
-            )
+            logger.error("Error expiring application %s: %s", application.id, e, exc_info=True)
             results["applicant_expired"].append(
                 {
                     "application_id": str(application.id),
@@ -440,7 +496,7 @@ async def expire_unverified_applications() -> dict[str, Any]:
             created_before=expiry_threshold,
         )
 
-    logger.info(f"Found {len(principal_tokens)} principal confirmations to expire")
+    logger.info("Found %s principal confirmations to expire", len(principal_tokens))
 
     for application, _token in principal_tokens:
         try:
@@ -448,10 +504,7 @@ async def expire_unverified_applications() -> dict[str, Any]:
             results["principal_expired"].append(result)
             results["total_expired"] += 1
         except Exception as e:
-            logger.error(
-                f"Error expiring application {application.id}: {e}",
-                exc_info=True,
-            )
+            logger.error("Error expiring application %s: %s", application.id, e, exc_info=True)
             results["principal_expired"].append(
                 {
                     "application_id": str(application.id),
@@ -462,8 +515,9 @@ async def expire_unverified_applications() -> dict[str, Any]:
             results["total_errors"] += 1
 
     logger.info(
-        f"Application expiry job completed. "
-        f"Expired: {results['total_expired']}, Errors: {results['total_errors']}"
+        "Application expiry job completed. Expired: %s, Errors: %s",
+        results["total_expired"],
+        results["total_errors"],
     )
 
     return results
@@ -493,7 +547,7 @@ def register_school_application_jobs() -> None:
         func=send_verification_reminders,
         trigger=IntervalTrigger(hours=1),
     )
-    logger.info(f"Registered job: {JOB_ID_SEND_REMINDERS} (interval: 1 hour)")
+    logger.info("Registered job: %s (interval: 1 hour)", JOB_ID_SEND_REMINDERS)
 
     # Register expiry job - runs every hour
     register_job(
@@ -501,6 +555,6 @@ def register_school_application_jobs() -> None:
         func=expire_unverified_applications,
         trigger=IntervalTrigger(hours=1),
     )
-    logger.info(f"Registered job: {JOB_ID_EXPIRE_APPLICATIONS} (interval: 1 hour)")
+    logger.info("Registered job: %s (interval: 1 hour)", JOB_ID_EXPIRE_APPLICATIONS)
 
     logger.info("School application background jobs registered successfully")
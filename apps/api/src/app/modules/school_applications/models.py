@@ -16,9 +16,11 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -58,6 +60,11 @@ class ApplicationStatus(str, enum.Enum):
     EXPIRED = "expired"
 
 
+# Pending applications (anything not yet decided or expired), the rows the
+# duplicate indexes cover; find_duplicate filters on the same condition
+_PENDING_STATUS_PREDICATE = "status NOT IN ('APPROVED', 'REJECTED', 'EXPIRED')"
+
+
 class AdminChoice(str, enum.Enum):
     """Who will be the school admin."""
 
@@ -189,6 +196,27 @@ class SchoolApplication(Base):
             "school_name",
             "city",
         ),
+        # Duplicate rules enforced by the database (create_with_token relies on
+        # these for ON CONFLICT, and find_duplicate probes them by rule): one
+        # pending application per school name + city, and per effective
+        # applicant email + school name, case-insensitively
+        Index(
+            "ix_school_applications_unique_pending",
+            text("lower(school_name)"),
+            text("lower(city)"),
+            unique=True,
+            postgresql_where=text(_PENDING_STATUS_PREDICATE),
+        ),
+        Index(
+            "ix_school_applications_unique_pending_applicant",
+            text(
+                "lower(CASE WHEN applicant_is_principal THEN principal_email "
+                "ELSE COALESCE(applicant_email, principal_email) END)"
+            ),
+            text("lower(school_name)"),
+            unique=True,
+            postgresql_where=text(_PENDING_STATUS_PREDICATE),
+        ),
     )
 
 
@@ -211,8 +239,8 @@ class VerificationToken(Base):
         nullable=False,
     )
 
-    # Token details
-    token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # Token details (SHA-256 digest of the plain token; the plain token is never stored)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
     token_type: Mapped[TokenType] = mapped_column(
         Enum(TokenType, name="token_type"), nullable=False
     )
@@ -231,5 +259,8 @@ class VerificationToken(Base):
         "SchoolApplication", back_populates="verification_tokens"
     )
 
-    # Indexes
-    __table_args__ = (Index("ix_verification_tokens_token", "token"),)
+    __table_args__ = (
+        # Per-application token lookups (resend, reminders) and revocation
+        # (created by migration a1b2c3d4e5f6)
+        Index("ix_verification_tokens_app_type", "application_id", "token_type"),
+    )
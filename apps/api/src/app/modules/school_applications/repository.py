@@ -12,107 +12,241 @@ Design Principles:
 - Timezone-aware datetime handling (UTC)
 """
 
+from collections.abc import Collection
 from datetime import UTC, datetime, timedelta
-from uuid import UUID
-
-from sqlalchemy import and_, delete, or_, select
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Row,
+    RowMapping,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Bundle, aliased
+
+from app.modules.school_applications.models import (
+    _PENDING_STATUS_PREDICATE,
+    ApplicationStatus,
+    SchoolApplication,
+    TokenType,
+    VerificationToken,
+)
+from app.modules.school_applications.schemas import SchoolApplicationCreate
+
+# Statuses that expire if verification isn't completed in time
+_EXPIRABLE_STATUSES: frozenset[ApplicationStatus] = frozenset(
+    {
+        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
+        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
+    }
+)
 
-from .models import ApplicationStatus, SchoolApplication, TokenType, VerificationToken
-from .schemas import SchoolApplicationCreate
-
-
-async def create(db: AsyncSession, data: SchoolApplicationCreate) -> SchoolApplication:
-    """Create a new school application."""
 
-    new_application = SchoolApplication(
+def _application_values(data: SchoolApplicationCreate) -> dict:
+    """Map a create request onto school_applications column values."""
+    return {
         # School info
-        school_name=data.school.name,
-        year_established=data.school.year_established,
-        school_type=data.school.school_type,
-        student_population=data.school.student_population,
+        "school_name": data.school.name,
+        "year_established": data.school.year_established,
+        "school_type": data.school.school_type,
+        "student_population": data.school.student_population,
         # Location
-        country_code=data.location.country_code,
-        city=data.location.city,
-        address=data.location.address,
+        "country_code": data.location.country_code,
+        "city": data.location.city,
+        "address": data.location.address,
         # Contact
-        school_phone=data.contact.school_phone,
-        school_email=data.contact.school_email,
-        principal_name=data.contact.principal_name,
-        principal_email=data.contact.principal_email,
-        principal_phone=data.contact.principal_phone,
+        "school_phone": data.contact.school_phone,
+        "school_email": data.contact.school_email,
+        "principal_name": data.contact.principal_name,
+        "principal_email": data.contact.principal_email,
+        "principal_phone": data.contact.principal_phone,
         # Applicant
-        applicant_is_principal=data.applicant.is_principal,
-        applicant_name=data.applicant.name,
-        applicant_email=data.applicant.email,
-        applicant_phone=data.applicant.phone,
-        applicant_role=data.applicant.role,
-        admin_choice=data.applicant.admin_choice,
+        "applicant_is_principal": data.applicant.is_principal,
+        "applicant_name": data.applicant.name,
+        "applicant_email": data.applicant.email,
+        "applicant_phone": data.applicant.phone,
+        "applicant_role": data.applicant.role,
+        "admin_choice": data.applicant.admin_choice,
         # Details
-        online_presence=(
+        "online_presence": (
             [item.model_dump() for item in data.details.online_presence]
             if data.details.online_presence
             else None
         ),
-        reasons=data.details.reasons,
-        other_reason=data.details.other_reason,
-    )
+        "reasons": data.details.reasons,
+        "other_reason": data.details.other_reason,
+    }
+
+
+async def create(db: AsyncSession, data: SchoolApplicationCreate) -> SchoolApplication:
+    """
+    Create a new school application.
 
-    db.add(new_application)
+    The row comes back through RETURNING, so server-generated columns are
+    populated without a refresh SELECT after the commit.
+    """
+    stmt = (
+        pg_insert(SchoolApplication)
+        .values(**_application_values(data))
+        .returning(SchoolApplication)
+    )
+    new_application = (await db.scalars(stmt)).one()
     await db.commit()
-    await db.refresh(new_application)
 
     return new_application
 
 
+async def create_with_token(
+    db: AsyncSession,
+    data: SchoolApplicationCreate,
+    token_hash: bytes,
+    token_type: TokenType,
+    expires_at: datetime,
+) -> SchoolApplication | None:
+    """
+    Create a new school application and its first verification token.
+
+    Both INSERTs are chained through data-modifying CTEs so they reach the
+    database in a single round trip. The application insert relies on the
+    partial unique indexes over pending applications (applicant email +
+    school name, and school name + city): a pending duplicate makes it a
+    no-op, in which case no token is written either.
+
+    Returns:
+        The created application, or None if a pending duplicate exists
+    """
+    applications = SchoolApplication.__table__
+    tokens = VerificationToken.__table__
+
+    new_application = (
+        pg_insert(SchoolApplication)
+        .values(
+            id=uuid4(),
+            status=ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
+            **_application_values(data),
+        )
+        .on_conflict_do_nothing()
+        .returning(*applications.c)
+        .cte("new_application")
+    )
+    new_token = (
+        insert(VerificationToken)
+        .from_select(
+            ["id", "application_id", "token_hash", "token_type", "expires_at"],
+            select(
+                literal(uuid4(), tokens.c.id.type),
+                new_application.c.id,
+                literal(token_hash, tokens.c.token_hash.type),
+                literal(token_type, tokens.c.token_type.type),
+                literal(expires_at, tokens.c.expires_at.type),
+            ),
+        )
+        .cte("new_token")
+    )
+
+    stmt = select(aliased(SchoolApplication, new_application)).add_cte(new_token)
+    created = (await db.scalars(stmt)).one_or_none()
+
+    if created is not None:
+        await db.commit()
+
+    return created
+
+
 async def get_by_id(db: AsyncSession, id: UUID) -> SchoolApplication | None:
     """Get application by ID."""
     return await db.get(SchoolApplication, id)
 
 
-async def get_by_applicant_email(db: AsyncSession, email: str) -> list[SchoolApplication]:
+async def get_status(db: AsyncSession, id: UUID) -> ApplicationStatus | None:
+    """Get just the status of an application, or None if it doesn't exist."""
+    return await db.scalar(select(SchoolApplication.status).where(SchoolApplication.id == id))
+
+
+# Columns needed to check a token's application and render the principal view
+APPLICATION_VIEW_COLUMNS = (
+    SchoolApplication.id,
+    SchoolApplication.status,
+    SchoolApplication.school_name,
+    SchoolApplication.applicant_is_principal,
+    SchoolApplication.applicant_name,
+    SchoolApplication.principal_name,
+    SchoolApplication.admin_choice,
+)
+
+
+async def get_token_with_application_view(
+    db: AsyncSession, token_hash: bytes
+) -> tuple[VerificationToken, Row] | None:
     """
-    Get all applications by the effective applicant email.
+    Get a verification token and a view of its application in one query.
 
-    This checks both:
-    - applicant_email field (when applicant is NOT the principal)
-    - principal_email field (when applicant IS the principal)
+    The token is joined to its application (the foreign key guarantees one
+    exists). Only APPLICATION_VIEW_COLUMNS are selected for the application
+    and no ORM entity is hydrated; the returned row exposes the columns as
+    attributes, so it can be read like the mapped object.
 
-    This ensures duplicate detection works correctly regardless of who submitted.
+    Returns:
+        Tuple of (VerificationToken, application view row), or None if no
+        token has this hash
     """
     result = await db.execute(
-        select(SchoolApplication).where(
-            or_(
-                # Case 1: Applicant is not principal, check applicant_email
-                SchoolApplication.applicant_email == email,
-                # Case 2: Applicant is principal, check principal_email
-                (SchoolApplication.applicant_is_principal == True)  # noqa: E712
-                & (SchoolApplication.principal_email == email),
-            )
-        )
+        select(VerificationToken, Bundle("application", *APPLICATION_VIEW_COLUMNS))
+        .join(SchoolApplication, SchoolApplication.id == VerificationToken.application_id)
+        .where(VerificationToken.token_hash == token_hash)
     )
-    return list(result.scalars().all())
+    row = result.one_or_none()
+    return None if row is None else (row[0], row[1])
 
 
-async def get_pending_by_school_and_city(
-    db: AsyncSession, name: str, city: str
-) -> SchoolApplication | None:
-    """Get pending application for a school name + city combination."""
-    pending_statuses = [
-        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
-        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
-        ApplicationStatus.PENDING_REVIEW,
-        ApplicationStatus.UNDER_REVIEW,
-        ApplicationStatus.MORE_INFO_REQUESTED,
-    ]
+# Which rule find_duplicate matched
+DUPLICATE_BY_APPLICANT = "applicant"
+DUPLICATE_BY_SCHOOL_CITY = "school_city"
 
-    result = await db.execute(
-        select(SchoolApplication).where(
-            SchoolApplication.school_name == name,
-            SchoolApplication.city == city,
-            SchoolApplication.status.in_(pending_statuses),
-        )
+
+async def find_duplicate(
+    db: AsyncSession, applicant_email: str, school_name: str, city: str
+) -> str | None:
+    """
+    Find which duplicate rule a new submission conflicts on.
+
+    Probes each duplicate rule (effective applicant email + school, then
+    school + city) with the same lower() expressions and pending predicate
+    as its unique index, so each probe is a single index lookup. Both run in
+    one round trip; the applicant probe comes first and wins when both
+    match, and the second is skipped once a row is found.
+
+    Returns:
+        DUPLICATE_BY_APPLICANT or DUPLICATE_BY_SCHOOL_CITY, or None if there
+        is no conflict
+    """
+    effective_email = case(
+        (SchoolApplication.applicant_is_principal, SchoolApplication.principal_email),
+        else_=func.coalesce(SchoolApplication.applicant_email, SchoolApplication.principal_email),
+    )
+    # Inlined (not bound) so the planner can match the partial indexes
+    pending = text(_PENDING_STATUS_PREDICATE)
+    same_school = func.lower(SchoolApplication.school_name) == func.lower(school_name)
+
+    by_applicant = select(literal(DUPLICATE_BY_APPLICANT).label("rule")).where(
+        func.lower(effective_email) == func.lower(applicant_email), same_school, pending
+    )
+    by_school_city = select(literal(DUPLICATE_BY_SCHOOL_CITY).label("rule")).where(
+        same_school, func.lower(SchoolApplication.city) == func.lower(city), pending
     )
+
+    result = await db.execute(union_all(by_applicant, by_school_city).limit(1))
     return result.scalar_one_or_none()
 
 
@@ -218,6 +352,172 @@ async def update_status(
     return application
 
 
+async def conditional_update_status(
+    db: AsyncSession,
+    id: UUID,
+    allowed_statuses: Collection[ApplicationStatus],
+    status: ApplicationStatus,
+    **fields,
+) -> SchoolApplication | None:
+    """
+    Move an application to a new status only if it is in one of allowed_statuses.
+
+    The status check and the update happen in a single
+    UPDATE ... WHERE status IN (...) RETURNING statement, so there is no
+    separate read and no window for a concurrent change in between. Only
+    allowed statuses the state machine permits moving to status from are
+    matched.
+
+    Args:
+        db: Database session
+        id: Application UUID
+        allowed_statuses: Statuses the application may currently be in
+        status: New status to set
+        **fields: Additional fields to update (e.g., reviewed_by)
+
+    Returns:
+        The updated SchoolApplication, or None if the application doesn't
+        exist or isn't in an allowed status (see get_status)
+    """
+    from_statuses = [
+        current
+        for current in allowed_statuses
+        if current == status or status in VALID_STATUS_TRANSITIONS.get(current, set())
+    ]
+
+    stmt = (
+        update(SchoolApplication)
+        .where(SchoolApplication.id == id, SchoolApplication.status.in_(from_statuses))
+        .values(status=status, **fields)
+        .returning(SchoolApplication)
+        .execution_options(synchronize_session=False)
+    )
+    application = (await db.scalars(stmt)).one_or_none()
+
+    if application is not None:
+        await db.commit()
+
+    return application
+
+
+async def consume_token_and_advance(
+    db: AsyncSession,
+    token_hash: bytes,
+    token_type: TokenType,
+    expected_status: ApplicationStatus,
+    new_status: ApplicationStatus,
+    principal_overrides: dict | None = None,
+    now: datetime | None = None,
+    next_token: tuple[bytes, TokenType, datetime] | None = None,
+    **fields,
+) -> SchoolApplication | None:
+    """
+    Consume a verification token and advance its application in one statement.
+
+    The token UPDATE (marking it used) runs as a CTE feeding the application
+    UPDATE, so validation, token consumption and the status change happen
+    atomically in a single round trip. The token is only consumed if it is
+    unused, unexpired, of the expected type, and its application is in
+    expected_status. If next_token is given, the follow-up token is inserted
+    by the same statement.
+
+    Args:
+        db: Database session
+        token_hash: SHA-256 digest of the plain token
+        token_type: Expected token type
+        expected_status: Status the application must currently be in
+        new_status: Status to move the application to
+        principal_overrides: Field values (including "status") to use instead
+            when the applicant is the principal
+        now: Timestamp used for the expiry check and used_at
+        next_token: Optional (token_hash, token_type, expires_at) of a token to
+            create for the next step; skipped when the applicant is the principal
+        **fields: Additional fields to update (e.g., applicant_verified_at)
+
+    Returns:
+        The updated SchoolApplication, or None if the token could not be consumed
+
+    Raises:
+        InvalidStatusTransitionError: If a requested status transition is not allowed
+    """
+    now = now or datetime.now(UTC)
+    values = {"status": new_status, **fields}
+    overrides = principal_overrides or {}
+
+    # Validate status transitions against the state machine up front
+    valid_transitions = VALID_STATUS_TRANSITIONS.get(expected_status, set())
+    for status in (new_status, overrides.get("status", new_status)):
+        if status not in valid_transitions:
+            raise InvalidStatusTransitionError(expected_status, status)
+
+    applications = SchoolApplication.__table__
+    for key, principal_value in overrides.items():
+        column = applications.c[key]
+        otherwise = literal(values[key], column.type) if key in values else column
+        values[key] = case(
+            (SchoolApplication.applicant_is_principal, literal(principal_value, column.type)),
+            else_=otherwise,
+        )
+
+    consumed_token = (
+        update(VerificationToken)
+        .where(
+            VerificationToken.token_hash == token_hash,
+            VerificationToken.token_type == token_type,
+            VerificationToken.used_at.is_(None),
+            VerificationToken.expires_at > now,
+            select(SchoolApplication.id)
+            .where(
+                SchoolApplication.id == VerificationToken.application_id,
+                SchoolApplication.status == expected_status,
+            )
+            .exists(),
+        )
+        .values(used_at=now)
+        .returning(VerificationToken.application_id)
+        .cte("consumed_token")
+    )
+
+    stmt = (
+        update(SchoolApplication)
+        .where(
+            SchoolApplication.id == consumed_token.c.application_id,
+            SchoolApplication.status == expected_status,
+        )
+        .values(**values)
+        .returning(SchoolApplication)
+        .execution_options(synchronize_session=False)
+    )
+
+    if next_token is not None:
+        tokens = VerificationToken.__table__
+        next_token_hash, next_token_type, next_expires_at = next_token
+        new_token = (
+            insert(VerificationToken)
+            .from_select(
+                ["id", "application_id", "token_hash", "token_type", "expires_at"],
+                select(
+                    literal(uuid4(), tokens.c.id.type),
+                    consumed_token.c.application_id,
+                    literal(next_token_hash, tokens.c.token_hash.type),
+                    literal(next_token_type, tokens.c.token_type.type),
+                    literal(next_expires_at, tokens.c.expires_at.type),
+                )
+                .join(applications, applications.c.id == consumed_token.c.application_id)
+                .where(applications.c.applicant_is_principal.is_(False)),
+            )
+            .cte("next_token")
+        )
+        stmt = stmt.add_cte(new_token)
+
+    application = (await db.scalars(stmt)).one_or_none()
+
+    if application is not None:
+        await db.commit()
+
+    return application
+
+
 async def get_expired_unverified(
     db: AsyncSession, before_datetime: datetime
 ) -> list[SchoolApplication]:
@@ -239,15 +539,15 @@ async def get_expired_unverified(
 async def create_token(
     db: AsyncSession,
     application_id: UUID,
-    token: str,
+    token_hash: bytes,
     token_type: TokenType,
     expires_at: datetime,
 ) -> VerificationToken:
-    """Create a new verification token."""
+    """Create a new verification token from the SHA-256 digest of the plain token."""
 
     new_token = VerificationToken(
         application_id=application_id,
-        token=token,
+        token_hash=token_hash,
         token_type=token_type,
         expires_at=expires_at,
     )
@@ -259,42 +559,64 @@ async def create_token(
     return new_token
 
 
-async def get_by_token(db: AsyncSession, token: str) -> VerificationToken | None:
-    """Get verification token by token string."""
+async def get_by_token(db: AsyncSession, token_hash: bytes) -> VerificationToken | None:
+    """Get verification token by the SHA-256 digest of the plain token."""
 
-    result = await db.execute(select(VerificationToken).where(VerificationToken.token == token))
+    result = await db.execute(
+        select(VerificationToken).where(VerificationToken.token_hash == token_hash)
+    )
     return result.scalar_one_or_none()
 
 
-async def mark_token_used(db: AsyncSession, token: str) -> VerificationToken:
-    """Mark a token as used."""
-
-    verification_token = await get_by_token(db, token)
-
-    if not verification_token:
-        raise ValueError("Token not found")
-
-    verification_token.used_at = datetime.now(UTC)
-
-    await db.commit()
-    await db.refresh(verification_token)
+async def replace_token_hash(db: AsyncSession, token_id: UUID, token_hash: bytes) -> None:
+    """
+    Replace the stored digest of an existing token.
 
-    return verification_token
+    Used to re-issue a token (e.g. for a reminder email) without changing its
+    expiry. The previously issued plain token stops working.
+    """
+    await db.execute(
+        update(VerificationToken)
+        .where(VerificationToken.id == token_id)
+        .values(token_hash=token_hash)
+    )
 
 
-async def delete_tokens_for_application(
+async def replace_tokens(
     db: AsyncSession,
     application_id: UUID,
-    token_type: TokenType | None = None,
+    token_hash: bytes,
+    token_type: TokenType,
+    expires_at: datetime,
 ) -> None:
-    """Delete tokens for an application, optionally filtered by type."""
-
-    stmt = delete(VerificationToken).where(VerificationToken.application_id == application_id)
+    """
+    Revoke an application's tokens of one type and issue a new one.
 
-    if token_type:
-        stmt = stmt.where(VerificationToken.token_type == token_type)
+    The DELETE runs as a CTE attached to the INSERT, so both writes go out
+    in one statement and commit together; the application is never left
+    without a token if the insert fails.
+    """
+    revoked = (
+        delete(VerificationToken)
+        .where(
+            VerificationToken.application_id == application_id,
+            VerificationToken.token_type == token_type,
+        )
+        .returning(VerificationToken.id)
+        .cte("revoked_tokens")
+    )
 
-    await db.execute(stmt)
+    await db.execute(
+        insert(VerificationToken)
+        .values(
+            id=uuid4(),
+            application_id=application_id,
+            token_hash=token_hash,
+            token_type=token_type,
+            expires_at=expires_at,
+        )
+        .add_cte(revoked)
+    )
     await db.commit()
 
 
@@ -360,15 +682,10 @@ async def get_applications_to_expire(
     Returns:
         List of applications that should be expired
     """
-    expirable_statuses = [
-        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
-        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
-    ]
-
     result = await db.execute(
         select(SchoolApplication).where(
             and_(
-                SchoolApplication.status.in_(expirable_statuses),
+                SchoolApplication.status.in_(_EXPIRABLE_STATUSES),
                 SchoolApplication.submitted_at < submitted_before,
             )
         )
@@ -558,6 +875,23 @@ async def get_principal_tokens_to_expire(
 # ============================================
 
 
+# Columns needed by the admin list view (mirrors ApplicationListItem)
+ADMIN_LIST_COLUMNS = (
+    SchoolApplication.id,
+    SchoolApplication.school_name,
+    SchoolApplication.school_type,
+    SchoolApplication.student_population,
+    SchoolApplication.country_code,
+    SchoolApplication.city,
+    SchoolApplication.status,
+    SchoolApplication.submitted_at,
+    SchoolApplication.applicant_verified_at,
+    SchoolApplication.principal_confirmed_at,
+    SchoolApplication.reviewed_at,
+    SchoolApplication.reviewed_by,
+)
+
+
 async def get_applications_for_admin(
     db: AsyncSession,
     *,
@@ -568,12 +902,20 @@ async def get_applications_for_admin(
     sort_order: str = "asc",
     skip: int = 0,
     limit: int = 20,
-) -> tuple[list[SchoolApplication], int]:
+    after: tuple[datetime | str, UUID] | None = None,
+) -> tuple[list[RowMapping], int]:
     """
     Get applications with filters, sorting, and pagination for admin dashboard.
 
-    Implements efficient filtering, search, and pagination with a single query
-    for the applications list and a separate count query for total.
+    Implements efficient filtering, search, and pagination with a single query.
+    With offset pagination the total is read from a COUNT(*) OVER () window
+    column on the page rows. With keyset pagination (``after``) the page is a
+    range scan on (sort column, id) and the total is a count subquery in the
+    same statement. Only a page past the end (no rows to carry the total)
+    falls back to a separate count query.
+
+    Only the list-view columns are selected and rows are returned as
+    mappings, so no ORM entities are hydrated for the dashboard table.
 
     Args:
         db: Database session
@@ -583,11 +925,14 @@ async def get_applications_for_admin(
                 principal email (case-insensitive, optional)
         sort_by: Column to sort by (submitted_at, school_name). Default: submitted_at
         sort_order: Sort direction (asc, desc). Default: asc (oldest first for fairness)
-        skip: Number of records to skip for pagination. Default: 0
+        skip: Number of records to skip for pagination. Default: 0.
+              Ignored when ``after`` is given.
         limit: Maximum records to return (1-100). Default: 20
+        after: (sort column value, id) of the last row of the previous page,
+               for keyset pagination (optional)
 
     Returns:
-        Tuple of (list of applications, total count matching filters)
+        Tuple of (list of row mappings keyed by column name, total count matching filters)
 
     Example:
         applications, total = await get_applications_for_admin(
@@ -598,23 +943,22 @@ async def get_applications_for_admin(
             limit=20,
         )
     """
-    from sqlalchemy import asc, desc, func
+    from sqlalchemy import asc, desc, func, tuple_
 
-    # Build base query
-    query = select(SchoolApplication)
+    filters = []
 
     # Apply status filter
     if status:
-        query = query.where(SchoolApplication.status == status)
+        filters.append(SchoolApplication.status == status)
 
     # Apply country filter
     if country_code:
-        query = query.where(SchoolApplication.country_code == country_code)
+        filters.append(SchoolApplication.country_code == country_code)
 
     # Apply search filter (case-insensitive search across multiple fields)
     if search:
         search_pattern = f"%{search}%"
-        query = query.where(
+        filters.append(
             or_(
                 SchoolApplication.school_name.ilike(search_pattern),
                 SchoolApplication.school_email.ilike(search_pattern),
@@ -623,30 +967,51 @@ async def get_applications_for_admin(
             )
         )
 
-    # Get total count before pagination (using subquery for efficiency)
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply sorting
+    # Apply sorting (id breaks ties so keyset pages never skip or repeat rows)
     valid_sort_columns = {"submitted_at", "school_name"}
     if sort_by not in valid_sort_columns:
         sort_by = "submitted_at"
 
     sort_column = getattr(SchoolApplication, sort_by)
-    if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+    descending = sort_order.lower() == "desc"
+    direction = desc if descending else asc
+
+    if after is None:
+        # Offset pagination: the window total sees every filtered row
+        query = (
+            select(
+                Bundle("application", *ADMIN_LIST_COLUMNS),
+                func.count().over().label("total"),
+            )
+            .where(*filters)
+            .offset(skip)
+        )
     else:
-        query = query.order_by(asc(sort_column))
+        # Keyset pagination: a range scan past the cursor, so the total comes
+        # from an uncorrelated count over the filters instead of the window
+        total_query = select(func.count()).select_from(SchoolApplication).where(*filters)
+        row_key = tuple_(sort_column, SchoolApplication.id)
+        query = select(
+            Bundle("application", *ADMIN_LIST_COLUMNS),
+            total_query.scalar_subquery().label("total"),
+        ).where(*filters, row_key < tuple_(*after) if descending else row_key > tuple_(*after))
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    query = query.order_by(direction(sort_column), direction(SchoolApplication.id)).limit(limit)
 
     # Execute query
     result = await db.execute(query)
-    applications = list(result.scalars().all())
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif skip or after is not None:
+        # Page past the end: no row carries the total, so count separately
+        count_query = select(func.count()).select_from(SchoolApplication).where(*filters)
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
 
-    return applications, total
+    return [row.application._mapping for row in rows], total
 
 
 async def get_dashboard_stats(db: AsyncSession) -> dict:
@@ -752,82 +1117,6 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
     }
 
 
-async def update_application_for_review(
-    db: AsyncSession,
-    application_id: UUID,
-    reviewed_by: UUID,
-) -> SchoolApplication:
-    """
-    Update application to 'under_review' status and assign reviewer.
-
-    Sets the reviewed_by and reviewed_at fields when an admin starts
-    reviewing an application.
-
-    Args:
-        db: Database session
-        application_id: UUID of the application
-        reviewed_by: UUID of the admin starting the review
-
-    Returns:
-        Updated SchoolApplication
-
-    Raises:
-        ValueError: If application not found
-        InvalidStatusTransitionError: If application not in PENDING_REVIEW state
-    """
-    application = await get_by_id(db, application_id)
-    if not application:
-        raise ValueError(f"Application {application_id} not found")
-
-    # Use existing update_status with state machine validation
-    return await update_status(
-        db,
-        application_id,
-        ApplicationStatus.UNDER_REVIEW,
-        reviewed_by=reviewed_by,
-        reviewed_at=datetime.now(UTC),
-    )
-
-
-async def update_application_decision(
-    db: AsyncSession,
-    application_id: UUID,
-    status: ApplicationStatus,
-    decision_reason: str | None = None,
-    reviewed_by: UUID | None = None,
-) -> SchoolApplication:
-    """
-    Update application with a decision (approve, reject, more info requested).
-
-    Sets the status, decision_reason, and reviewed_at timestamp.
-
-    Args:
-        db: Database session
-        application_id: UUID of the application
-        status: New status (APPROVED, REJECTED, or MORE_INFO_REQUESTED)
-        decision_reason: Reason for rejection or info request (optional)
-        reviewed_by: UUID of admin making decision (updates if provided)
-
-    Returns:
-        Updated SchoolApplication
-
-    Raises:
-        ValueError: If application not found
-        InvalidStatusTransitionError: If transition is invalid
-    """
-    update_kwargs = {
-        "reviewed_at": datetime.now(UTC),
-    }
-
-    if decision_reason is not None:
-        update_kwargs["decision_reason"] = decision_reason
-
-    if reviewed_by is not None:
-        update_kwargs["reviewed_by"] = reviewed_by
-
-    return await update_status(db, application_id, status, **update_kwargs)
-
-
 async def add_internal_note(
     db: AsyncSession,
     application_id: UUID,
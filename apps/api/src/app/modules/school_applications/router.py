@@ -21,13 +21,16 @@ Security:
 - CSRF protection not needed (stateless API)
 """
 
+import hashlib
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.countries import COUNTRY_NAMES, SUPPORTED_COUNTRIES
 from app.core.database import get_db
 from app.core.redis import get_redis
 from app.modules.school_applications import service
@@ -35,7 +38,6 @@ from app.modules.school_applications.schemas import (
     ApplicationStatusResponse,
     ConfirmPrincipalRequest,
     ConfirmPrincipalResponse,
-    Country,
     CountryListResponse,
     PrincipalViewResponse,
     ResendVerificationRequest,
@@ -62,25 +64,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Targeting West Africa Countries for MVP
-SUPPORTED_COUNTRIES = [
-    Country(code="LR", name="Liberia"),
-    Country(code="SL", name="Sierra Leone"),
-    Country(code="GN", name="Guinea"),
-    Country(code="GH", name="Ghana"),
-    Country(code="CI", name="Côte d'Ivoire"),
-    Country(code="NG", name="Nigeria"),
-    Country(code="SN", name="Senegal"),
-    Country(code="GM", name="Gambia"),
-]
-
-# Country code to name mapping for quick lookups
-COUNTRY_CODE_TO_NAME = {country.code: country.name for country in SUPPORTED_COUNTRIES}
+# The country list is static, so serialize it once at import time
+_COUNTRIES_JSON = orjson.dumps({"countries": SUPPORTED_COUNTRIES})
+_COUNTRIES_ETAG = f'"{hashlib.blake2b(_COUNTRIES_JSON, digest_size=8).hexdigest()}"'
+_COUNTRIES_CACHE_HEADERS = {
+    "ETag": _COUNTRIES_ETAG,
+    "Cache-Control": "public, max-age=86400, immutable",
+}
 
 
 def get_country_name(country_code: str) -> str:
     """Get country name from country code."""
-    return COUNTRY_CODE_TO_NAME.get(country_code, country_code)
+    return COUNTRY_NAMES.get(country_code, country_code)
 
 
 @router.post(
@@ -152,6 +147,7 @@ email for the verification link.
 async def submit_application(
     data: SchoolApplicationCreate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis | None = Depends(get_redis),
 ) -> SchoolApplicationResponse:
     """
     Submit a new school registration application.
@@ -162,6 +158,7 @@ async def submit_application(
     Args:
         data: Application data including school info, location, contacts, and details
         db: Database session (injected)
+        redis: Redis client for the duplicate cache (injected, optional)
 
     Returns:
         Application ID, status, and verification expiration time
@@ -171,27 +168,29 @@ async def submit_application(
         HTTPException 400: If validation fails
     """
     # Validate country code is in supported list
-    if data.location.country_code not in COUNTRY_CODE_TO_NAME:
+    if data.location.country_code not in COUNTRY_NAMES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "error": "INVALID_COUNTRY",
                 "message": f"Country code '{data.location.country_code}' is not supported. "
-                f"Supported countries: {', '.join(COUNTRY_CODE_TO_NAME.keys())}",
+                f"Supported countries: {', '.join(COUNTRY_NAMES.keys())}",
             },
         )
 
     try:
-        response = await service.submit_application(db, data)
+        response = await service.submit_application(db, data, redis_client=redis)
 
         logger.info(
-            f"Application submitted successfully: id={response.id}, school={data.school.name}"
+            "Application submitted successfully: id=%s, school=%s",
+            response.id,
+            data.school.name,
         )
 
         return response
 
     except DuplicateApplicationError as e:
-        logger.warning(f"Duplicate application rejected: {e.message}")
+        logger.warning("Duplicate application rejected: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -200,7 +199,7 @@ async def submit_application(
             },
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -212,7 +211,7 @@ async def submit_application(
         # Re-raise HTTPExceptions without wrapping
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error submitting application: {e}")
+        logger.exception("Unexpected error submitting application: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -224,7 +223,7 @@ async def submit_application(
 
 @router.get(
     "/countries",
-    response_model=CountryListResponse,
+    response_class=Response,
     summary="List Supported Countries",
     description="""
 Get the list of countries supported for school registration.
@@ -240,16 +239,34 @@ Returns ISO 3166-1 alpha-2 country codes and full names.
             "description": "List of supported countries",
             "model": CountryListResponse,
         },
+        304: {
+            "description": "Not modified - client copy matches the current ETag",
+        },
     },
 )
-async def list_countries() -> CountryListResponse:
+async def list_countries(
+    if_none_match: str | None = Header(None),
+) -> Response:
     """
     Get list of supported countries for school registration.
 
+    The payload is pre-serialized at import time, so no per-request
+    validation or encoding is performed. Clients that send a matching
+    If-None-Match header receive an empty 304 response.
+
+    Args:
+        if_none_match: ETag previously returned to the client, if any
+
     Returns:
-        List of Country objects with code and name
+        JSON list of countries with code and name
     """
-    return CountryListResponse(countries=SUPPORTED_COUNTRIES)
+    if if_none_match == _COUNTRIES_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_COUNTRIES_CACHE_HEADERS)
+    return Response(
+        content=_COUNTRIES_JSON,
+        media_type="application/json",
+        headers=_COUNTRIES_CACHE_HEADERS,
+    )
 
 
 @router.post(
@@ -322,15 +339,14 @@ async def verify_applicant(
         response = await service.verify_applicant(
             db=db,
             token_string=data.token,
-            country_name_lookup=COUNTRY_CODE_TO_NAME,
         )
 
-        logger.info(f"Applicant verified for application {response.id}")
+        logger.info("Applicant verified for application %s", response.id)
 
         return response
 
     except (InvalidTokenError, TokenExpiredError) as e:
-        logger.warning(f"Token validation failed: {e.message}")
+        logger.warning("Token validation failed: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -339,7 +355,7 @@ async def verify_applicant(
             },
         ) from e
     except TokenAlreadyUsedError as e:
-        logger.warning(f"Token already used: {e.message}")
+        logger.warning("Token already used: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -348,7 +364,7 @@ async def verify_applicant(
             },
         ) from e
     except InvalidApplicationStateError as e:
-        logger.warning(f"Invalid application state: {e.message}")
+        logger.warning("Invalid application state: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -357,7 +373,7 @@ async def verify_applicant(
             },
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -368,7 +384,7 @@ async def verify_applicant(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error verifying applicant: {e}")
+        logger.exception("Unexpected error verifying applicant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -452,12 +468,12 @@ async def get_principal_view(
             token_string=token,
         )
 
-        logger.info(f"Principal view retrieved for application {response.id}")
+        logger.info("Principal view retrieved for application %s", response.id)
 
         return response
 
     except (InvalidTokenError, TokenExpiredError) as e:
-        logger.warning(f"Token validation failed: {e.message}")
+        logger.warning("Token validation failed: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -466,7 +482,7 @@ async def get_principal_view(
             },
         ) from e
     except TokenAlreadyUsedError as e:
-        logger.warning(f"Token already used: {e.message}")
+        logger.warning("Token already used: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -475,7 +491,7 @@ async def get_principal_view(
             },
         ) from e
     except InvalidApplicationStateError as e:
-        logger.warning(f"Invalid application state: {e.message}")
+        logger.warning("Invalid application state: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -484,7 +500,7 @@ async def get_principal_view(
             },
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -495,7 +511,7 @@ async def get_principal_view(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error getting principal view: {e}")
+        logger.exception("Unexpected error getting principal view: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -576,12 +592,12 @@ async def confirm_principal(
             token_string=data.token,
         )
 
-        logger.info(f"Principal confirmed application {response.id}")
+        logger.info("Principal confirmed application %s", response.id)
 
         return response
 
     except (InvalidTokenError, TokenExpiredError) as e:
-        logger.warning(f"Token validation failed: {e.message}")
+        logger.warning("Token validation failed: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -590,7 +606,7 @@ async def confirm_principal(
             },
         ) from e
     except TokenAlreadyUsedError as e:
-        logger.warning(f"Token already used: {e.message}")
+        logger.warning("Token already used: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -599,7 +615,7 @@ async def confirm_principal(
             },
         ) from e
     except InvalidApplicationStateError as e:
-        logger.warning(f"Invalid application state: {e.message}")
+        logger.warning("Invalid application state: %s", e.message)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -608,7 +624,7 @@ async def confirm_principal(
             },
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -619,7 +635,7 @@ async def confirm_principal(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error confirming principal: {e}")
+        logger.exception("Unexpected error confirming principal: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -729,12 +745,12 @@ async def resend_verification(
             redis_client=redis,
         )
 
-        logger.info(f"Resent verification for application {data.application_id}")
+        logger.info("Resent verification for application %s", data.application_id)
 
         return result
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found for resend: {data.application_id}")
+        logger.warning("Application not found for resend: %s", data.application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -743,7 +759,7 @@ async def resend_verification(
             },
         ) from e
     except InvalidEmailError as e:
-        logger.warning(f"Invalid email for resend: {data.application_id}")
+        logger.warning("Invalid email for resend: %s", data.application_id)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -752,7 +768,7 @@ async def resend_verification(
             },
         ) from e
     except AlreadyVerifiedError as e:
-        logger.warning(f"Already verified for resend: {data.application_id}")
+        logger.warning("Already verified for resend: %s", data.application_id)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -761,7 +777,7 @@ async def resend_verification(
             },
         ) from e
     except RateLimitExceededError as e:
-        logger.warning(f"Rate limit exceeded for resend: {data.application_id}")
+        logger.warning("Rate limit exceeded for resend: %s", data.application_id)
         response.headers["Retry-After"] = str(e.retry_after_seconds)
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -772,7 +788,7 @@ async def resend_verification(
             headers={"Retry-After": str(e.retry_after_seconds)},
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -783,7 +799,7 @@ async def resend_verification(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error resending verification: {e}")
+        logger.exception("Unexpected error resending verification: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -866,12 +882,12 @@ async def get_application_status(
             email=email,
         )
 
-        logger.info(f"Retrieved status for application {application_id}")
+        logger.info("Retrieved status for application %s", application_id)
 
         return result
 
     except ApplicationNotFoundError as e:
-        logger.warning(f"Application not found for status: {application_id}")
+        logger.warning("Application not found for status: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -880,7 +896,7 @@ async def get_application_status(
             },
         ) from e
     except InvalidEmailError as e:
-        logger.warning(f"Invalid email for status check: {application_id}")
+        logger.warning("Invalid email for status check: %s", application_id)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -889,7 +905,7 @@ async def get_application_status(
             },
         ) from e
     except ApplicationServiceError as e:
-        logger.error(f"Application service error: {e.message}")
+        logger.error("Application service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -900,7 +916,7 @@ async def get_application_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Unexpected error getting application status: {e}")
+        logger.exception("Unexpected error getting application status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
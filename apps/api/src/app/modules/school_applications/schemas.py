@@ -4,10 +4,21 @@ School Applications Schemas
 Pydantic schemas for request validation and response serialization.
 """
 
+import time
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+from app.core.config import settings
 
 # Re-use enums from models (they work with Pydantic too!)
 from app.modules.school_applications.models import (
@@ -17,13 +28,88 @@ from app.modules.school_applications.models import (
     StudentPopulation,
 )
 
+# Cheap structural email check (compiled once by pydantic-core). Full RFC
+# validation via email-validator only runs when strict_email_validation is on.
+# Emails are lowercased on the way in, so they are stored canonicalized and
+# compare (and hit indexes) without per-request case folding.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+CheapEmail = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True, to_lower=True, min_length=3, max_length=254, pattern=EMAIL_PATTERN
+    ),
+]
+
+
+def _strict_email_check(email: str, field_name: str) -> None:
+    """Run full RFC email validation, raising ValueError if it fails.
+
+    email-validator is imported lazily so that importing this module (and
+    booting a worker) doesn't pay for it unless strict validation is enabled.
+    """
+    from email_validator import EmailNotValidError, validate_email
+
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError as e:
+        raise ValueError(f"{field_name} is not a valid email address: {e}") from e
+
+
+def _field_descriptions(descriptions: dict[str, str]):
+    """Build a json_schema_extra hook that adds OpenAPI field descriptions.
+
+    Response-only schemas declare bare annotations (no per-field ``Field``)
+    and attach their documentation through this hook instead, which only
+    runs when the JSON schema is generated.
+    """
+
+    def _apply(schema: dict) -> None:
+        properties = schema.get("properties", {})
+        for name, description in descriptions.items():
+            if name in properties:
+                properties[name]["description"] = description
+
+    return _apply
 
-class OnlinePresenceItem(BaseModel):
+
+# Current year cache used by year_established validation: [year, expires_at].
+# Refreshed at most once per hour so validation doesn't read the clock per request.
+YEAR_CACHE_TTL_SECONDS = 3600
+_YEAR_CACHE: list[float] = [0, 0.0]
+
+
+def _current_year() -> int:
+    """Return the current year, refreshing the cached value at most hourly."""
+    now = time.monotonic()
+    if now > _YEAR_CACHE[1]:
+        _YEAR_CACHE[:] = [datetime.now().year, now + YEAR_CACHE_TTL_SECONDS]
+    return int(_YEAR_CACHE[0])
+
+
+class FastBase(BaseModel):
+    """Base class for all school application schemas.
+
+    Sets an explicit, performance-oriented config so every schema shares the
+    same validation behaviour: unknown keys are dropped, assignments are not
+    re-validated, and models can be built straight from ORM attributes.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        from_attributes=True,
+        ser_json_bytes="utf8",
+        ser_json_timedelta="iso8601",
+    )
+
+
+class OnlinePresenceItem(FastBase):
     type: str = Field(..., min_length=1, max_length=50)
     url: str = Field(..., min_length=1, max_length=500)
 
 
-class SchoolInfo(BaseModel):
+class SchoolInfo(FastBase):
     """School information section."""
 
     name: str = Field(..., min_length=1, max_length=200)
@@ -31,8 +117,17 @@ class SchoolInfo(BaseModel):
     school_type: SchoolType
     student_population: StudentPopulation
 
+    @field_validator("year_established")
+    @classmethod
+    def validate_year_established(cls, value: int) -> int:
+        """Year established can't be in the future."""
+        current_year = _current_year()
+        if value > current_year:
+            raise ValueError(f"year_established cannot be in the future (max: {current_year})")
+        return value
+
 
-class LocationInfo(BaseModel):
+class LocationInfo(FastBase):
     """Location information section."""
 
     country_code: str = Field(..., min_length=2, max_length=2)
@@ -40,30 +135,34 @@ class LocationInfo(BaseModel):
     address: str = Field(..., min_length=1, max_length=500)
 
 
-class ContactInfo(BaseModel):
+class ContactInfo(FastBase):
     """Contact information section."""
 
     school_phone: str | None = Field(None, max_length=20)
-    school_email: EmailStr | None = None
+    school_email: CheapEmail | None = None
 
     # Principal information
     principal_name: str = Field(..., min_length=1, max_length=200)
-    principal_email: EmailStr
+    principal_email: CheapEmail
     principal_phone: str = Field(..., min_length=1, max_length=20)
 
 
-class ApplicantInfo(BaseModel):
+class ApplicantInfo(FastBase):
     """Applicant information section."""
 
     is_principal: bool
     name: str | None = Field(None, max_length=200)
-    email: EmailStr | None = None
+    email: CheapEmail | None = None
     phone: str | None = Field(None, max_length=20)
     role: str | None = Field(None, max_length=100)
     admin_choice: AdminChoice | None = None
 
 
-class DetailsInfo(BaseModel):
+# Applicant fields that must be provided when the applicant is not the principal
+NON_PRINCIPAL_REQUIRED_FIELDS = ("name", "email", "phone", "role", "admin_choice")
+
+
+class DetailsInfo(FastBase):
     """Additional details section."""
 
     online_presence: list[OnlinePresenceItem] | None = None
@@ -71,7 +170,7 @@ class DetailsInfo(BaseModel):
     other_reason: str | None = Field(None, max_length=500)
 
 
-class SchoolApplicationCreate(BaseModel):
+class SchoolApplicationCreate(FastBase):
     """Request body for POST /school-applications."""
 
     school: SchoolInfo
@@ -84,41 +183,34 @@ class SchoolApplicationCreate(BaseModel):
     def validate_application(self) -> "SchoolApplicationCreate":
         """Validate conditional fields."""
 
-        # Year established can't be in the future
-        current_year = datetime.now().year
-        if self.school.year_established > current_year:
-            raise ValueError(f"year_established cannot be in the future (max: {current_year})")
-
         # At least one school contact required
         if not self.contact.school_phone and not self.contact.school_email:
             raise ValueError("At least one of school_phone or school_email is required")
 
         # If applicant is NOT the principal, applicant fields are required
         if not self.applicant.is_principal:
-            if not self.applicant.name:
-                raise ValueError("applicant.name is required when applicant is not the principal")
-            if not self.applicant.email:
-                raise ValueError("applicant.email is required when applicant is not the principal")
-            if not self.applicant.phone:
-                raise ValueError("applicant.phone is required when applicant is not the principal")
-            if not self.applicant.role:
-                raise ValueError("applicant.role is required when applicant is not the principal")
-            if not self.applicant.admin_choice:
-                raise ValueError(
-                    "applicant.admin_choice is required when applicant is not the principal"
-                )
+            for field_name in NON_PRINCIPAL_REQUIRED_FIELDS:
+                if not getattr(self.applicant, field_name):
+                    raise ValueError(
+                        f"applicant.{field_name} is required when applicant is not the principal"
+                    )
+
+        if settings.strict_email_validation:
+            _strict_email_check(self.contact.principal_email, "contact.principal_email")
+            if self.contact.school_email:
+                _strict_email_check(self.contact.school_email, "contact.school_email")
+            if self.applicant.email:
+                _strict_email_check(self.applicant.email, "applicant.email")
 
         return self
 
 
-class SchoolApplicationResponse(BaseModel):
+class SchoolApplicationResponse(FastBase):
     """Response after submitting a school application.
 
     Matches the API contract for POST /school-applications response.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     status: ApplicationStatus
     applicant_email: str
@@ -126,17 +218,15 @@ class SchoolApplicationResponse(BaseModel):
     verification_expires_at: datetime
 
 
-class VerifyApplicationRequest(BaseModel):
+class VerifyApplicationRequest(FastBase):
     """Request to verify applicant email."""
 
     token: str = Field(..., min_length=1)
 
 
-class VerifyApplicationResponse(BaseModel):
+class VerifyApplicationResponse(FastBase):
     """Response after applicant verification."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     status: ApplicationStatus
     message: str
@@ -144,52 +234,48 @@ class VerifyApplicationResponse(BaseModel):
     principal_email_hint: str | None = None  # Only present if requires_principal_confirmation=True
 
 
-class ConfirmPrincipalRequest(BaseModel):
+class ConfirmPrincipalRequest(FastBase):
     """Request to confirm principal."""
 
     token: str = Field(..., min_length=1)
 
 
-class ConfirmPrincipalResponse(BaseModel):
+class ConfirmPrincipalResponse(FastBase):
     """Response after principal confirmation."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     status: ApplicationStatus
     message: str
     school_name: str
 
 
-class ResendVerificationRequest(BaseModel):
+class ResendVerificationRequest(FastBase):
     """Request to resend verification email."""
 
     application_id: UUID
-    email: EmailStr
+    email: CheapEmail
 
 
-class ResendVerificationResponse(BaseModel):
+class ResendVerificationResponse(FastBase):
     """Response after resending verification."""
 
     message: str = "Verification email sent successfully."
     expires_at: datetime
 
 
-class PrincipalViewResponse(BaseModel):
+class PrincipalViewResponse(FastBase):
     """Response for GET /school-applications/principal-view.
 
     Returns application summary for principal to review before confirming.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     school_name: str
     applicant_name: str
     admin_choice: AdminChoice
 
 
-class StatusStep(BaseModel):
+class StatusStep(FastBase):
     """A single step in the application progress."""
 
     name: str
@@ -197,11 +283,9 @@ class StatusStep(BaseModel):
     completed_at: datetime | None = None
 
 
-class ApplicationStatusResponse(BaseModel):
+class ApplicationStatusResponse(FastBase):
     """Response for GET /school-applications/{id}/status."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     school_name: str
     status: ApplicationStatus
@@ -213,14 +297,14 @@ class ApplicationStatusResponse(BaseModel):
     steps: list[StatusStep]
 
 
-class Country(BaseModel):
+class Country(FastBase):
     """A supported country."""
 
     code: str
     name: str
 
 
-class CountryListResponse(BaseModel):
+class CountryListResponse(FastBase):
     """List of supported countries."""
 
     countries: list[Country]
@@ -231,15 +315,13 @@ class CountryListResponse(BaseModel):
 # ============================================
 
 
-class InternalNote(BaseModel):
+class InternalNote(FastBase):
     """Internal admin note structure.
 
     Internal notes are only visible to platform administrators
     and are never shown to applicants.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     note: str = Field(
         ...,
         min_length=1,
@@ -257,33 +339,46 @@ class InternalNote(BaseModel):
     )
 
 
-class ApplicationListItem(BaseModel):
+class ApplicationListItem(FastBase):
     """Application summary for list view.
 
     Contains essential fields for the admin applications list table.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
-    id: UUID = Field(..., description="Application UUID")
-    school_name: str = Field(..., description="Official school name")
-    school_type: SchoolType = Field(..., description="Type of school")
-    student_population: StudentPopulation = Field(..., description="Student population range")
-    country_code: str = Field(..., description="2-letter country code (ISO 3166-1 alpha-2)")
-    city: str = Field(..., description="City where school is located")
-    status: ApplicationStatus = Field(..., description="Current application status")
-    submitted_at: datetime = Field(..., description="When application was submitted")
-    applicant_verified_at: datetime | None = Field(
-        None, description="When applicant verified email"
-    )
-    principal_confirmed_at: datetime | None = Field(
-        None, description="When principal confirmed application"
+    model_config = ConfigDict(
+        json_schema_extra=_field_descriptions(
+            {
+                "id": "Application UUID",
+                "school_name": "Official school name",
+                "school_type": "Type of school",
+                "student_population": "Student population range",
+                "country_code": "2-letter country code (ISO 3166-1 alpha-2)",
+                "city": "City where school is located",
+                "status": "Current application status",
+                "submitted_at": "When application was submitted",
+                "applicant_verified_at": "When applicant verified email",
+                "principal_confirmed_at": "When principal confirmed application",
+                "reviewed_at": "When review started or decision made",
+                "reviewed_by": "Admin who reviewed/is reviewing",
+            }
+        )
     )
-    reviewed_at: datetime | None = Field(None, description="When review started or decision made")
-    reviewed_by: UUID | None = Field(None, description="Admin who reviewed/is reviewing")
+
+    id: UUID
+    school_name: str
+    school_type: SchoolType
+    student_population: StudentPopulation
+    country_code: str
+    city: str
+    status: ApplicationStatus
+    submitted_at: datetime
+    applicant_verified_at: datetime | None = None
+    principal_confirmed_at: datetime | None = None
+    reviewed_at: datetime | None = None
+    reviewed_by: UUID | None = None
 
 
-class ApplicationListResponse(BaseModel):
+class ApplicationListResponse(FastBase):
     """Paginated list of applications for admin dashboard.
 
     Returns applications with pagination metadata.
@@ -295,113 +390,128 @@ class ApplicationListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of applications matching filters")
     skip: int = Field(..., ge=0, description="Number of records skipped")
     limit: int = Field(..., ge=1, le=100, description="Maximum records per page")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (None on the last page)"
+    )
 
 
-class DashboardStats(BaseModel):
+class DashboardStats(FastBase):
     """Dashboard statistics for admin overview.
 
     Aggregated statistics shown on the admin dashboard.
     """
 
-    pending_review: int = Field(
-        ...,
-        ge=0,
-        description="Count of applications awaiting admin action",
-    )
-    under_review: int = Field(
-        ...,
-        ge=0,
-        description="Count of applications currently being reviewed",
-    )
-    more_info_requested: int = Field(
-        ...,
-        ge=0,
-        description="Count of applications waiting for applicant response",
-    )
-    approved_this_week: int = Field(
-        ...,
-        ge=0,
-        description="Count of applications approved in the last 7 days",
-    )
-    total_this_month: int = Field(
-        ...,
-        ge=0,
-        description="Total applications received in the current month",
-    )
-    avg_review_time_days: float | None = Field(
-        None,
-        ge=0,
-        description="Average days from submission to decision (past 30 days)",
+    model_config = ConfigDict(
+        json_schema_extra=_field_descriptions(
+            {
+                "pending_review": "Count of applications awaiting admin action",
+                "under_review": "Count of applications currently being reviewed",
+                "more_info_requested": "Count of applications waiting for applicant response",
+                "approved_this_week": "Count of applications approved in the last 7 days",
+                "total_this_month": "Total applications received in the current month",
+                "avg_review_time_days": "Average days from submission to decision (past 30 days)",
+            }
+        )
     )
 
+    pending_review: int
+    under_review: int
+    more_info_requested: int
+    approved_this_week: int
+    total_this_month: int
+    avg_review_time_days: float | None = None
+
 
-class ApplicationDetailResponse(BaseModel):
+class ApplicationDetailResponse(FastBase):
     """Complete application details for admin review.
 
     Contains all application fields including internal notes.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        json_schema_extra=_field_descriptions(
+            {
+                "id": "Application UUID",
+                "school_name": "Official school name",
+                "year_established": "Year school was established",
+                "school_type": "Type of school",
+                "student_population": "Student population range",
+                "country_code": "2-letter country code",
+                "city": "City where school is located",
+                "address": "Full street address",
+                "school_phone": "School phone number",
+                "school_email": "School email address",
+                "principal_name": "Principal's full name",
+                "principal_email": "Principal's email address",
+                "principal_phone": "Principal's phone number",
+                "applicant_is_principal": "Whether applicant is the principal",
+                "applicant_name": "Applicant's name (if not principal)",
+                "applicant_email": "Applicant's email (if not principal)",
+                "applicant_phone": "Applicant's phone (if not principal)",
+                "applicant_role": "Applicant's role (if not principal)",
+                "admin_choice": "Who will be school admin (applicant or principal)",
+                "online_presence": "School's online presence (website, social media)",
+                "reasons": "Reasons for registering",
+                "other_reason": "Additional reason (free text)",
+                "status": "Current application status",
+                "submitted_at": "When application was submitted",
+                "applicant_verified_at": "When applicant verified email",
+                "principal_confirmed_at": "When principal confirmed application",
+                "reviewed_at": "When review started or decision made",
+                "reviewed_by": "Admin who reviewed/is reviewing",
+                "decision_reason": "Reason for rejection or more info request",
+                "internal_notes": "Internal admin notes (admin-only)",
+            }
+        )
+    )
 
     # Application ID
-    id: UUID = Field(..., description="Application UUID")
+    id: UUID
 
     # School information
-    school_name: str = Field(..., description="Official school name")
-    year_established: int = Field(..., description="Year school was established")
-    school_type: SchoolType = Field(..., description="Type of school")
-    student_population: StudentPopulation = Field(..., description="Student population range")
+    school_name: str
+    year_established: int
+    school_type: SchoolType
+    student_population: StudentPopulation
 
     # Location
-    country_code: str = Field(..., description="2-letter country code")
-    city: str = Field(..., description="City where school is located")
-    address: str = Field(..., description="Full street address")
+    country_code: str
+    city: str
+    address: str
 
     # School contact
-    school_phone: str | None = Field(None, description="School phone number")
-    school_email: str | None = Field(None, description="School email address")
+    school_phone: str | None = None
+    school_email: str | None = None
 
     # Principal information
-    principal_name: str = Field(..., description="Principal's full name")
-    principal_email: str = Field(..., description="Principal's email address")
-    principal_phone: str = Field(..., description="Principal's phone number")
+    principal_name: str
+    principal_email: str
+    principal_phone: str
 
     # Applicant information
-    applicant_is_principal: bool = Field(..., description="Whether applicant is the principal")
-    applicant_name: str | None = Field(None, description="Applicant's name (if not principal)")
-    applicant_email: str | None = Field(None, description="Applicant's email (if not principal)")
-    applicant_phone: str | None = Field(None, description="Applicant's phone (if not principal)")
-    applicant_role: str | None = Field(None, description="Applicant's role (if not principal)")
-    admin_choice: AdminChoice | None = Field(
-        None, description="Who will be school admin (applicant or principal)"
-    )
+    applicant_is_principal: bool
+    applicant_name: str | None = None
+    applicant_email: str | None = None
+    applicant_phone: str | None = None
+    applicant_role: str | None = None
+    admin_choice: AdminChoice | None = None
 
     # Additional details
-    online_presence: list[OnlinePresenceItem] | None = Field(
-        None, description="School's online presence (website, social media)"
-    )
-    reasons: list[str] = Field(..., description="Reasons for registering")
-    other_reason: str | None = Field(None, description="Additional reason (free text)")
+    online_presence: list[OnlinePresenceItem] | None = None
+    reasons: list[str]
+    other_reason: str | None = None
 
     # Status and timeline
-    status: ApplicationStatus = Field(..., description="Current application status")
-    submitted_at: datetime = Field(..., description="When application was submitted")
-    applicant_verified_at: datetime | None = Field(
-        None, description="When applicant verified email"
-    )
-    principal_confirmed_at: datetime | None = Field(
-        None, description="When principal confirmed application"
-    )
-    reviewed_at: datetime | None = Field(None, description="When review started or decision made")
-    reviewed_by: UUID | None = Field(None, description="Admin who reviewed/is reviewing")
-    decision_reason: str | None = Field(
-        None, description="Reason for rejection or more info request"
-    )
+    status: ApplicationStatus
+    submitted_at: datetime
+    applicant_verified_at: datetime | None = None
+    principal_confirmed_at: datetime | None = None
+    reviewed_at: datetime | None = None
+    reviewed_by: UUID | None = None
+    decision_reason: str | None = None
 
     # Admin-only fields
-    internal_notes: list[InternalNote] | None = Field(
-        None, description="Internal admin notes (admin-only)"
-    )
+    internal_notes: list[InternalNote] | None = None
 
 
 # ============================================
@@ -409,7 +519,7 @@ class ApplicationDetailResponse(BaseModel):
 # ============================================
 
 
-class RequestInfoRequest(BaseModel):
+class RequestInfoRequest(FastBase):
     """Request body for requesting more information from applicant."""
 
     message: str = Field(
@@ -423,7 +533,7 @@ class RequestInfoRequest(BaseModel):
     )
 
 
-class RejectRequest(BaseModel):
+class RejectRequest(FastBase):
     """Request body for rejecting an application."""
 
     reason: str = Field(
@@ -437,7 +547,7 @@ class RejectRequest(BaseModel):
     )
 
 
-class AddNoteRequest(BaseModel):
+class AddNoteRequest(FastBase):
     """Request body for adding an internal note."""
 
     note: str = Field(
@@ -456,58 +566,42 @@ class AddNoteRequest(BaseModel):
 # ============================================
 
 
-class StartReviewResponse(BaseModel):
-    """Response after starting review of an application."""
+class ActionResponse(FastBase):
+    """Common envelope for admin actions that change application status.
+
+    Used directly for request-info and reject; actions that return extra
+    data extend it with their own fields. Sharing one base keeps the number
+    of core schemas built at import down without changing the wire format.
+    """
 
     id: UUID = Field(..., description="Application UUID")
-    status: ApplicationStatus = Field(..., description="Updated status (under_review)")
-    reviewed_by: UUID = Field(..., description="Admin who started the review")
-    reviewed_at: datetime = Field(..., description="When review started")
-    message: str = Field(
-        default="Application is now under review",
-        description="Success message",
-    )
+    status: ApplicationStatus = Field(..., description="Updated application status")
+    message: str = Field(..., description="Success message")
 
 
-class RequestInfoResponse(BaseModel):
-    """Response after requesting more information."""
+class StartReviewResponse(ActionResponse):
+    """Response after starting review of an application."""
 
-    id: UUID = Field(..., description="Application UUID")
-    status: ApplicationStatus = Field(..., description="Updated status (more_info_requested)")
-    message: str = Field(
-        default="Information request sent to applicant",
-        description="Success message",
-    )
+    reviewed_by: UUID = Field(..., description="Admin who started the review")
+    reviewed_at: datetime = Field(..., description="When review started")
 
 
-class ApproveResponse(BaseModel):
+class ApproveResponse(ActionResponse):
     """Response after approving an application.
 
     Contains IDs of newly created school and admin user.
     """
 
-    id: UUID = Field(..., description="Application UUID")
-    status: ApplicationStatus = Field(..., description="Updated status (approved)")
     school_id: UUID = Field(..., description="Newly created school UUID")
     admin_user_id: UUID = Field(..., description="Newly created admin user UUID")
-    message: str = Field(
-        default="Application approved. School and admin account created successfully.",
-        description="Success message",
-    )
-
 
-class RejectResponse(BaseModel):
-    """Response after rejecting an application."""
 
-    id: UUID = Field(..., description="Application UUID")
-    status: ApplicationStatus = Field(..., description="Updated status (rejected)")
-    message: str = Field(
-        default="Application rejected. Notification sent to applicant.",
-        description="Success message",
-    )
+# Request-info and reject responses carry no extra fields
+RequestInfoResponse = ActionResponse
+RejectResponse = ActionResponse
 
 
-class AddNoteResponse(BaseModel):
+class AddNoteResponse(FastBase):
     """Response after adding an internal note."""
 
     id: UUID = Field(..., description="Application UUID")
@@ -36,34 +36,53 @@ Security considerations:
 - No sensitive token data logged (prevents log exposure)
 """
 
+import asyncio
+import base64
 import contextlib
 import hashlib
 import logging
 import secrets
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import UTC, datetime, timedelta
+from typing import NoReturn
 from uuid import UUID
 
 from redis.asyncio import Redis
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.countries import COUNTRY_NAMES
+from app.core.database import async_session_maker
 from app.core.email import (
     send_applicant_verification,
+    send_application_approved,
+    send_application_rejected,
     send_application_under_review,
+    send_more_info_requested,
     send_principal_confirmation,
 )
+from app.core.rate_limit import check_resend_limit
+from app.core.security import hash_password
 from app.modules.school_applications import repository
 from app.modules.school_applications.helpers import (
+    generate_secure_token,
     get_effective_applicant_email_from_model,
-    get_effective_applicant_email_from_schema,
+    get_effective_applicant_from_schema,
     get_effective_applicant_name_from_model,
-    get_effective_applicant_name_from_schema,
+    hash_token,
 )
 from app.modules.school_applications.models import (
+    AdminChoice,
     ApplicationStatus,
     SchoolApplication,
     TokenType,
     VerificationToken,
 )
+from app.modules.school_applications.repository import (
+    DUPLICATE_BY_APPLICANT,
+    DUPLICATE_BY_SCHOOL_CITY,
+)
 from app.modules.school_applications.schemas import (
     ApplicationStatusResponse,
     ConfirmPrincipalResponse,
@@ -74,28 +93,15 @@ from app.modules.school_applications.schemas import (
     StatusStep,
     VerifyApplicationResponse,
 )
+from app.modules.schools.repository import SchoolRepository
+from app.modules.users.models import UserRole
+from app.modules.users.repository import UserRepository
 
 logger = logging.getLogger(__name__)
 
 # Constants
 TOKEN_EXPIRY_HOURS = 72
-TOKEN_LENGTH = 32  # 256 bits of entropy when using token_urlsafe
-
-
-def _hash_token(token: str) -> str:
-    """
-    Hash a token for secure storage using SHA-256.
-
-    Tokens are hashed before storage so that even if the database is
-    compromised, the plain tokens cannot be recovered and used.
-
-    Args:
-        token: The plain text token to hash
-
-    Returns:
-        Hex-encoded SHA-256 hash of the token
-    """
-    return hashlib.sha256(token.encode()).hexdigest()
+_TOKEN_EXPIRY_DELTA = timedelta(hours=TOKEN_EXPIRY_HOURS)
 
 
 class ApplicationServiceError(Exception):
@@ -218,164 +224,366 @@ class RateLimitExceededError(ApplicationServiceError):
 # Rate limiting constants
 RESEND_RATE_LIMIT_MAX_REQUESTS = 3
 RESEND_RATE_LIMIT_WINDOW_SECONDS = 3600  # 1 hour
+RESEND_RATE_LIMIT_RETRY_JITTER_SECONDS = 60  # Spread retries of clients limited together
+
+# Statuses that still have an outstanding verification email
+RESENDABLE_STATUSES: frozenset[ApplicationStatus] = frozenset(
+    {
+        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
+        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
+    }
+)
 
 
-def _generate_secure_token() -> str:
+def _calculate_token_expiry(now: datetime | None = None) -> datetime:
     """
-    Generate a cryptographically secure token for email verification.
+    Calculate the expiration datetime for a verification token.
 
-    Uses secrets.token_urlsafe which generates URL-safe base64-encoded tokens
-    with sufficient entropy for security-critical operations.
+    Args:
+        now: Request time to count from (defaults to the current time)
 
     Returns:
-        A secure random token string (43 characters for 32 bytes of entropy)
+        Datetime 72 hours from now in UTC
     """
-    return secrets.token_urlsafe(TOKEN_LENGTH)
+    return (now or datetime.now(UTC)) + _TOKEN_EXPIRY_DELTA
+
 
+# Background email dispatch
+EMAIL_DISPATCH_CONCURRENCY = 20  # Max emails in flight at once per worker
+EMAIL_DRAIN_TIMEOUT_SECONDS = 10  # Max wait for pending sends on shutdown
+_email_semaphore = asyncio.Semaphore(EMAIL_DISPATCH_CONCURRENCY)
+# Strong references to pending tasks so they aren't garbage collected mid-send
+_pending_email_tasks: set[asyncio.Task] = set()
 
-def _calculate_token_expiry() -> datetime:
+
+async def _send_email_safely(send: Awaitable[bool], description: str) -> None:
     """
-    Calculate the expiration datetime for a verification token.
+    Await an email send, logging (never raising) on failure.
+
+    Args:
+        send: The pending send_* coroutine
+        description: Human-readable description used in log messages
+    """
+    async with _email_semaphore:
+        try:
+            if not await send:
+                logger.error("Failed to send %s", description)
+        except Exception as e:
+            logger.error("Exception sending %s: %s", description, e)
+
+
+def _dispatch_email(send: Awaitable[bool], description: str) -> None:
+    """
+    Send an email in the background so the request doesn't wait on the provider.
+
+    Email delivery is best-effort: failures are logged and never affect the
+    response, so there is no reason to hold the request open for it.
+
+    Args:
+        send: The pending send_* coroutine
+        description: Human-readable description used in log messages
+    """
+    task = asyncio.create_task(_send_email_safely(send, description))
+    _pending_email_tasks.add(task)
+    task.add_done_callback(_pending_email_tasks.discard)
+
+
+async def drain_pending_emails(timeout: float = EMAIL_DRAIN_TIMEOUT_SECONDS) -> None:
+    """
+    Wait for background email sends to finish.
+
+    Call this on application shutdown so emails dispatched by recent
+    requests aren't dropped with the event loop. Sends still running
+    after the timeout are cancelled.
+
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    if not _pending_email_tasks:
+        return
+
+    _, pending = await asyncio.wait(set(_pending_email_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning("Cancelled %s email sends still pending at shutdown", len(pending))
+
+
+# In-flight token consumptions (per worker, single event loop)
+_inflight: dict[tuple[TokenType, bytes], asyncio.Future] = {}
+
+# Resolves a shared call whose owner was cancelled; its waiters retry instead
+_OWNER_CANCELLED = object()
+
+
+async def _coalesce_inflight[T](
+    key: tuple[TokenType, bytes],
+    run: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Share one in-flight token consumption between concurrent identical requests.
+
+    A double-clicked link or a client retry arrives while the first request
+    is still running; the duplicate awaits the first outcome (result or
+    error) instead of racing it through the database. If the first request
+    is cancelled (client disconnect) before finishing, its waiters are not
+    cancelled with it: they retry, and the first to resume runs the call.
+
+    Args:
+        key: Token type and token hash identifying the request
+        run: Zero-argument callable performing the consumption
 
     Returns:
-        Datetime 72 hours from now in UTC
+        The result of the first in-flight call for this key
     """
-    return datetime.now(UTC) + timedelta(hours=TOKEN_EXPIRY_HOURS)
+    while (pending := _inflight.get(key)) is not None:
+        # Shield so a disconnecting duplicate can't cancel the shared call
+        result = await asyncio.shield(pending)
+        if result is not _OWNER_CANCELLED:
+            return result
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await run()
+    except asyncio.CancelledError:
+        future.set_result(_OWNER_CANCELLED)
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; the owner re-raises it below
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
 
 
-async def _check_duplicate_by_applicant_email(
-    db: AsyncSession,
+# Recently rejected duplicates are remembered briefly so quick resubmissions
+# (double clicks, client retries) are answered without touching the database.
+# Entries are keyed by the duplicate rule and its values, so they can be
+# dropped from the conflicting application's row when it leaves the pending
+# set (see forget_duplicate_rejections). The pending-application unique
+# indexes remain the source of truth.
+DUPLICATE_CACHE_TTL_SECONDS = 60
+
+# Checked in this order, so the applicant rule wins like in find_duplicate
+_DUPLICATE_RULES = (DUPLICATE_BY_APPLICANT, DUPLICATE_BY_SCHOOL_CITY)
+
+
+def _duplicate_cache_key(rule: str, applicant_email: str, school_name: str, city: str) -> str:
+    """Build the Redis key for one duplicate rule, case-insensitive like its unique index."""
+    if rule == DUPLICATE_BY_APPLICANT:
+        values = (applicant_email, school_name)
+    else:
+        values = (school_name, city)
+    digest = hashlib.sha256("\0".join(values).lower().encode()).hexdigest()
+    return f"dup:{rule}:{digest}"
+
+
+async def _get_cached_duplicate(
+    redis_client: Redis, applicant_email: str, school_name: str, city: str
+) -> str | None:
+    """
+    Look up a cached duplicate decision, treating Redis errors as a miss.
+
+    Returns:
+        The cached duplicate rule, or None
+    """
+    keys = [
+        _duplicate_cache_key(rule, applicant_email, school_name, city) for rule in _DUPLICATE_RULES
+    ]
+    try:
+        cached = await redis_client.mget(keys)
+    except Exception as e:
+        logger.warning("Duplicate cache lookup failed: %s", e)
+        return None
+    return next((rule for rule, hit in zip(_DUPLICATE_RULES, cached, strict=True) if hit), None)
+
+
+async def forget_duplicate_rejections(
+    redis_client: Redis | None, application: SchoolApplication
+) -> None:
+    """
+    Drop cached duplicate rejections caused by an application.
+
+    Call when the application leaves the pending set (approved, rejected or
+    expired), so the submissions it blocked are accepted straight away rather
+    than after DUPLICATE_CACHE_TTL_SECONDS. Redis errors are logged, not raised.
+
+    Args:
+        redis_client: Redis client for the duplicate cache (optional)
+        application: The application that is no longer pending
+    """
+    if redis_client is None:
+        return
+
+    applicant_email = get_effective_applicant_email_from_model(application)
+    keys = [
+        _duplicate_cache_key(rule, applicant_email, application.school_name, application.city)
+        for rule in _DUPLICATE_RULES
+    ]
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning("Duplicate cache invalidation failed: %s", e)
+
+
+def _duplicate_error(
+    rule: str,
     applicant_email: str,
     school_name: str,
-) -> None:
+    city: str,
+) -> DuplicateApplicationError:
     """
-    Check if a pending application exists for the same applicant email and school.
+    Build the DuplicateApplicationError for the duplicate rule that matched.
 
     Args:
-        db: Database session
+        rule: DUPLICATE_BY_APPLICANT or DUPLICATE_BY_SCHOOL_CITY
         applicant_email: Email of the applicant
         school_name: Name of the school
+        city: City where the school is located
 
-    Raises:
-        DuplicateApplicationError: If a pending application already exists
+    Returns:
+        The error to raise
     """
-    existing_applications = await repository.get_by_applicant_email(db, applicant_email)
-
-    # Check for pending applications with the same school name
-    pending_statuses = {
-        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
-        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
-        ApplicationStatus.PENDING_REVIEW,
-        ApplicationStatus.UNDER_REVIEW,
-        ApplicationStatus.MORE_INFO_REQUESTED,
-    }
+    if rule == DUPLICATE_BY_APPLICANT:
+        logger.warning(
+            "Duplicate application attempt: email=%s, school=%s", applicant_email, school_name
+        )
+        return DuplicateApplicationError(
+            f"You already have a pending application for {school_name}. "
+            "Please check your email for the verification link or contact support."
+        )
 
-    for app in existing_applications:
-        if app.school_name == school_name and app.status in pending_statuses:
-            logger.warning(
-                f"Duplicate application attempt: email={applicant_email}, school={school_name}"
-            )
-            raise DuplicateApplicationError(
-                f"You already have a pending application for {school_name}. "
-                "Please check your email for the verification link or contact support."
-            )
+    logger.warning("Duplicate school application attempt: school=%s, city=%s", school_name, city)
+    return DuplicateApplicationError(
+        f"A school named '{school_name}' in {city} already has a pending application. "
+        "If this is not a duplicate, please contact support."
+    )
 
 
-async def _check_duplicate_by_school_and_city(
+async def _raise_duplicate_error(
     db: AsyncSession,
+    redis_client: Redis | None,
+    applicant_email: str,
     school_name: str,
     city: str,
-) -> None:
+) -> NoReturn:
     """
-    Check if a pending application exists for the same school name and city.
+    Raise a DuplicateApplicationError explaining which pending application conflicts.
+
+    Only called after the insert was rejected, so the lookup stays off the
+    happy path. The decision is cached for DUPLICATE_CACHE_TTL_SECONDS.
 
     Args:
         db: Database session
+        redis_client: Redis client for the duplicate cache (optional)
+        applicant_email: Email of the applicant
         school_name: Name of the school
         city: City where the school is located
 
     Raises:
-        DuplicateApplicationError: If a pending application already exists
+        DuplicateApplicationError: Always
     """
-    existing = await repository.get_pending_by_school_and_city(db, school_name, city)
-
-    if existing:
-        logger.warning(f"Duplicate school application attempt: school={school_name}, city={city}")
+    rule = await repository.find_duplicate(db, applicant_email, school_name, city)
+    if rule is None:
+        # The conflicting application was decided or expired after the insert
+        # was rejected; nothing to cache, the applicant can simply resubmit
         raise DuplicateApplicationError(
-            f"A school named '{school_name}' in {city} already has a pending application. "
-            "If this is not a duplicate, please contact support."
+            f"A pending application for {school_name} was just closed. Please submit again."
         )
 
+    if redis_client is not None:
+        try:
+            await redis_client.set(
+                _duplicate_cache_key(rule, applicant_email, school_name, city),
+                "1",
+                ex=DUPLICATE_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning("Duplicate cache update failed: %s", e)
+
+    raise _duplicate_error(rule, applicant_email, school_name, city)
+
 
 async def submit_application(
     db: AsyncSession,
     data: SchoolApplicationCreate,
+    redis_client: Redis | None = None,
 ) -> SchoolApplicationResponse:
     """
     Submit a new school registration application.
 
     This is the main entry point for school registration. It:
-    1. Validates that no duplicate application exists
-    2. Creates the application record with AWAITING_APPLICANT_VERIFICATION status
-    3. Generates a secure verification token
-    4. Sends verification email to the applicant
+    1. Creates the application record with AWAITING_APPLICANT_VERIFICATION status,
+       unless a pending duplicate exists
+    2. Generates a secure verification token
+    3. Sends verification email to the applicant
 
     Args:
         db: Database session
         data: Application data from the request
+        redis_client: Redis client for the duplicate cache (optional)
 
     Returns:
         SchoolApplicationResponse with application ID and status
 
     Raises:
         DuplicateApplicationError: If a duplicate application is detected
-        HTTPException: If email sending fails (with warning, not blocking)
+
+    Note:
+        The verification email is sent in the background; a failed send is
+        logged and does not fail the request.
     """
     # Get effective applicant details
-    applicant_email = get_effective_applicant_email_from_schema(data)
-    applicant_name = get_effective_applicant_name_from_schema(data)
+    applicant_email, applicant_name = get_effective_applicant_from_schema(data)
     school_name = data.school.name
 
-    logger.info(f"Processing application submission for school: {school_name}")
-
-    # Validate: Check for duplicate by applicant email + school name
-    await _check_duplicate_by_applicant_email(db, applicant_email, school_name)
+    logger.info("Processing application submission for school: %s", school_name)
 
-    # Validate: Check for duplicate by school name + city
-    await _check_duplicate_by_school_and_city(db, school_name, data.location.city)
-
-    # Create the application record
-    application = await repository.create(db, data)
-    logger.info(f"Created application {application.id} for school: {school_name}")
+    # Answer a resubmission of a recently rejected duplicate from the cache
+    if redis_client is not None:
+        cached_rule = await _get_cached_duplicate(
+            redis_client, applicant_email, school_name, data.location.city
+        )
+        if cached_rule is not None:
+            raise _duplicate_error(cached_rule, applicant_email, school_name, data.location.city)
 
     # Generate verification token
-    token = _generate_secure_token()
+    token = generate_secure_token()
     token_expiry = _calculate_token_expiry()
 
-    # Store the verification token (hashed for security)
+    # Create the application record and its verification token in one round trip.
+    # Duplicate detection is enforced by the pending-application unique indexes.
     # Plain token is sent via email, hashed version stored in DB
-    await repository.create_token(
-        db=db,
-        application_id=application.id,
-        token=_hash_token(token),  # Store hash, not plain token
+    application = await repository.create_with_token(
+        db,
+        data,
+        token_hash=hash_token(token),  # Store hash, not plain token
         token_type=TokenType.APPLICANT_VERIFICATION,
         expires_at=token_expiry,
     )
-    logger.info(f"Created verification token for application {application.id}")
+    if application is None:
+        await _raise_duplicate_error(
+            db, redis_client, applicant_email, school_name, data.location.city
+        )
 
-    # Send verification email (non-blocking - log error but don't fail the request)
-    try:
-        email_sent = await send_applicant_verification(
+    logger.info(
+        "Created application %s with verification token for school: %s", application.id, school_name
+    )
+
+    # Send verification email in the background (failures are logged, not raised)
+    _dispatch_email(
+        send_applicant_verification(
             to_email=applicant_email,
             applicant_name=applicant_name,
             school_name=school_name,
             token=token,
-        )
-
-        if not email_sent:
-            logger.error(f"Failed to send verification email for application {application.id}")
-    except Exception as e:
-        logger.error(f"Exception sending verification email for application {application.id}: {e}")
+        ),
+        f"verification email for application {application.id}",
+    )
 
     # Return response matching API contract
     return SchoolApplicationResponse(
@@ -417,32 +625,16 @@ async def get_verification_token(
     token: str,
 ) -> VerificationToken | None:
     """
-    Get a verification token by its token string.
+    Get a verification token by its plain token string.
 
     Args:
         db: Database session
-        token: The token string
+        token: The plain token string
 
     Returns:
         The VerificationToken if found, None otherwise
     """
-    return await repository.get_by_token(db, token)
-
-
-def is_token_valid(token: VerificationToken) -> bool:
-    """
-    Check if a verification token is valid (not expired and not used).
-
-    Args:
-        token: The verification token to check
-
-    Returns:
-        True if the token is valid, False otherwise
-    """
-    if token.used_at is not None:
-        return False
-
-    return datetime.now(UTC) <= token.expires_at
+    return await repository.get_by_token(db, hash_token(token))
 
 
 def _mask_email(email: str) -> str:
@@ -457,12 +649,33 @@ def _mask_email(email: str) -> str:
     Returns:
         Masked email string
     """
-    if "@" not in email:
+    at = email.find("@")
+    if at < 0:
         return "***"
+    if at <= 1:
+        return "*" + email[at:]
+    return email[0] + "***" + email[at:]
+
+
+def _principal_is_admin(application: SchoolApplication) -> str:
+    """The principal becomes the school admin."""
+    return application.principal_name
 
-    local, domain = email.split("@", 1)
-    masked_local = "*" if len(local) <= 1 else f"{local[0]}***"
-    return f"{masked_local}@{domain}"
+
+def _applicant_is_admin(application: SchoolApplication) -> str:
+    """The applicant becomes the school admin (principal as fallback)."""
+    return application.applicant_name or application.principal_name
+
+
+# Designated admin by (applicant_is_principal, admin_choice)
+_DESIGNATED_ADMIN_PICKER: dict[
+    tuple[bool, AdminChoice | None], Callable[[SchoolApplication], str]
+] = {
+    **{(True, choice): _principal_is_admin for choice in (*AdminChoice, None)},
+    (False, AdminChoice.PRINCIPAL): _principal_is_admin,
+    (False, AdminChoice.APPLICANT): _applicant_is_admin,
+    (False, None): _applicant_is_admin,
+}
 
 
 def _get_designated_admin_name(application: SchoolApplication) -> str:
@@ -475,55 +688,49 @@ def _get_designated_admin_name(application: SchoolApplication) -> str:
     Returns:
         Name of the person who will be the school admin
     """
-    from app.modules.school_applications.models import AdminChoice
-
-    if application.applicant_is_principal:
-        return application.principal_name
-
-    if application.admin_choice == AdminChoice.PRINCIPAL:
-        return application.principal_name
-
-    # AdminChoice.APPLICANT or default
-    return application.applicant_name or application.principal_name
+    picker = _DESIGNATED_ADMIN_PICKER.get(
+        (application.applicant_is_principal, application.admin_choice), _applicant_is_admin
+    )
+    return picker(application)
 
 
 async def _validate_token(
     db: AsyncSession,
-    token_string: str,
+    token_hash: bytes,
     expected_type: TokenType,
-) -> tuple[VerificationToken, SchoolApplication]:
+    now: datetime | None = None,
+) -> tuple[VerificationToken, Row]:
     """
-    Validate a verification token and return it with its associated application.
+    Validate a verification token and return it with a view of its application.
 
     Args:
         db: Database session
-        token_string: The token string to validate
+        token_hash: SHA-256 digest of the presented token
         expected_type: The expected token type
+        now: Request time to check expiry against (defaults to the current time)
 
     Returns:
-        Tuple of (VerificationToken, SchoolApplication)
+        Tuple of (VerificationToken, application view row)
 
     Raises:
         InvalidTokenError: If token not found or wrong type
         TokenExpiredError: If token has expired
         TokenAlreadyUsedError: If token was already used
-        ApplicationNotFoundError: If associated application not found
     """
-    # Hash the incoming token to match stored hash
-    token_hash = _hash_token(token_string)
-
-    # Get the token by its hash
-    verification_token = await repository.get_by_token(db, token_hash)
+    # Get the token by its hash, with the columns of its application callers read
+    found = await repository.get_token_with_application_view(db, token_hash)
 
-    if not verification_token:
+    if not found:
         # Don't log token content - security best practice
         logger.warning("Token validation failed: token not found in database")
         raise InvalidTokenError()
 
+    verification_token, application = found
+
     # Verify token type
     if verification_token.token_type != expected_type:
         logger.warning(
-            f"Token type mismatch: expected {expected_type}, got {verification_token.token_type}"
+            "Token type mismatch: expected %s, got %s", expected_type, verification_token.token_type
         )
         raise InvalidTokenError("Invalid token type for this operation.")
 
@@ -533,24 +740,61 @@ async def _validate_token(
         raise TokenAlreadyUsedError()
 
     # Check if expired
-    if datetime.now(UTC) > verification_token.expires_at:
+    if (now or datetime.now(UTC)) > verification_token.expires_at:
         logger.warning("Token validation failed: token expired")
         raise TokenExpiredError()
 
-    # Get the associated application
-    application = await repository.get_by_id(db, verification_token.application_id)
+    return verification_token, application
 
-    if not application:
-        logger.error(f"Application not found for token: {verification_token.application_id}")
-        raise ApplicationNotFoundError(verification_token.application_id)
 
-    return verification_token, application
+async def _raise_token_failure(
+    db: AsyncSession,
+    token_hash: bytes,
+    expected_type: TokenType,
+    expected_status: ApplicationStatus,
+    state_message: str,
+    now: datetime,
+) -> NoReturn:
+    """
+    Raise the error explaining why a token could not be consumed.
+
+    Only called after consume_token_and_advance matched nothing, so the
+    diagnostic lookups stay off the happy path.
+
+    Args:
+        db: Database session
+        token_hash: SHA-256 digest of the presented token
+        expected_type: The expected token type
+        expected_status: The status the application had to be in
+        state_message: Message for InvalidApplicationStateError
+        now: Request time the token was checked against
+
+    Raises:
+        InvalidTokenError: If token not found or wrong type
+        TokenExpiredError: If token has expired
+        TokenAlreadyUsedError: If token was already used
+        InvalidApplicationStateError: If application not in expected_status
+    """
+    _, application = await _validate_token(db, token_hash, expected_type, now=now)
+
+    if application.status != expected_status:
+        logger.warning(
+            "Application %s not in %s state: %s",
+            application.id,
+            expected_status.name,
+            application.status,
+        )
+        raise InvalidApplicationStateError(state_message, expected_state=expected_status.value)
+
+    # Token and application were valid when checked, so a concurrent request consumed it
+    logger.warning("Token validation failed: token consumed by a concurrent request")
+    raise TokenAlreadyUsedError()
 
 
 async def verify_applicant(
     db: AsyncSession,
     token_string: str,
-    country_name_lookup: dict[str, str] | None = None,
+    country_name_lookup: Mapping[str, str] | None = None,
 ) -> VerifyApplicationResponse:
     """
     Verify the applicant's email address.
@@ -562,7 +806,8 @@ async def verify_applicant(
     Args:
         db: Database session
         token_string: The verification token from the email
-        country_name_lookup: Optional dict mapping country codes to names
+        country_name_lookup: Optional mapping of country codes to names
+            (defaults to the supported countries table)
 
     Returns:
         VerifyApplicationResponse with next steps
@@ -575,50 +820,72 @@ async def verify_applicant(
     """
     logger.info("Processing applicant verification")
 
-    # Validate the token (we don't need the token object, just the validation)
-    _, application = await _validate_token(db, token_string, TokenType.APPLICANT_VERIFICATION)
-
-    # Verify application is in correct state
-    if application.status != ApplicationStatus.AWAITING_APPLICANT_VERIFICATION:
-        logger.warning(
-            f"Application {application.id} not in AWAITING_APPLICANT_VERIFICATION state: "
-            f"{application.status}"
-        )
-        raise InvalidApplicationStateError(
-            "This application has already been verified.",
-            expected_state=ApplicationStatus.AWAITING_APPLICANT_VERIFICATION.value,
-        )
+    token_hash = hash_token(token_string)
+    return await _coalesce_inflight(
+        (TokenType.APPLICANT_VERIFICATION, token_hash),
+        lambda: _verify_applicant(db, token_hash, country_name_lookup),
+    )
 
-    # Mark token as used (use hashed token for lookup)
-    await repository.mark_token_used(db, _hash_token(token_string))
-    logger.info(f"Marked verification token as used for application {application.id}")
 
-    # Update applicant_verified_at timestamp
+async def _verify_applicant(
+    db: AsyncSession,
+    token_hash: bytes,
+    country_name_lookup: Mapping[str, str] | None,
+) -> VerifyApplicationResponse:
+    """Consume an applicant verification token; see verify_applicant."""
+    # Principal confirmation token, written by the same statement unless the
+    # applicant turns out to be the principal (store hash, send plain token)
     now = datetime.now(UTC)
+    principal_token = generate_secure_token()
+    principal_token_expiry = _calculate_token_expiry(now)
 
-    if application.applicant_is_principal:
-        # Scenario 1: Applicant IS the principal - move directly to pending_review
-        await repository.update_status(
+    # Consume the token and advance the application in a single statement
+    application = await repository.consume_token_and_advance(
+        db,
+        token_hash,
+        TokenType.APPLICANT_VERIFICATION,
+        expected_status=ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
+        new_status=ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
+        # Applicant IS the principal - move directly to pending_review
+        principal_overrides={
+            "status": ApplicationStatus.PENDING_REVIEW,
+            "principal_confirmed_at": now,  # Auto-confirm since same person
+        },
+        now=now,
+        next_token=(
+            hash_token(principal_token),
+            TokenType.PRINCIPAL_CONFIRMATION,
+            principal_token_expiry,
+        ),
+        applicant_verified_at=now,
+    )
+    if application is None:
+        await _raise_token_failure(
             db,
-            application.id,
-            ApplicationStatus.PENDING_REVIEW,
-            applicant_verified_at=now,
-            principal_confirmed_at=now,  # Auto-confirm since same person
+            token_hash,
+            TokenType.APPLICANT_VERIFICATION,
+            ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
+            "This application has already been verified.",
+            now,
         )
+    _invalidate_cached_status(application.id)
+
+    if application.applicant_is_principal:
+        # Scenario 1: Applicant IS the principal - moved directly to pending_review
         logger.info(
-            f"Application {application.id} moved to PENDING_REVIEW (applicant is principal)"
+            "Application %s moved to PENDING_REVIEW (applicant is principal)", application.id
         )
 
         # Send "under review" email
-        try:
-            await send_application_under_review(
+        _dispatch_email(
+            send_application_under_review(
                 to_email=application.principal_email,
                 applicant_name=application.principal_name,
                 school_name=application.school_name,
                 application_id=str(application.id),
-            )
-        except Exception as e:
-            logger.error(f"Failed to send under review email: {e}")
+            ),
+            "under review email",
+        )
 
         return VerifyApplicationResponse(
             id=application.id,
@@ -629,38 +896,17 @@ async def verify_applicant(
 
     else:
         # Scenario 2: Applicant is NOT the principal - need principal confirmation
-        await repository.update_status(
-            db,
-            application.id,
-            ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
-            applicant_verified_at=now,
-        )
-        logger.info(f"Application {application.id} moved to AWAITING_PRINCIPAL_CONFIRMATION")
-
-        # Generate new token for principal confirmation
-        principal_token = _generate_secure_token()
-        principal_token_expiry = _calculate_token_expiry()
-
-        # Store hashed token, send plain token via email
-        await repository.create_token(
-            db=db,
-            application_id=application.id,
-            token=_hash_token(principal_token),  # Store hash, not plain token
-            token_type=TokenType.PRINCIPAL_CONFIRMATION,
-            expires_at=principal_token_expiry,
-        )
-        logger.info(f"Created principal confirmation token for application {application.id}")
+        logger.info("Application %s moved to AWAITING_PRINCIPAL_CONFIRMATION", application.id)
+
+        logger.info("Created principal confirmation token for application %s", application.id)
 
         # Get country name for email
-        country_name = application.country_code
-        if country_name_lookup:
-            country_name = country_name_lookup.get(
-                application.country_code, application.country_code
-            )
+        country_names = COUNTRY_NAMES if country_name_lookup is None else country_name_lookup
+        country_name = country_names.get(application.country_code, application.country_code)
 
         # Send confirmation email to principal
-        try:
-            await send_principal_confirmation(
+        _dispatch_email(
+            send_principal_confirmation(
                 to_email=application.principal_email,
                 principal_name=application.principal_name,
                 school_name=application.school_name,
@@ -670,9 +916,9 @@ async def verify_applicant(
                 country=country_name,
                 designated_admin=_get_designated_admin_name(application),
                 token=principal_token,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send principal confirmation email: {e}")
+            ),
+            "principal confirmation email",
+        )
 
         return VerifyApplicationResponse(
             id=application.id,
@@ -709,13 +955,16 @@ async def get_principal_view(
     logger.info("Processing principal view request")
 
     # Validate the token (don't mark as used - that happens on confirmation)
-    _, application = await _validate_token(db, token_string, TokenType.PRINCIPAL_CONFIRMATION)
+    _, application = await _validate_token(
+        db, hash_token(token_string), TokenType.PRINCIPAL_CONFIRMATION
+    )
 
     # Verify application is in correct state
     if application.status != ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION:
         logger.warning(
-            f"Application {application.id} not in AWAITING_PRINCIPAL_CONFIRMATION state: "
-            f"{application.status}"
+            "Application %s not in AWAITING_PRINCIPAL_CONFIRMATION state: %s",
+            application.id,
+            application.status,
         )
         raise InvalidApplicationStateError(
             "This application is not awaiting principal confirmation.",
@@ -757,48 +1006,56 @@ async def confirm_principal(
     """
     logger.info("Processing principal confirmation")
 
-    # Validate the token (we don't need the token object, just the validation)
-    _, application = await _validate_token(db, token_string, TokenType.PRINCIPAL_CONFIRMATION)
-
-    # Verify application is in correct state
-    if application.status != ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION:
-        logger.warning(
-            f"Application {application.id} not in AWAITING_PRINCIPAL_CONFIRMATION state: "
-            f"{application.status}"
-        )
-        raise InvalidApplicationStateError(
-            "This application is not awaiting principal confirmation.",
-            expected_state=ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION.value,
-        )
+    token_hash = hash_token(token_string)
+    return await _coalesce_inflight(
+        (TokenType.PRINCIPAL_CONFIRMATION, token_hash),
+        lambda: _confirm_principal(db, token_hash),
+    )
 
-    # Mark token as used (use hashed token for lookup)
-    await repository.mark_token_used(db, _hash_token(token_string))
-    logger.info(f"Marked principal confirmation token as used for application {application.id}")
 
-    # Update status to pending_review
+async def _confirm_principal(
+    db: AsyncSession,
+    token_hash: bytes,
+) -> ConfirmPrincipalResponse:
+    """Consume a principal confirmation token; see confirm_principal."""
+    # Consume the token and advance the application in a single statement
     now = datetime.now(UTC)
-    await repository.update_status(
+    application = await repository.consume_token_and_advance(
         db,
-        application.id,
-        ApplicationStatus.PENDING_REVIEW,
+        token_hash,
+        TokenType.PRINCIPAL_CONFIRMATION,
+        expected_status=ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
+        new_status=ApplicationStatus.PENDING_REVIEW,
+        now=now,
         principal_confirmed_at=now,
     )
-    logger.info(f"Application {application.id} moved to PENDING_REVIEW")
+    if application is None:
+        await _raise_token_failure(
+            db,
+            token_hash,
+            TokenType.PRINCIPAL_CONFIRMATION,
+            ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
+            "This application is not awaiting principal confirmation.",
+            now,
+        )
+    _invalidate_cached_status(application.id)
+
+    logger.info("Application %s moved to PENDING_REVIEW", application.id)
 
     # Get the effective applicant email for notification
     applicant_email = application.applicant_email or application.principal_email
     applicant_name = application.applicant_name or application.principal_name
 
     # Send "under review" email to applicant
-    try:
-        await send_application_under_review(
+    _dispatch_email(
+        send_application_under_review(
             to_email=applicant_email,
             applicant_name=applicant_name,
             school_name=application.school_name,
             application_id=str(application.id),
-        )
-    except Exception as e:
-        logger.error(f"Failed to send under review email: {e}")
+        ),
+        "under review email",
+    )
 
     return ConfirmPrincipalResponse(
         id=application.id,
@@ -815,10 +1072,10 @@ async def _check_rate_limit(
     """
     Check and enforce rate limiting for resend verification requests.
 
-    Uses a sliding window counter pattern in Redis:
-    - Key: resend_verification:{application_id}
-    - Value: Count of requests in the current window
-    - TTL: 1 hour (3600 seconds)
+    Uses a rolling window stored in a Redis sorted set
+    (see app.core.rate_limit.check_resend_limit):
+    - Key: rl:resend:{application_id}
+    - Members: timestamps of requests in the last hour
 
     Args:
         redis_client: Redis client instance
@@ -827,27 +1084,22 @@ async def _check_rate_limit(
     Raises:
         RateLimitExceededError: If rate limit is exceeded
     """
-    rate_limit_key = f"resend_verification:{application_id}"
-
-    # Get current count
-    current_count = await redis_client.get(rate_limit_key)
+    retry_after = await check_resend_limit(
+        redis_client,
+        application_id,
+        limit=RESEND_RATE_LIMIT_MAX_REQUESTS,
+        window_seconds=RESEND_RATE_LIMIT_WINDOW_SECONDS,
+        jitter_seconds=RESEND_RATE_LIMIT_RETRY_JITTER_SECONDS,
+    )
 
-    if current_count is not None and int(current_count) >= RESEND_RATE_LIMIT_MAX_REQUESTS:
-        # Get TTL to determine retry-after
-        ttl = await redis_client.ttl(rate_limit_key)
-        retry_after = max(ttl, 60)  # At least 60 seconds
+    if retry_after is not None:
         logger.warning(
-            f"Rate limit exceeded for application {application_id}: "
-            f"{current_count} requests in window"
+            "Rate limit exceeded for application %s: %s requests in window",
+            application_id,
+            RESEND_RATE_LIMIT_MAX_REQUESTS,
         )
         raise RateLimitExceededError(retry_after_seconds=retry_after)
 
-    # Increment counter with expiry
-    pipe = redis_client.pipeline()
-    pipe.incr(rate_limit_key)
-    pipe.expire(rate_limit_key, RESEND_RATE_LIMIT_WINDOW_SECONDS)
-    await pipe.execute()
-
 
 async def resend_verification(
     db: AsyncSession,
@@ -865,10 +1117,13 @@ async def resend_verification(
     4. Deletes old token and creates a new one
     5. Sends new verification email
 
+    The rate limit is only charged once the request has passed validation,
+    so requests with a wrong email can't use up the applicant's resends.
+
     Args:
         db: Database session
         application_id: UUID of the application
-        email: Email address (must match applicant email)
+        email: Lowercased email address (must match applicant email)
         redis_client: Redis client for rate limiting (required in production)
 
     Returns:
@@ -881,48 +1136,47 @@ async def resend_verification(
         RateLimitExceededError: If too many requests
         ApplicationServiceError: If Redis unavailable (fail-closed security)
     """
-    logger.info(f"Processing resend verification for application {application_id}")
+    logger.info("Processing resend verification for application %s", application_id)
+
+    # Check rate limit - fail closed if Redis unavailable (security)
+    # This prevents email bombing attacks during Redis outages
+    if redis_client is None:
+        logger.error("Redis unavailable for rate limiting - failing request (security)")
+        raise ApplicationServiceError(
+            message="Service temporarily unavailable. Please try again later.",
+            error_code="SERVICE_UNAVAILABLE",
+            status_code=503,
+        )
 
-    # Get the application
     application = await repository.get_by_id(db, application_id)
 
     if not application:
-        logger.warning(f"Application not found for resend: {application_id}")
+        logger.warning("Application not found for resend: %s", application_id)
         raise ApplicationNotFoundError(application_id)
 
     # Get effective applicant email
     effective_email = get_effective_applicant_email_from_model(application)
 
-    # Validate email matches (case-insensitive comparison)
-    if email.lower() != effective_email.lower():
+    # Validate email matches (both sides are stored/validated lowercase)
+    if email != effective_email:
         logger.warning(
-            f"Email mismatch for application {application_id}: "
-            f"provided={email}, expected={effective_email}"
+            "Email mismatch for application %s: provided=%s, expected=%s",
+            application_id,
+            email,
+            effective_email,
         )
         raise InvalidEmailError()
 
     # Check application status - can only resend for awaiting verification states
-    valid_resend_statuses = {
-        ApplicationStatus.AWAITING_APPLICANT_VERIFICATION,
-        ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION,
-    }
-
-    if application.status not in valid_resend_statuses:
+    if application.status not in RESENDABLE_STATUSES:
         logger.warning(
-            f"Cannot resend verification for application {application_id}: "
-            f"status={application.status}"
+            "Cannot resend verification for application %s: status=%s",
+            application_id,
+            application.status,
         )
         raise AlreadyVerifiedError()
 
-    # Check rate limit - fail closed if Redis unavailable (security)
-    # This prevents email bombing attacks during Redis outages
-    if redis_client is None:
-        logger.error("Redis unavailable for rate limiting - failing request (security)")
-        raise ApplicationServiceError(
-            message="Service temporarily unavailable. Please try again later.",
-            error_code="SERVICE_UNAVAILABLE",
-            status_code=503,
-        )
+    # Charge the rate limit only for requests that would send an email
     await _check_rate_limit(redis_client, application_id)
 
     # Determine token type based on current status
@@ -936,59 +1190,43 @@ async def resend_verification(
         recipient_email = application.principal_email
         recipient_name = application.principal_name
 
-    # Delete existing tokens of this type for the application
-    await repository.delete_tokens_for_application(db, application_id, token_type)
-    logger.info(f"Deleted existing {token_type} tokens for application {application_id}")
-
     # Generate new token
-    new_token = _generate_secure_token()
+    new_token = generate_secure_token()
     new_token_expiry = _calculate_token_expiry()
 
-    # Store hashed token, send plain token via email
-    await repository.create_token(
+    # Replace existing tokens of this type; store hashed token, send plain token via email
+    await repository.replace_tokens(
         db=db,
         application_id=application_id,
-        token=_hash_token(new_token),  # Store hash, not plain token
+        token_hash=hash_token(new_token),  # Store hash, not plain token
         token_type=token_type,
         expires_at=new_token_expiry,
     )
-    logger.info(f"Created new {token_type} token for application {application_id}")
-
-    # Send appropriate email based on token type
-    try:
-        if token_type == TokenType.APPLICANT_VERIFICATION:
-            await send_applicant_verification(
-                to_email=recipient_email,
-                applicant_name=recipient_name,
-                school_name=application.school_name,
-                token=new_token,
-            )
-        else:
-            # For principal confirmation, we need the full context
-            from app.modules.school_applications.models import AdminChoice
-
-            designated_admin = (
-                application.principal_name
-                if application.admin_choice == AdminChoice.PRINCIPAL
-                else application.applicant_name or application.principal_name
-            )
-
-            await send_principal_confirmation(
-                to_email=recipient_email,
-                principal_name=recipient_name,
-                school_name=application.school_name,
-                applicant_name=application.applicant_name or "Staff",
-                applicant_role=application.applicant_role or "Staff",
-                city=application.city,
-                country=application.country_code,
-                designated_admin=designated_admin,
-                token=new_token,
-            )
-
-        logger.info(f"Resent verification email for application {application_id}")
-    except Exception as e:
-        logger.error(f"Failed to resend verification email: {e}")
-        # Still return success - token was created
+    logger.info("Replaced %s tokens for application %s", token_type, application_id)
+
+    # Send appropriate email based on token type (in the background; the
+    # token was created either way)
+    if token_type == TokenType.APPLICANT_VERIFICATION:
+        send = send_applicant_verification(
+            to_email=recipient_email,
+            applicant_name=recipient_name,
+            school_name=application.school_name,
+            token=new_token,
+        )
+    else:
+        # For principal confirmation, we need the full context
+        send = send_principal_confirmation(
+            to_email=recipient_email,
+            principal_name=recipient_name,
+            school_name=application.school_name,
+            applicant_name=application.applicant_name or "Staff",
+            applicant_role=application.applicant_role or "Staff",
+            city=application.city,
+            country=application.country_code,
+            designated_admin=_get_designated_admin_name(application),
+            token=new_token,
+        )
+    _dispatch_email(send, f"resent verification email for application {application_id}")
 
     return ResendVerificationResponse(
         message="Verification email resent successfully.",
@@ -1033,6 +1271,30 @@ STATUS_DESCRIPTIONS: dict[ApplicationStatus, str] = {
     ),
 }
 
+# Combined (label, description) table so the status endpoint does one lookup
+# and hands prebuilt strings to the response without re-validating them.
+# Built over every ApplicationStatus, so a status missing from either table
+# fails at import (KeyError) and the lookup below never needs a fallback.
+STATUS_TEXT: dict[ApplicationStatus, tuple[str, str]] = {
+    status: (STATUS_LABELS[status], STATUS_DESCRIPTIONS[status]) for status in ApplicationStatus
+}
+
+
+# Statuses in which the "Under Review" step counts as completed
+REVIEW_STEP_STATUSES: frozenset[ApplicationStatus] = frozenset(
+    {
+        ApplicationStatus.UNDER_REVIEW,
+        ApplicationStatus.MORE_INFO_REQUESTED,
+        ApplicationStatus.APPROVED,
+        ApplicationStatus.REJECTED,
+    }
+)
+
+# Statuses for which the "Decision" step is complete
+DECISION_STEP_STATUSES: frozenset[ApplicationStatus] = frozenset(
+    {ApplicationStatus.APPROVED, ApplicationStatus.REJECTED}
+)
+
 
 def _build_status_steps(application: SchoolApplication) -> list[StatusStep]:
     """
@@ -1051,64 +1313,67 @@ def _build_status_steps(application: SchoolApplication) -> list[StatusStep]:
     Returns:
         List of StatusStep objects representing the progress
     """
-    steps: list[StatusStep] = []
-
-    # Step 1: Application Submitted (always completed)
-    steps.append(
-        StatusStep(
+    # Every value is a database field or a constant, so the steps are built
+    # with model_construct and skip field validation
+    under_review_completed = application.status in REVIEW_STEP_STATUSES
+    decision_completed = application.status in DECISION_STEP_STATUSES
+
+    steps = [
+        # Step 1: Application Submitted (always completed)
+        StatusStep.model_construct(
             name="Application Submitted",
             completed=True,
             completed_at=application.submitted_at,
-        )
-    )
-
-    # Step 2: Email Verified
-    steps.append(
-        StatusStep(
+        ),
+        # Step 2: Email Verified
+        StatusStep.model_construct(
             name="Email Verified",
             completed=application.applicant_verified_at is not None,
             completed_at=application.applicant_verified_at,
-        )
-    )
+        ),
+        # Step 4: Under Review
+        StatusStep.model_construct(
+            name="Under Review",
+            completed=under_review_completed,
+            completed_at=application.reviewed_at if under_review_completed else None,
+        ),
+        # Step 5: Decision
+        StatusStep.model_construct(
+            name="Decision",
+            completed=decision_completed,
+            completed_at=application.reviewed_at if decision_completed else None,
+        ),
+    ]
 
     # Step 3: Principal Confirmed (only if applicant is not the principal)
     if not application.applicant_is_principal:
-        steps.append(
-            StatusStep(
+        steps.insert(
+            2,
+            StatusStep.model_construct(
                 name="Principal Confirmed",
                 completed=application.principal_confirmed_at is not None,
                 completed_at=application.principal_confirmed_at,
-            )
+            ),
         )
 
-    # Step 4: Under Review
-    review_statuses = {
-        ApplicationStatus.UNDER_REVIEW,
-        ApplicationStatus.MORE_INFO_REQUESTED,
-        ApplicationStatus.APPROVED,
-        ApplicationStatus.REJECTED,
-    }
-    under_review_completed = application.status in review_statuses
-    steps.append(
-        StatusStep(
-            name="Under Review",
-            completed=under_review_completed,
-            completed_at=application.reviewed_at if under_review_completed else None,
-        )
-    )
+    return steps
 
-    # Step 5: Decision
-    decision_statuses = {ApplicationStatus.APPROVED, ApplicationStatus.REJECTED}
-    decision_completed = application.status in decision_statuses
-    steps.append(
-        StatusStep(
-            name="Decision",
-            completed=decision_completed,
-            completed_at=application.reviewed_at if decision_completed else None,
-        )
-    )
 
-    return steps
+# ============================================
+# Status Cache
+# ============================================
+
+# Applicants poll the status page, so keep each built response for a short
+# window. Entries are keyed by application and hold the (lowercased) email
+# that was authorized, so a hit never serves another caller's request.
+STATUS_CACHE_TTL_SECONDS = 2
+STATUS_CACHE_MAX_ENTRIES = 1024
+_status_cache: dict[UUID, tuple[float, bytes, ApplicationStatusResponse]] = {}
+
+
+def _invalidate_cached_status(application_id: UUID) -> None:
+    """Drop the cached status response after the application changes."""
+    _status_cache.pop(application_id, None)
 
 
 async def get_application_status(
@@ -1135,42 +1400,57 @@ async def get_application_status(
         ApplicationNotFoundError: If application doesn't exist
         InvalidEmailError: If email doesn't match (prevents unauthorized access)
     """
-    logger.info(f"Getting status for application {application_id}")
+    logger.info("Getting status for application %s", application_id)
+
+    # Serve a recent response for the same application and email
+    now = time.monotonic()
+    email_bytes = email.strip().lower().encode()
+    cached = _status_cache.get(application_id)
+    if cached is not None and now < cached[0] and secrets.compare_digest(cached[1], email_bytes):
+        return cached[2]
 
     # Get the application
     application = await repository.get_by_id(db, application_id)
 
     if not application:
-        logger.warning(f"Application not found for status check: {application_id}")
+        logger.warning("Application not found for status check: %s", application_id)
         raise ApplicationNotFoundError(application_id)
 
     # Get effective applicant email
     effective_email = get_effective_applicant_email_from_model(application)
 
-    # Validate email matches (case-insensitive comparison for security)
-    if email.lower() != effective_email.lower():
+    # Validate email matches (stored lowercase; the query parameter isn't normalized).
+    # Constant-time, so response timing doesn't reveal how much of an email matched.
+    if not secrets.compare_digest(email_bytes, effective_email.encode()):
         logger.warning(
-            f"Unauthorized status check attempt for application {application_id}: "
-            f"provided email does not match"
+            "Unauthorized status check attempt for application %s: provided email does not match",
+            application_id,
         )
         raise InvalidEmailError()
 
-    # Build response
-    return ApplicationStatusResponse(
+    status_label, status_description = STATUS_TEXT[application.status]
+
+    # Build response. All values come from the database row and the constant
+    # tables above, so model_construct skips redundant field validation.
+    response = ApplicationStatusResponse.model_construct(
         id=application.id,
         school_name=application.school_name,
         status=application.status,
-        status_label=STATUS_LABELS.get(application.status, str(application.status.value)),
-        status_description=STATUS_DESCRIPTIONS.get(
-            application.status,
-            "Please contact support for more information.",
-        ),
+        status_label=status_label,
+        status_description=status_description,
         submitted_at=application.submitted_at,
         applicant_verified_at=application.applicant_verified_at,
         principal_confirmed_at=application.principal_confirmed_at,
         steps=_build_status_steps(application),
     )
 
+    # Evict the oldest entry once full (dicts keep insertion order)
+    if len(_status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+        _status_cache.pop(next(iter(_status_cache)))
+    _status_cache[application_id] = (now + STATUS_CACHE_TTL_SECONDS, email_bytes, response)
+
+    return response
+
 
 # ============================================
 # Admin Service Functions
@@ -1212,6 +1492,17 @@ class SchoolProvisioningError(ApplicationServiceError):
         )
 
 
+class InvalidCursorError(ApplicationServiceError):
+    """Raised when a pagination cursor is malformed."""
+
+    def __init__(self):
+        super().__init__(
+            message="Invalid pagination cursor.",
+            error_code="INVALID_CURSOR",
+            status_code=400,
+        )
+
+
 # Valid statuses for starting a review
 REVIEWABLE_STATUSES = {
     ApplicationStatus.PENDING_REVIEW,
@@ -1225,6 +1516,29 @@ DECIDABLE_STATUSES = {
 }
 
 
+def _encode_list_cursor(row: Mapping, sort_by: str) -> str:
+    """Encode the last row's (sort value, id) as an opaque keyset cursor."""
+    value = row["school_name"] if sort_by == "school_name" else row["submitted_at"].isoformat()
+    return base64.urlsafe_b64encode(f"{value}|{row['id']}".encode()).decode()
+
+
+def _decode_list_cursor(cursor: str, sort_by: str) -> tuple[datetime | str, UUID]:
+    """
+    Decode a keyset cursor produced by _encode_list_cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        # School names may contain "|", the trailing UUID never does
+        value, _, row_id = base64.urlsafe_b64decode(cursor).decode().rpartition("|")
+        if sort_by == "school_name":
+            return value, UUID(row_id)
+        return datetime.fromisoformat(value), UUID(row_id)
+    except ValueError as e:
+        raise InvalidCursorError() from e
+
+
 async def admin_get_applications_list(
     db: AsyncSession,
     *,
@@ -1235,11 +1549,14 @@ async def admin_get_applications_list(
     sort_order: str = "asc",
     skip: int = 0,
     limit: int = 20,
+    cursor: str | None = None,
 ) -> dict:
     """
     Get paginated list of applications for admin dashboard.
 
     Wraps repository function with parameter validation and response formatting.
+    Pass the previous response's next_cursor as ``cursor`` to page by keyset,
+    which costs the same at any depth; ``skip`` is kept for older clients.
 
     Args:
         db: Database session
@@ -1248,21 +1565,35 @@ async def admin_get_applications_list(
         search: Search term for school name/emails
         sort_by: Column to sort by
         sort_order: Sort direction (asc/desc)
-        skip: Records to skip for pagination
+        skip: Records to skip for pagination (deprecated; ignored with a cursor)
         limit: Maximum records to return
+        cursor: Opaque cursor from a previous page's next_cursor
 
     Returns:
-        Dict with applications list, total count, skip, and limit
+        Dict with applications list, total count, skip, limit, and next_cursor
+        (None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor can't be decoded
     """
     logger.info(
-        f"Admin listing applications: status={status}, country={country_code}, "
-        f"search={search}, sort={sort_by}:{sort_order}, skip={skip}, limit={limit}"
+        "Admin listing applications: status=%s, country=%s, "
+        "search=%s, sort=%s:%s, skip=%s, limit=%s",
+        status,
+        country_code,
+        search,
+        sort_by,
+        sort_order,
+        skip,
+        limit,
     )
 
     # Validate and cap limit
     limit = min(max(1, limit), 100)
     skip = max(0, skip)
 
+    after = _decode_list_cursor(cursor, sort_by) if cursor else None
+
     applications, total = await repository.get_applications_for_admin(
         db,
         status=status,
@@ -1272,15 +1603,19 @@ async def admin_get_applications_list(
         sort_order=sort_order,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
-    logger.info(f"Found {total} applications, returning {len(applications)}")
+    logger.info("Found %s applications, returning %s", total, len(applications))
 
     return {
         "applications": applications,
         "total": total,
         "skip": skip,
         "limit": limit,
+        "next_cursor": (
+            _encode_list_cursor(applications[-1], sort_by) if len(applications) == limit else None
+        ),
     }
 
 
@@ -1294,7 +1629,7 @@ async def admin_get_dashboard_stats(db: AsyncSession) -> dict:
     """
     logger.info("Getting dashboard stats")
     stats = await repository.get_dashboard_stats(db)
-    logger.info(f"Dashboard stats: {stats}")
+    logger.info("Dashboard stats: %s", stats)
     return stats
 
 
@@ -1318,17 +1653,39 @@ async def admin_get_application_detail(
     Raises:
         ApplicationNotFoundError: If application doesn't exist
     """
-    logger.info(f"Admin getting application detail: {application_id}")
+    logger.info("Admin getting application detail: %s", application_id)
 
     application = await repository.get_by_id(db, application_id)
 
     if not application:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise ApplicationNotFoundError(application_id)
 
     return application
 
 
+async def _get_status_or_raise_not_found(
+    db: AsyncSession, application_id: UUID
+) -> ApplicationStatus:
+    """
+    Explain why a conditional status update matched nothing.
+
+    Only called on that miss path, so the extra lookup stays off the
+    happy path.
+
+    Returns:
+        The application's current status
+
+    Raises:
+        ApplicationNotFoundError: If application doesn't exist
+    """
+    current_status = await repository.get_status(db, application_id)
+    if current_status is None:
+        logger.warning("Application not found: %s", application_id)
+        raise ApplicationNotFoundError(application_id)
+    return current_status
+
+
 async def admin_start_review(
     db: AsyncSession,
     application_id: UUID,
@@ -1352,28 +1709,31 @@ async def admin_start_review(
         ApplicationNotFoundError: If application doesn't exist
         CannotReviewApplicationError: If application not in reviewable status
     """
-    logger.info(f"Admin {admin_id} starting review of application {application_id}")
-
-    application = await repository.get_by_id(db, application_id)
+    logger.info("Admin %s starting review of application %s", admin_id, application_id)
 
-    if not application:
-        logger.warning(f"Application not found: {application_id}")
-        raise ApplicationNotFoundError(application_id)
+    # Check the status and update in one statement
+    updated = await repository.conditional_update_status(
+        db,
+        application_id,
+        REVIEWABLE_STATUSES,
+        ApplicationStatus.UNDER_REVIEW,
+        reviewed_by=admin_id,
+        reviewed_at=datetime.now(UTC),
+    )
+    _invalidate_cached_status(application_id)
 
-    if application.status not in REVIEWABLE_STATUSES:
+    if updated is None:
+        current_status = await _get_status_or_raise_not_found(db, application_id)
         logger.warning(
-            f"Cannot review application {application_id}: "
-            f"status={application.status} not in {REVIEWABLE_STATUSES}"
+            "Cannot review application %s: status=%s not in %s",
+            application_id,
+            current_status,
+            REVIEWABLE_STATUSES,
         )
-        raise CannotReviewApplicationError(application.status.value)
+        raise CannotReviewApplicationError(current_status.value)
 
-    try:
-        updated = await repository.update_application_for_review(db, application_id, admin_id)
-        logger.info(f"Application {application_id} now under review by {admin_id}")
-        return updated
-    except repository.InvalidStatusTransitionError as e:
-        logger.error(f"Status transition error: {e}")
-        raise CannotReviewApplicationError(application.status.value) from e
+    logger.info("Application %s now under review by %s", application_id, admin_id)
+    return updated
 
 
 async def admin_request_more_info(
@@ -1401,54 +1761,42 @@ async def admin_request_more_info(
         ApplicationNotFoundError: If application doesn't exist
         CannotDecideApplicationError: If application not in decidable status
     """
-    from app.core.email import send_more_info_requested
+    logger.info("Admin %s requesting more info for application %s", admin_id, application_id)
 
-    logger.info(f"Admin {admin_id} requesting more info for application {application_id}")
-
-    application = await repository.get_by_id(db, application_id)
-
-    if not application:
-        logger.warning(f"Application not found: {application_id}")
-        raise ApplicationNotFoundError(application_id)
+    # Check the status and update in one statement
+    updated = await repository.conditional_update_status(
+        db,
+        application_id,
+        DECIDABLE_STATUSES,
+        ApplicationStatus.MORE_INFO_REQUESTED,
+        decision_reason=message,
+        reviewed_by=admin_id,
+        reviewed_at=datetime.now(UTC),
+    )
+    _invalidate_cached_status(application_id)
 
-    if application.status not in DECIDABLE_STATUSES:
+    if updated is None:
+        current_status = await _get_status_or_raise_not_found(db, application_id)
         logger.warning(
-            f"Cannot request info for application {application_id}: status={application.status}"
-        )
-        raise CannotDecideApplicationError(application.status.value, "request info from")
-
-    try:
-        updated = await repository.update_application_decision(
-            db,
-            application_id,
-            ApplicationStatus.MORE_INFO_REQUESTED,
-            decision_reason=message,
-            reviewed_by=admin_id,
+            "Cannot request info for application %s: status=%s", application_id, current_status
         )
-        logger.info(f"Application {application_id} status updated to more_info_requested")
+        raise CannotDecideApplicationError(current_status.value, "request info from")
 
-        # Send email to applicant (non-blocking)
-        try:
-            applicant_email = get_effective_applicant_email_from_model(application)
-            applicant_name = get_effective_applicant_name_from_model(application)
+    logger.info("Application %s status updated to more_info_requested", application_id)
 
-            await send_more_info_requested(
-                to_email=applicant_email,
-                applicant_name=applicant_name,
-                school_name=application.school_name,
-                admin_message=message,
-                application_id=str(application_id),
-            )
-            logger.info(f"Sent more info request email to {applicant_email}")
-        except Exception as e:
-            logger.error(f"Failed to send more info request email: {e}", exc_info=True)
-            # Don't fail the request - email is non-critical
-
-        return updated
+    # Send email to applicant in the background - email is non-critical
+    _dispatch_email(
+        send_more_info_requested(
+            to_email=get_effective_applicant_email_from_model(updated),
+            applicant_name=get_effective_applicant_name_from_model(updated),
+            school_name=updated.school_name,
+            admin_message=message,
+            application_id=str(application_id),
+        ),
+        f"more info request email for application {application_id}",
+    )
 
-    except repository.InvalidStatusTransitionError as e:
-        logger.error(f"Status transition error: {e}")
-        raise CannotDecideApplicationError(application.status.value, "request info from") from e
+    return updated
 
 
 async def admin_add_internal_note(
@@ -1475,17 +1823,17 @@ async def admin_add_internal_note(
     Raises:
         ApplicationNotFoundError: If application doesn't exist
     """
-    logger.info(f"Admin {admin_id} adding note to application {application_id}")
+    logger.info("Admin %s adding note to application %s", admin_id, application_id)
 
     application = await repository.get_by_id(db, application_id)
 
     if not application:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise ApplicationNotFoundError(application_id)
 
     new_note = await repository.add_internal_note(db, application_id, note, admin_id)
 
-    logger.info(f"Note added to application {application_id}")
+    logger.info("Note added to application %s", application_id)
     return new_note
 
 
@@ -1494,6 +1842,7 @@ async def admin_reject_application(
     application_id: UUID,
     admin_id: UUID,
     reason: str,
+    redis_client: Redis | None = None,
 ) -> SchoolApplication:
     """
     Reject an application.
@@ -1506,6 +1855,7 @@ async def admin_reject_application(
         application_id: UUID of the application
         admin_id: UUID of the admin rejecting
         reason: Detailed reason for rejection
+        redis_client: Redis client for the duplicate cache (optional)
 
     Returns:
         Updated SchoolApplication
@@ -1514,57 +1864,77 @@ async def admin_reject_application(
         ApplicationNotFoundError: If application doesn't exist
         CannotDecideApplicationError: If application not in decidable status
     """
-    from app.core.email import send_application_rejected
+    logger.info("Admin %s rejecting application %s", admin_id, application_id)
 
-    logger.info(f"Admin {admin_id} rejecting application {application_id}")
+    # Check the status and update in one statement
+    updated = await repository.conditional_update_status(
+        db,
+        application_id,
+        DECIDABLE_STATUSES,
+        ApplicationStatus.REJECTED,
+        decision_reason=reason,
+        reviewed_by=admin_id,
+        reviewed_at=datetime.now(UTC),
+    )
+    _invalidate_cached_status(application_id)
+
+    if updated is None:
+        current_status = await _get_status_or_raise_not_found(db, application_id)
+        logger.warning("Cannot reject application %s: status=%s", application_id, current_status)
+        raise CannotDecideApplicationError(current_status.value, "reject")
+
+    logger.info("Application %s rejected", application_id)
+    await forget_duplicate_rejections(redis_client, updated)
+
+    # Send rejection email in the background - email is non-critical
+    _dispatch_email(
+        send_application_rejected(
+            to_email=get_effective_applicant_email_from_model(updated),
+            applicant_name=get_effective_applicant_name_from_model(updated),
+            school_name=updated.school_name,
+            rejection_reason=reason,
+        ),
+        f"rejection email for application {application_id}",
+    )
 
-    application = await repository.get_by_id(db, application_id)
+    return updated
 
-    if not application:
-        logger.warning(f"Application not found: {application_id}")
-        raise ApplicationNotFoundError(application_id)
 
-    if application.status not in DECIDABLE_STATUSES:
-        logger.warning(f"Cannot reject application {application_id}: status={application.status}")
-        raise CannotDecideApplicationError(application.status.value, "reject")
+async def _send_welcome_email(send: Awaitable[bool], application_id: UUID, admin_id: UUID) -> bool:
+    """
+    Send the approval welcome email, noting a failure on the application.
 
-    try:
-        updated = await repository.update_application_decision(
-            db,
-            application_id,
-            ApplicationStatus.REJECTED,
-            decision_reason=reason,
-            reviewed_by=admin_id,
-        )
-        logger.info(f"Application {application_id} rejected")
+    Runs in the background after the request has returned, so the internal
+    note is written with its own session. Failing to send doesn't undo the
+    approval - the school exists and the admin can request a password reset.
 
-        # Send rejection email (non-blocking)
-        try:
-            applicant_email = get_effective_applicant_email_from_model(application)
-            applicant_name = get_effective_applicant_name_from_model(application)
+    Returns:
+        True if the email was sent
+    """
+    try:
+        if await send:
+            return True
+        error = "email provider did not accept the message"
+    except Exception as e:
+        error = str(e)
 
-            await send_application_rejected(
-                to_email=applicant_email,
-                applicant_name=applicant_name,
-                school_name=application.school_name,
-                rejection_reason=reason,
+    # Add internal note about email failure (best effort, ignore failures)
+    with contextlib.suppress(Exception):
+        async with async_session_maker() as session:
+            await repository.add_internal_note(
+                session,
+                application_id,
+                f"SYSTEM: Welcome email failed to send. Error: {error}",
+                admin_id,
             )
-            logger.info(f"Sent rejection email to {applicant_email}")
-        except Exception as e:
-            logger.error(f"Failed to send rejection email: {e}", exc_info=True)
-            # Don't fail the request - email is non-critical
-
-        return updated
-
-    except repository.InvalidStatusTransitionError as e:
-        logger.error(f"Status transition error: {e}")
-        raise CannotDecideApplicationError(application.status.value, "reject") from e
+    return False
 
 
 async def admin_approve_application(
     db: AsyncSession,
     application_id: UUID,
     admin_id: UUID,
+    redis_client: Redis | None = None,
 ) -> dict:
     """
     Approve an application and provision the school.
@@ -1583,6 +1953,7 @@ async def admin_approve_application(
         db: Database session
         application_id: UUID of the application
         admin_id: UUID of the admin approving
+        redis_client: Redis client for the duplicate cache (optional)
 
     Returns:
         Dict with application_id, school_id, admin_user_id, message
@@ -1592,23 +1963,19 @@ async def admin_approve_application(
         CannotDecideApplicationError: If application not in decidable status
         SchoolProvisioningError: If school creation fails
     """
-    from app.core.email import send_application_approved
-
-    logger.info(f"Admin {admin_id} approving application {application_id}")
-
     application = await repository.get_by_id(db, application_id)
 
     if not application:
-        logger.warning(f"Application not found: {application_id}")
+        logger.warning("Application not found: %s", application_id)
         raise ApplicationNotFoundError(application_id)
 
     if application.status not in DECIDABLE_STATUSES:
-        logger.warning(f"Cannot approve application {application_id}: status={application.status}")
+        logger.warning(
+            "Cannot approve application %s: status=%s", application_id, application.status
+        )
         raise CannotDecideApplicationError(application.status.value, "approve")
 
     # Determine who becomes the school admin
-    from app.modules.school_applications.models import AdminChoice
-
     if application.applicant_is_principal or application.admin_choice == AdminChoice.PRINCIPAL:
         admin_name = application.principal_name
         admin_email = application.principal_email
@@ -1619,23 +1986,16 @@ async def admin_approve_application(
     # Generate secure temporary password (24 bytes = 32 chars URL-safe)
     temp_password = secrets.token_urlsafe(24)
 
+    # Hash it on a worker thread (Argon2 is CPU-bound) while the school
+    # insert is in flight; it's awaited just before the user insert
+    hash_task = asyncio.create_task(asyncio.to_thread(hash_password, temp_password))
+
     try:
         # ============================================
         # ATOMIC TRANSACTION: All DB operations must succeed
         # ============================================
-        from app.core.security import hash_password
-        from app.modules.schools.repository import SchoolRepository
-        from app.modules.users.models import UserRole
-        from app.modules.users.repository import UserRepository
-
-        # Check if admin email already exists (prevent duplicate accounts)
-        existing_user = await UserRepository.get_by_email(db, admin_email)
-        if existing_user:
-            logger.warning(f"User with email {admin_email} already exists")
-            raise SchoolProvisioningError(
-                f"A user with email {admin_email} already exists. "
-                "Please contact support or use a different email."
-            )
+        # Every write below runs in the session's open transaction and is
+        # committed once, by the final status update
 
         # Parse admin name into first/last name
         name_parts = admin_name.split(" ", 1)
@@ -1661,12 +2021,11 @@ async def admin_approve_application(
             application_id=str(application_id),
         )
 
-        logger.info(f"Created school: {school.id} - {school.name}")
-
-        # Create the admin user with hashed temp password
-        hashed_password = hash_password(temp_password)
+        # Create the admin user with the hashed temp password
+        hashed_password = await hash_task
 
-        admin_user = await UserRepository.create(
+        # Insert unless the email is taken (prevent duplicate accounts)
+        admin_user = await UserRepository.create_if_email_available(
             db,
             email=admin_email,
             password_hash=hashed_password,
@@ -1678,20 +2037,37 @@ async def admin_approve_application(
             is_verified=True,
             must_change_password=True,
         )
+        if admin_user is None:
+            logger.warning("User with email %s already exists", admin_email)
+            raise SchoolProvisioningError(
+                f"A user with email {admin_email} already exists. "
+                "Please contact support or use a different email."
+            )
 
-        logger.info(f"Created admin user: {admin_user.id} - {admin_user.email}")
-
-        # Update application status to APPROVED
-        await repository.update_application_decision(
+        # Update application status to APPROVED and commit, unless another
+        # decision landed since the status check above
+        updated = await repository.conditional_update_status(
             db,
             application_id,
+            DECIDABLE_STATUSES,
             ApplicationStatus.APPROVED,
             reviewed_by=admin_id,
+            reviewed_at=datetime.now(UTC),
         )
+        _invalidate_cached_status(application_id)
+        if updated is None:
+            await db.rollback()
+            current_status = await _get_status_or_raise_not_found(db, application_id)
+            raise CannotDecideApplicationError(current_status.value, "approve")
 
+        # One entry for the whole happy path (warnings and errors log as they happen)
         logger.info(
-            f"Application {application_id} approved. "
-            f"School ID: {school.id}, Admin User ID: {admin_user.id}"
+            "Admin %s approved application %s. School ID: %s, Admin User ID: %s (%s)",
+            admin_id,
+            application_id,
+            school.id,
+            admin_user.id,
+            admin_email,
         )
 
         # ============================================
@@ -1700,32 +2076,23 @@ async def admin_approve_application(
 
         school_id = school.id
         admin_user_id = admin_user.id
-
-        # Send welcome email with credentials (outside transaction)
-        try:
-            await send_application_approved(
-                to_email=admin_email,
-                admin_name=admin_name,
-                school_name=application.school_name,
-                admin_email=admin_email,
-                temp_password=temp_password,
-            )
-            logger.info(f"Sent welcome email to {admin_email}")
-        except Exception as e:
-            logger.error(
-                f"Failed to send welcome email: {e}. "
-                f"School {school_id} was created but email failed.",
-                exc_info=True,
-            )
-            # Don't fail - school is created, admin can request password reset
-            # Add internal note about email failure (best effort, ignore failures)
-            with contextlib.suppress(Exception):
-                await repository.add_internal_note(
-                    db,
-                    application_id,
-                    f"SYSTEM: Welcome email failed to send. Error: {str(e)}",
-                    admin_id,
-                )
+        await forget_duplicate_rejections(redis_client, updated)
+
+        # Send welcome email with credentials in the background (outside transaction)
+        _dispatch_email(
+            _send_welcome_email(
+                send_application_approved(
+                    to_email=admin_email,
+                    admin_name=admin_name,
+                    school_name=application.school_name,
+                    admin_email=admin_email,
+                    temp_password=temp_password,
+                ),
+                application_id,
+                admin_id,
+            ),
+            f"welcome email for application {application_id} (school {school_id})",
+        )
 
         return {
             "id": application_id,
@@ -1734,13 +2101,15 @@ async def admin_approve_application(
             "message": "Application approved. School and admin account created successfully.",
         }
 
-    except repository.InvalidStatusTransitionError as e:
-        logger.error(f"Status transition error during approval: {e}")
-        raise CannotDecideApplicationError(application.status.value, "approve") from e
+    except (ApplicationNotFoundError, CannotDecideApplicationError):
+        raise
     except Exception as e:
-        logger.error(f"School provisioning failed: {e}", exc_info=True)
-        # Add internal note about failure (best effort, ignore failures)
+        hash_task.cancel()
+        logger.error("School provisioning failed: %s", e, exc_info=True)
+        # Discard the uncommitted school/user rows, then add an internal note
+        # about the failure (best effort, ignore failures)
         with contextlib.suppress(Exception):
+            await db.rollback()
             await repository.add_internal_note(
                 db,
                 application_id,
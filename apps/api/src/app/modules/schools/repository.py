@@ -8,6 +8,7 @@ import logging
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.schools.models import School, SchoolStatus
@@ -60,30 +61,32 @@ class SchoolRepository:
         Returns:
             Created School instance
         """
-        school = School(
-            name=name,
-            year_established=year_established,
-            school_type=school_type,
-            student_population=student_population,
-            country_code=country_code,
-            city=city,
-            address=address,
-            principal_name=principal_name,
-            principal_email=principal_email,
-            principal_phone=principal_phone,
-            phone=phone,
-            email=email,
-            online_presence=online_presence,
-            application_id=application_id,
-            status=SchoolStatus.ACTIVE,
-            is_active=True,
+        # RETURNING hands back server-generated columns without a refresh SELECT
+        stmt = (
+            pg_insert(School)
+            .values(
+                name=name,
+                year_established=year_established,
+                school_type=school_type,
+                student_population=student_population,
+                country_code=country_code,
+                city=city,
+                address=address,
+                principal_name=principal_name,
+                principal_email=principal_email,
+                principal_phone=principal_phone,
+                phone=phone,
+                email=email,
+                online_presence=online_presence,
+                application_id=application_id,
+                status=SchoolStatus.ACTIVE,
+                is_active=True,
+            )
+            .returning(School)
         )
+        school = (await db.scalars(stmt)).one()
 
-        db.add(school)
-        await db.flush()
-        await db.refresh(school)
-
-        logger.info(f"Created school: {school.id} - {school.name}")
+        logger.info("Created school: %s - %s", school.id, school.name)
         return school
 
     @staticmethod
@@ -145,5 +148,5 @@ class SchoolRepository:
         await db.flush()
         await db.refresh(school)
 
-        logger.info(f"Updated school {school_id} status to {status.value}")
+        logger.info("Updated school %s status to %s", school_id, status.value)
         return school
@@ -8,6 +8,7 @@ import logging
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.users.models import User, UserRole
@@ -69,7 +70,59 @@ class UserRepository:
         await db.flush()
         await db.refresh(user)
 
-        logger.info(f"Created user: {user.id} - {user.email} ({user.role.value})")
+        logger.info("Created user: %s - %s (%s)", user.id, user.email, user.role.value)
+        return user
+
+    @staticmethod
+    async def create_if_email_available(
+        db: AsyncSession,
+        *,
+        email: str,
+        password_hash: str,
+        first_name: str,
+        last_name: str,
+        role: UserRole,
+        school_id: str | None = None,
+        phone: str | None = None,
+        is_active: bool = True,
+        is_verified: bool = False,
+        must_change_password: bool = False,
+    ) -> User | None:
+        """
+        Create a new user record unless the email is already registered.
+
+        The uniqueness check and the insert are one INSERT ... ON CONFLICT
+        DO NOTHING RETURNING statement, so there is no separate lookup and
+        no window for a concurrent signup to take the email in between.
+        Nothing is committed; the caller owns the transaction.
+
+        Args:
+            Same as create()
+
+        Returns:
+            Created User instance, or None if the email is taken
+        """
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                first_name=first_name,
+                last_name=last_name,
+                role=role,
+                school_id=school_id,
+                phone=phone,
+                is_active=is_active,
+                is_verified=is_verified,
+                must_change_password=must_change_password,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        user = (await db.scalars(stmt)).one_or_none()
+
+        if user is not None:
+            logger.info("Created user: %s - %s (%s)", user.id, user.email, user.role.value)
         return user
 
     @staticmethod
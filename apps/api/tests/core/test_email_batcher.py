@@ -0,0 +1,138 @@
+"""
+Unit tests for the email batcher.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+import resend
+
+from app.core import email_batcher
+
+
+def _params(to: str) -> resend.Emails.SendParams:
+    return {"from": "noreply@test.com", "to": [to], "subject": "Hello", "html": "<p>Hi</p>"}
+
+
+@pytest.fixture
+async def batcher():
+    """Run the batcher for one test and stop it afterwards."""
+    email_batcher.start_email_batcher()
+    yield
+    await email_batcher.stop_email_batcher()
+
+
+class TestEmailBatcher:
+    """Tests for enqueue_email batching."""
+
+    @pytest.mark.usefixtures("batcher")
+    async def test_single_send_uses_single_endpoint(self):
+        """A lone email goes to the single-email endpoint."""
+        with (
+            patch.object(resend.Emails, "send", return_value={"id": "email-1"}) as send,
+            patch.object(resend.Batch, "send") as batch_send,
+        ):
+            result = await email_batcher.enqueue_email(_params("a@test.com"))
+
+        assert result == "email-1"
+        send.assert_called_once()
+        batch_send.assert_not_called()
+
+    @pytest.mark.usefixtures("batcher")
+    async def test_concurrent_sends_go_out_as_one_batch(self):
+        """Emails queued within the window share one batch request."""
+        with (
+            patch.object(resend.Emails, "send") as send,
+            patch.object(
+                resend.Batch,
+                "send",
+                return_value={"data": [{"id": "email-1"}, {"id": "email-2"}]},
+            ) as batch_send,
+        ):
+            results = await asyncio.gather(
+                email_batcher.enqueue_email(_params("a@test.com")),
+                email_batcher.enqueue_email(_params("b@test.com")),
+            )
+
+        assert results == ["email-1", "email-2"]
+        batch_send.assert_called_once()
+        assert len(batch_send.call_args.args[0]) == 2
+        send.assert_not_called()
+
+    @pytest.mark.usefixtures("batcher")
+    async def test_rejected_batch_is_retried_one_by_one(self):
+        """A batch rejected as invalid falls back to single sends."""
+
+        def send_one(params):
+            if params["to"] == ["bad"]:
+                raise resend.exceptions.ValidationError(
+                    "Invalid `to` field", "validation_error", 422
+                )
+            return {"id": f"id-{params['to'][0]}"}
+
+        with (
+            patch.object(resend.Emails, "send", side_effect=send_one) as send,
+            patch.object(
+                resend.Batch,
+                "send",
+                side_effect=resend.exceptions.ValidationError(
+                    "Invalid `to` field", "validation_error", 422
+                ),
+            ),
+        ):
+            results = await asyncio.gather(
+                email_batcher.enqueue_email(_params("a@test.com")),
+                email_batcher.enqueue_email(_params("bad")),
+                return_exceptions=True,
+            )
+
+        assert results[0] == "id-a@test.com"
+        assert isinstance(results[1], resend.exceptions.ValidationError)
+        assert send.call_count == 2
+
+    @pytest.mark.usefixtures("batcher")
+    async def test_other_batch_errors_fail_every_email(self):
+        """A batch error that may have been accepted is not retried."""
+        with (
+            patch.object(resend.Emails, "send") as send,
+            patch.object(
+                resend.Batch,
+                "send",
+                side_effect=resend.exceptions.ApplicationError(
+                    "Server error", "application_error", 500
+                ),
+            ),
+        ):
+            results = await asyncio.gather(
+                email_batcher.enqueue_email(_params("a@test.com")),
+                email_batcher.enqueue_email(_params("b@test.com")),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, resend.exceptions.ApplicationError) for r in results)
+        send.assert_not_called()
+
+    async def test_stop_finishes_in_flight_send(self):
+        """Stopping waits for a send already in progress instead of cancelling it."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_send(_params):
+            started.set()
+            release.wait(timeout=5)
+            return {"id": "email-1"}
+
+        email_batcher.start_email_batcher()
+        with patch.object(resend.Emails, "send", side_effect=slow_send):
+            pending = asyncio.create_task(email_batcher.enqueue_email(_params("a@test.com")))
+            await asyncio.to_thread(started.wait, 5)
+
+            stopping = asyncio.create_task(email_batcher.stop_email_batcher())
+            await asyncio.sleep(0)
+            release.set()
+            await stopping
+
+            assert await pending == "email-1"
+        assert not email_batcher.is_running()
@@ -48,6 +48,7 @@ def mock_redis():
     redis.incr = AsyncMock()
     redis.expire = AsyncMock()
     redis.ttl = AsyncMock(return_value=3600)
+    redis.evalsha = AsyncMock(return_value=None)
     redis.pipeline = MagicMock()
     pipe = AsyncMock()
     pipe.incr = MagicMock()
@@ -208,7 +209,7 @@ def sample_verification_token():
     token = MagicMock(spec=VerificationToken)
     token.id = uuid4()
     token.application_id = uuid4()
-    token.token = "hashed_token_value"
+    token.token_hash = b"hashed_token_value"
     token.token_type = TokenType.APPLICANT_VERIFICATION
     token.expires_at = datetime.now(UTC) + timedelta(hours=72)
     token.used_at = None
@@ -222,7 +223,7 @@ def sample_principal_token():
     token = MagicMock(spec=VerificationToken)
     token.id = uuid4()
     token.application_id = uuid4()
-    token.token = "hashed_principal_token"
+    token.token_hash = b"hashed_principal_token"
     token.token_type = TokenType.PRINCIPAL_CONFIRMATION
     token.expires_at = datetime.now(UTC) + timedelta(hours=72)
     token.used_at = None
@@ -236,7 +237,7 @@ def expired_token():
     token = MagicMock(spec=VerificationToken)
     token.id = uuid4()
     token.application_id = uuid4()
-    token.token = "expired_token_hash"
+    token.token_hash = b"expired_token_hash"
     token.token_type = TokenType.APPLICANT_VERIFICATION
     token.expires_at = datetime.now(UTC) - timedelta(hours=1)  # Expired
     token.used_at = None
@@ -250,7 +251,7 @@ def used_token():
     token = MagicMock(spec=VerificationToken)
     token.id = uuid4()
     token.application_id = uuid4()
-    token.token = "used_token_hash"
+    token.token_hash = b"used_token_hash"
     token.token_type = TokenType.APPLICANT_VERIFICATION
     token.expires_at = datetime.now(UTC) + timedelta(hours=72)
     token.used_at = datetime.now(UTC) - timedelta(hours=1)  # Already used
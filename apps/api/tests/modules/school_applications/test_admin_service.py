@@ -28,6 +28,8 @@ from app.modules.school_applications.service import (
     ApplicationNotFoundError,
     CannotDecideApplicationError,
     CannotReviewApplicationError,
+    InvalidCursorError,
+    SchoolProvisioningError,
     admin_add_internal_note,
     admin_approve_application,
     admin_get_application_detail,
@@ -36,6 +38,7 @@ from app.modules.school_applications.service import (
     admin_reject_application,
     admin_request_more_info,
     admin_start_review,
+    drain_pending_emails,
 )
 
 # ============================================
@@ -194,9 +197,40 @@ async def test_admin_get_applications_list_with_filters(mock_db):
             sort_order="desc",
             skip=10,
             limit=50,
+            after=None,
         )
 
 
+@pytest.mark.asyncio
+async def test_admin_get_applications_list_cursor_round_trip(mock_db):
+    """A full page returns a cursor that resumes after its last row."""
+    last_row = {"id": uuid4(), "school_name": "Alpha | Beta Academy"}
+    with patch("app.modules.school_applications.service.repository") as mock_repo:
+        mock_repo.get_applications_for_admin = AsyncMock(return_value=([last_row], 5))
+
+        first = await admin_get_applications_list(mock_db, sort_by="school_name", limit=1)
+        await admin_get_applications_list(
+            mock_db, sort_by="school_name", limit=1, cursor=first["next_cursor"]
+        )
+
+        assert mock_repo.get_applications_for_admin.call_args.kwargs["after"] == (
+            "Alpha | Beta Academy",
+            last_row["id"],
+        )
+
+
+@pytest.mark.asyncio
+async def test_admin_get_applications_list_invalid_cursor(mock_db):
+    """A malformed cursor is rejected before querying."""
+    with patch("app.modules.school_applications.service.repository") as mock_repo:
+        mock_repo.get_applications_for_admin = AsyncMock(return_value=([], 0))
+
+        with pytest.raises(InvalidCursorError):
+            await admin_get_applications_list(mock_db, cursor="not-a-cursor")
+
+        mock_repo.get_applications_for_admin.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_admin_get_applications_list_limit_cap(mock_db):
     """Test that limit is capped at 100."""
@@ -270,9 +304,7 @@ async def test_admin_get_application_detail_not_found(mock_db, application_id):
 
 
 @pytest.mark.asyncio
-async def test_admin_start_review_success(
-    mock_db, application_id, admin_id, sample_pending_application
-):
+async def test_admin_start_review_success(mock_db, application_id, admin_id):
     """Test successful start of review."""
     updated_app = MagicMock(spec=SchoolApplication)
     updated_app.id = application_id
@@ -281,14 +313,15 @@ async def test_admin_start_review_success(
     updated_app.reviewed_at = datetime.now(UTC)
 
     with patch("app.modules.school_applications.service.repository") as mock_repo:
-        mock_repo.get_by_id = AsyncMock(return_value=sample_pending_application)
-        mock_repo.update_application_for_review = AsyncMock(return_value=updated_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=updated_app)
 
         result = await admin_start_review(mock_db, application_id, admin_id)
 
         assert result.status == ApplicationStatus.UNDER_REVIEW
         assert result.reviewed_by == admin_id
-        mock_repo.update_application_for_review.assert_called_once()
+        mock_repo.conditional_update_status.assert_called_once()
+        # Status check and update happen in one statement - no separate read
+        mock_repo.get_status.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -297,7 +330,8 @@ async def test_admin_start_review_wrong_status(
 ):
     """Test error when application is not in pending_review status."""
     with patch("app.modules.school_applications.service.repository") as mock_repo:
-        mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
+        mock_repo.conditional_update_status = AsyncMock(return_value=None)
+        mock_repo.get_status = AsyncMock(return_value=sample_under_review_application.status)
 
         with pytest.raises(CannotReviewApplicationError):
             await admin_start_review(mock_db, application_id, admin_id)
@@ -307,7 +341,8 @@ async def test_admin_start_review_wrong_status(
 async def test_admin_start_review_not_found(mock_db, application_id, admin_id):
     """Test error when application doesn't exist."""
     with patch("app.modules.school_applications.service.repository") as mock_repo:
-        mock_repo.get_by_id = AsyncMock(return_value=None)
+        mock_repo.conditional_update_status = AsyncMock(return_value=None)
+        mock_repo.get_status = AsyncMock(return_value=None)
 
         with pytest.raises(ApplicationNotFoundError):
             await admin_start_review(mock_db, application_id, admin_id)
@@ -319,9 +354,7 @@ async def test_admin_start_review_not_found(mock_db, application_id, admin_id):
 
 
 @pytest.mark.asyncio
-async def test_admin_request_more_info_success(
-    mock_db, application_id, admin_id, sample_under_review_application
-):
+async def test_admin_request_more_info_success(mock_db, application_id, admin_id):
     """Test successful request for more information."""
     updated_app = MagicMock(spec=SchoolApplication)
     updated_app.id = application_id
@@ -331,12 +364,11 @@ async def test_admin_request_more_info_success(
     with (
         patch("app.modules.school_applications.service.repository") as mock_repo,
         patch(
-            "app.core.email.send_more_info_requested",
+            "app.modules.school_applications.service.send_more_info_requested",
             new_callable=AsyncMock,
         ) as mock_email,
     ):
-        mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
-        mock_repo.update_application_decision = AsyncMock(return_value=updated_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=updated_app)
         mock_email.return_value = True
 
         result = await admin_request_more_info(
@@ -347,7 +379,7 @@ async def test_admin_request_more_info_success(
         )
 
         assert result.status == ApplicationStatus.MORE_INFO_REQUESTED
-        mock_repo.update_application_decision.assert_called_once()
+        mock_repo.conditional_update_status.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -361,7 +393,8 @@ async def test_admin_request_more_info_wrong_status(mock_db, application_id, adm
     approved_app.principal_name = "John Principal"
 
     with patch("app.modules.school_applications.service.repository") as mock_repo:
-        mock_repo.get_by_id = AsyncMock(return_value=approved_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=None)
+        mock_repo.get_status = AsyncMock(return_value=approved_app.status)
 
         with pytest.raises(CannotDecideApplicationError):
             await admin_request_more_info(
@@ -425,9 +458,7 @@ async def test_admin_add_internal_note_not_found(mock_db, application_id, admin_
 
 
 @pytest.mark.asyncio
-async def test_admin_reject_application_success(
-    mock_db, application_id, admin_id, sample_under_review_application
-):
+async def test_admin_reject_application_success(mock_db, application_id, admin_id):
     """Test successful rejection of application."""
     rejected_app = MagicMock(spec=SchoolApplication)
     rejected_app.id = application_id
@@ -437,12 +468,11 @@ async def test_admin_reject_application_success(
     with (
         patch("app.modules.school_applications.service.repository") as mock_repo,
         patch(
-            "app.core.email.send_application_rejected",
+            "app.modules.school_applications.service.send_application_rejected",
             new_callable=AsyncMock,
         ) as mock_email,
     ):
-        mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
-        mock_repo.update_application_decision = AsyncMock(return_value=rejected_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=rejected_app)
         mock_email.return_value = True
 
         result = await admin_reject_application(
@@ -460,7 +490,8 @@ async def test_admin_reject_application_success(
 async def test_admin_reject_application_not_found(mock_db, application_id, admin_id):
     """Test error when application doesn't exist."""
     with patch("app.modules.school_applications.service.repository") as mock_repo:
-        mock_repo.get_by_id = AsyncMock(return_value=None)
+        mock_repo.conditional_update_status = AsyncMock(return_value=None)
+        mock_repo.get_status = AsyncMock(return_value=None)
 
         with pytest.raises(ApplicationNotFoundError):
             await admin_reject_application(
@@ -497,20 +528,19 @@ async def test_admin_approve_application_success(
     with (
         patch("app.modules.school_applications.service.repository") as mock_repo,
         patch(
-            "app.core.email.send_application_approved",
+            "app.modules.school_applications.service.send_application_approved",
             new_callable=AsyncMock,
         ) as mock_email,
-        patch("app.modules.users.repository.UserRepository") as mock_user_repo,
-        patch("app.modules.schools.repository.SchoolRepository") as mock_school_repo,
-        patch("app.core.security.hash_password") as mock_hash,
+        patch("app.modules.school_applications.service.UserRepository") as mock_user_repo,
+        patch("app.modules.school_applications.service.SchoolRepository") as mock_school_repo,
+        patch("app.modules.school_applications.service.hash_password") as mock_hash,
     ):
         mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
-        mock_repo.update_application_decision = AsyncMock(return_value=approved_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=approved_app)
         mock_email.return_value = True
 
         # Mock user/school provisioning
-        mock_user_repo.get_by_email = AsyncMock(return_value=None)  # No existing user
-        mock_user_repo.create = AsyncMock(return_value=mock_user)
+        mock_user_repo.create_if_email_available = AsyncMock(return_value=mock_user)
         mock_school_repo.create = AsyncMock(return_value=mock_school)
         mock_hash.return_value = "hashed_password"
 
@@ -526,7 +556,84 @@ async def test_admin_approve_application_success(
         assert "message" in result
         mock_email.assert_called_once()
         mock_school_repo.create.assert_called_once()
-        mock_user_repo.create.assert_called_once()
+        mock_user_repo.create_if_email_available.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_admin_approve_application_welcome_email_failure_adds_note(
+    mock_db, application_id, admin_id, sample_under_review_application
+):
+    """A failed welcome email doesn't fail approval; a note is added in its own session."""
+    approved_app = MagicMock(spec=SchoolApplication)
+    approved_app.id = application_id
+    approved_app.status = ApplicationStatus.APPROVED
+
+    mock_school = MagicMock()
+    mock_school.id = str(uuid4())
+    mock_school.name = "Test School"
+
+    mock_user = MagicMock()
+    mock_user.id = str(uuid4())
+
+    note_session = AsyncMock()
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__.return_value = note_session
+
+    with (
+        patch("app.modules.school_applications.service.repository") as mock_repo,
+        patch("app.modules.school_applications.service.async_session_maker", session_maker),
+        patch(
+            "app.modules.school_applications.service.send_application_approved",
+            new_callable=AsyncMock,
+        ) as mock_email,
+        patch("app.modules.school_applications.service.UserRepository") as mock_user_repo,
+        patch("app.modules.school_applications.service.SchoolRepository") as mock_school_repo,
+        patch("app.modules.school_applications.service.hash_password") as mock_hash,
+    ):
+        mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
+        mock_repo.conditional_update_status = AsyncMock(return_value=approved_app)
+        mock_repo.add_internal_note = AsyncMock()
+        mock_email.return_value = False
+
+        mock_user_repo.create_if_email_available = AsyncMock(return_value=mock_user)
+        mock_school_repo.create = AsyncMock(return_value=mock_school)
+        mock_hash.return_value = "hashed_password"
+
+        result = await admin_approve_application(mock_db, application_id, admin_id)
+        await drain_pending_emails()
+
+        assert result["id"] == application_id
+        mock_repo.add_internal_note.assert_awaited_once()
+        # The note is written with the background task's session, not the request's
+        assert mock_repo.add_internal_note.call_args.args[0] is note_session
+
+
+@pytest.mark.asyncio
+async def test_admin_approve_application_email_taken_rolls_back(
+    mock_db, application_id, admin_id, sample_under_review_application
+):
+    """An existing user with the admin email rolls back the school insert."""
+    mock_school = MagicMock()
+    mock_school.id = str(uuid4())
+
+    with (
+        patch("app.modules.school_applications.service.repository") as mock_repo,
+        patch("app.modules.school_applications.service.UserRepository") as mock_user_repo,
+        patch("app.modules.school_applications.service.SchoolRepository") as mock_school_repo,
+        patch("app.modules.school_applications.service.hash_password") as mock_hash,
+    ):
+        mock_repo.get_by_id = AsyncMock(return_value=sample_under_review_application)
+        mock_repo.conditional_update_status = AsyncMock()
+        mock_repo.add_internal_note = AsyncMock()
+        mock_user_repo.create_if_email_available = AsyncMock(return_value=None)
+        mock_school_repo.create = AsyncMock(return_value=mock_school)
+        mock_hash.return_value = "hashed_password"
+
+        with pytest.raises(SchoolProvisioningError, match="already exists"):
+            await admin_approve_application(mock_db, application_id, admin_id)
+
+        mock_db.rollback.assert_awaited_once()
+        mock_repo.conditional_update_status.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -603,20 +710,19 @@ async def test_admin_approve_non_principal_applicant(mock_db, application_id, ad
     with (
         patch("app.modules.school_applications.service.repository") as mock_repo,
         patch(
-            "app.core.email.send_application_approved",
+            "app.modules.school_applications.service.send_application_approved",
             new_callable=AsyncMock,
         ) as mock_email,
-        patch("app.modules.users.repository.UserRepository") as mock_user_repo,
-        patch("app.modules.schools.repository.SchoolRepository") as mock_school_repo,
-        patch("app.core.security.hash_password") as mock_hash,
+        patch("app.modules.school_applications.service.UserRepository") as mock_user_repo,
+        patch("app.modules.school_applications.service.SchoolRepository") as mock_school_repo,
+        patch("app.modules.school_applications.service.hash_password") as mock_hash,
     ):
         mock_repo.get_by_id = AsyncMock(return_value=app)
-        mock_repo.update_application_decision = AsyncMock(return_value=approved_app)
+        mock_repo.conditional_update_status = AsyncMock(return_value=approved_app)
         mock_email.return_value = True
 
         # Mock user/school provisioning
-        mock_user_repo.get_by_email = AsyncMock(return_value=None)  # No existing user
-        mock_user_repo.create = AsyncMock(return_value=mock_user)
+        mock_user_repo.create_if_email_available = AsyncMock(return_value=mock_user)
         mock_school_repo.create = AsyncMock(return_value=mock_school)
         mock_hash.return_value = "hashed_password"
 
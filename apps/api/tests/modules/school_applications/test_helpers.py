@@ -5,10 +5,14 @@ Unit tests for school applications helpers module.
 from unittest.mock import MagicMock
 
 from app.modules.school_applications.helpers import (
+    TOKEN_POOL_BATCH,
+    generate_secure_token,
     get_effective_applicant_email_from_model,
     get_effective_applicant_email_from_schema,
+    get_effective_applicant_from_schema,
     get_effective_applicant_name_from_model,
     get_effective_applicant_name_from_schema,
+    hash_token,
 )
 from app.modules.school_applications.models import AdminChoice, SchoolType, StudentPopulation
 from app.modules.school_applications.schemas import (
@@ -217,3 +221,138 @@ class TestGetEffectiveApplicantNameFromSchema:
 
         result = get_effective_applicant_name_from_schema(data)
         assert result == "Applicant Name"
+
+
+class TestGetEffectiveApplicantFromSchema:
+    """Tests for get_effective_applicant_from_schema."""
+
+    def test_returns_principal_details_when_applicant_is_principal(self):
+        """When applicant is principal, return principal email and name."""
+        data = SchoolApplicationCreate(
+            school=SchoolInfo(
+                name="Test School",
+                year_established=2000,
+                school_type=SchoolType.PUBLIC,
+                student_population=StudentPopulation.FROM_100_TO_300,
+            ),
+            location=LocationInfo(
+                country_code="GH",
+                city="Accra",
+                address="123 Test Street",
+            ),
+            contact=ContactInfo(
+                school_phone="+233999888777",
+                principal_name="Principal Name",
+                principal_email="principal@test.com",
+                principal_phone="+233123456789",
+            ),
+            applicant=ApplicantInfo(is_principal=True),
+            details=DetailsInfo(reasons=["digital_records"]),
+        )
+
+        result = get_effective_applicant_from_schema(data)
+        assert result == ("principal@test.com", "Principal Name")
+
+    def test_returns_lowercased_email(self):
+        """Emails are canonicalized to lowercase by the schema."""
+        data = SchoolApplicationCreate(
+            school=SchoolInfo(
+                name="Test School",
+                year_established=2000,
+                school_type=SchoolType.PUBLIC,
+                student_population=StudentPopulation.FROM_100_TO_300,
+            ),
+            location=LocationInfo(
+                country_code="GH",
+                city="Accra",
+                address="123 Test Street",
+            ),
+            contact=ContactInfo(
+                school_phone="+233999888777",
+                principal_name="Principal Name",
+                principal_email=" Principal@Test.COM ",
+                principal_phone="+233123456789",
+            ),
+            applicant=ApplicantInfo(is_principal=True),
+            details=DetailsInfo(reasons=["digital_records"]),
+        )
+
+        result = get_effective_applicant_from_schema(data)
+        assert result == ("principal@test.com", "Principal Name")
+
+    def test_returns_applicant_details_when_not_principal(self):
+        """When applicant is not principal, return applicant email and name."""
+        data = SchoolApplicationCreate(
+            school=SchoolInfo(
+                name="Test School",
+                year_established=2000,
+                school_type=SchoolType.PUBLIC,
+                student_population=StudentPopulation.FROM_100_TO_300,
+            ),
+            location=LocationInfo(
+                country_code="GH",
+                city="Accra",
+                address="123 Test Street",
+            ),
+            contact=ContactInfo(
+                school_phone="+233999888777",
+                principal_name="Principal Name",
+                principal_email="principal@test.com",
+                principal_phone="+233123456789",
+            ),
+            applicant=ApplicantInfo(
+                is_principal=False,
+                name="Applicant Name",
+                email="applicant@test.com",
+                phone="+233111222333",
+                role="Staff",
+                admin_choice=AdminChoice.APPLICANT,
+            ),
+            details=DetailsInfo(reasons=["digital_records"]),
+        )
+
+        result = get_effective_applicant_from_schema(data)
+        assert result == ("applicant@test.com", "Applicant Name")
+
+
+class TestHashToken:
+    """Tests for token hashing function."""
+
+    def test_hash_token_returns_raw_digest(self):
+        """Hash token should return the raw SHA-256 digest."""
+        result = hash_token("test_token")
+        assert isinstance(result, bytes)
+        # SHA-256 produces a 32 byte digest
+        assert len(result) == 32
+
+    def test_hash_token_is_deterministic(self):
+        """Same input should produce same hash."""
+        token = "my_secure_token"
+        hash1 = hash_token(token)
+        hash2 = hash_token(token)
+        assert hash1 == hash2
+
+    def test_hash_token_different_inputs_different_outputs(self):
+        """Different tokens should produce different hashes."""
+        hash1 = hash_token("token1")
+        hash2 = hash_token("token2")
+        assert hash1 != hash2
+
+
+class TestGenerateSecureToken:
+    """Tests for secure token generation."""
+
+    def test_generate_secure_token_is_url_safe(self):
+        """Generated tokens are 43 URL-safe characters."""
+        token = generate_secure_token()
+        assert len(token) == 43
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    def test_generate_secure_token_is_unique(self):
+        """Each call produces a new token."""
+        assert generate_secure_token() != generate_secure_token()
+
+    def test_generate_secure_token_unique_across_pool_refills(self):
+        """Tokens stay unique when the pool is drained and refilled."""
+        tokens = {generate_secure_token() for _ in range(TOKEN_POOL_BATCH * 2 + 1)}
+        assert len(tokens) == TOKEN_POOL_BATCH * 2 + 1
@@ -10,13 +10,22 @@ These tests cover:
 - Error handling and edge cases
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
+from redis.exceptions import NoScriptError
 
-from app.modules.school_applications.models import ApplicationStatus
+from app.modules.school_applications.helpers import hash_token
+from app.modules.school_applications.models import ApplicationStatus, TokenType
+from app.modules.school_applications.repository import (
+    DUPLICATE_BY_APPLICANT,
+    DUPLICATE_BY_SCHOOL_CITY,
+)
 from app.modules.school_applications.service import (
+    STATUS_TEXT,
     AlreadyVerifiedError,
     ApplicationNotFoundError,
     ApplicationServiceError,
@@ -27,8 +36,9 @@ from app.modules.school_applications.service import (
     RateLimitExceededError,
     TokenAlreadyUsedError,
     TokenExpiredError,
-    _hash_token,
     confirm_principal,
+    drain_pending_emails,
+    forget_duplicate_rejections,
     get_application_status,
     resend_verification,
     submit_application,
@@ -36,30 +46,6 @@ from app.modules.school_applications.service import (
 )
 
 
-class TestHashToken:
-    """Tests for token hashing function."""
-
-    def test_hash_token_returns_hex_string(self):
-        """Hash token should return a hex string."""
-        result = _hash_token("test_token")
-        assert isinstance(result, str)
-        # SHA-256 produces 64 character hex string
-        assert len(result) == 64
-
-    def test_hash_token_is_deterministic(self):
-        """Same input should produce same hash."""
-        token = "my_secure_token"
-        hash1 = _hash_token(token)
-        hash2 = _hash_token(token)
-        assert hash1 == hash2
-
-    def test_hash_token_different_inputs_different_outputs(self):
-        """Different tokens should produce different hashes."""
-        hash1 = _hash_token("token1")
-        hash2 = _hash_token("token2")
-        assert hash1 != hash2
-
-
 class TestSubmitApplication:
     """Tests for submit_application function."""
 
@@ -78,10 +64,7 @@ class TestSubmitApplication:
             ) as mock_email,
         ):
             # Setup mocks
-            mock_repo.get_by_applicant_email = AsyncMock(return_value=[])
-            mock_repo.get_pending_by_school_and_city = AsyncMock(return_value=None)
-            mock_repo.create = AsyncMock(return_value=sample_application_model)
-            mock_repo.create_token = AsyncMock()
+            mock_repo.create_with_token = AsyncMock(return_value=sample_application_model)
             mock_email.return_value = True
 
             # Execute
@@ -94,8 +77,7 @@ class TestSubmitApplication:
             assert "verify" in result.message.lower()
 
             # Verify repository calls
-            mock_repo.create.assert_called_once()
-            mock_repo.create_token.assert_called_once()
+            mock_repo.create_with_token.assert_called_once()
             mock_email.assert_called_once()
 
     @pytest.mark.asyncio
@@ -112,10 +94,9 @@ class TestSubmitApplication:
                 "app.modules.school_applications.service.send_applicant_verification"
             ) as mock_email,
         ):
-            mock_repo.get_by_applicant_email = AsyncMock(return_value=[])
-            mock_repo.get_pending_by_school_and_city = AsyncMock(return_value=None)
-            mock_repo.create = AsyncMock(return_value=sample_application_model_non_principal)
-            mock_repo.create_token = AsyncMock()
+            mock_repo.create_with_token = AsyncMock(
+                return_value=sample_application_model_non_principal
+            )
             mock_email.return_value = True
 
             result = await submit_application(mock_db, sample_application_create_non_principal)
@@ -128,13 +109,12 @@ class TestSubmitApplication:
         self,
         mock_db,
         sample_application_create,
-        sample_application_model,
     ):
         """Reject submission when duplicate application exists for email."""
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            # Return existing pending application
-            sample_application_model.status = ApplicationStatus.AWAITING_APPLICANT_VERIFICATION
-            mock_repo.get_by_applicant_email = AsyncMock(return_value=[sample_application_model])
+            # A pending application exists for this applicant + school
+            mock_repo.create_with_token = AsyncMock(return_value=None)
+            mock_repo.find_duplicate = AsyncMock(return_value=DUPLICATE_BY_APPLICANT)
 
             with pytest.raises(DuplicateApplicationError) as exc_info:
                 await submit_application(mock_db, sample_application_create)
@@ -142,24 +122,95 @@ class TestSubmitApplication:
             assert "pending application" in str(exc_info.value.message).lower()
 
     @pytest.mark.asyncio
-    async def test_submit_application_duplicate_by_school_city(
+    async def test_submit_application_duplicate_is_cached(
+        self,
+        mock_db,
+        sample_application_create,
+    ):
+        """A rejected duplicate is cached so the resubmission skips the database."""
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=[None, None])
+
+        with patch("app.modules.school_applications.service.repository") as mock_repo:
+            mock_repo.create_with_token = AsyncMock(return_value=None)
+            mock_repo.find_duplicate = AsyncMock(return_value=DUPLICATE_BY_APPLICANT)
+
+            with pytest.raises(DuplicateApplicationError):
+                await submit_application(mock_db, sample_application_create, mock_redis)
+
+            cache_key = mock_redis.set.call_args[0][0]
+            applicant_key, school_city_key = mock_redis.mget.call_args[0][0]
+            assert cache_key == applicant_key
+
+            # Resubmission is answered from the cache
+            mock_redis.mget = AsyncMock(return_value=["1", None])
+            mock_repo.create_with_token.reset_mock()
+
+            with pytest.raises(DuplicateApplicationError) as exc_info:
+                await submit_application(mock_db, sample_application_create, mock_redis)
+
+            mock_repo.create_with_token.assert_not_called()
+            assert "You already have a pending application" in exc_info.value.message
+
+    @pytest.mark.asyncio
+    async def test_closed_application_clears_cached_duplicates(
         self,
         mock_db,
         sample_application_create,
         sample_application_model,
+    ):
+        """Cached rejections are dropped when the conflicting application closes."""
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=[None, None])
+
+        with patch("app.modules.school_applications.service.repository") as mock_repo:
+            mock_repo.create_with_token = AsyncMock(return_value=None)
+            mock_repo.find_duplicate = AsyncMock(return_value=DUPLICATE_BY_SCHOOL_CITY)
+
+            with pytest.raises(DuplicateApplicationError):
+                await submit_application(mock_db, sample_application_create, mock_redis)
+
+        await forget_duplicate_rejections(mock_redis, sample_application_model)
+
+        cache_key = mock_redis.set.call_args[0][0]
+        assert cache_key in mock_redis.delete.call_args[0]
+
+    @pytest.mark.asyncio
+    async def test_submit_application_duplicate_by_school_city(
+        self,
+        mock_db,
+        sample_application_create,
     ):
         """Reject submission when duplicate application exists for school+city."""
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_applicant_email = AsyncMock(return_value=[])
-            mock_repo.get_pending_by_school_and_city = AsyncMock(
-                return_value=sample_application_model
-            )
+            mock_repo.create_with_token = AsyncMock(return_value=None)
+            mock_repo.find_duplicate = AsyncMock(return_value=DUPLICATE_BY_SCHOOL_CITY)
 
             with pytest.raises(DuplicateApplicationError) as exc_info:
                 await submit_application(mock_db, sample_application_create)
 
             assert "Test School" in str(exc_info.value.message)
 
+    @pytest.mark.asyncio
+    async def test_submit_application_conflict_cleared_is_not_cached(
+        self,
+        mock_db,
+        sample_application_create,
+    ):
+        """A conflict that closed before the lookup is reported but not cached."""
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=[None, None])
+
+        with patch("app.modules.school_applications.service.repository") as mock_repo:
+            mock_repo.create_with_token = AsyncMock(return_value=None)
+            mock_repo.find_duplicate = AsyncMock(return_value=None)
+
+            with pytest.raises(DuplicateApplicationError) as exc_info:
+                await submit_application(mock_db, sample_application_create, mock_redis)
+
+            assert "submit again" in exc_info.value.message
+            mock_redis.set.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_submit_application_email_failure_still_succeeds(
         self,
@@ -174,10 +225,7 @@ class TestSubmitApplication:
                 "app.modules.school_applications.service.send_applicant_verification"
             ) as mock_email,
         ):
-            mock_repo.get_by_applicant_email = AsyncMock(return_value=[])
-            mock_repo.get_pending_by_school_and_city = AsyncMock(return_value=None)
-            mock_repo.create = AsyncMock(return_value=sample_application_model)
-            mock_repo.create_token = AsyncMock()
+            mock_repo.create_with_token = AsyncMock(return_value=sample_application_model)
             mock_email.return_value = False  # Email fails
 
             # Should not raise
@@ -205,20 +253,18 @@ class TestVerifyApplicant:
                 "app.modules.school_applications.service.send_application_under_review"
             ) as mock_email,
         ):
-            mock_repo.get_by_token = AsyncMock(return_value=sample_verification_token)
-            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
-            mock_repo.mark_token_used = AsyncMock()
-            mock_repo.update_status = AsyncMock()
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=sample_application_model)
             mock_email.return_value = True
 
             result = await verify_applicant(mock_db, "raw_token_value")
 
             assert result.status == ApplicationStatus.PENDING_REVIEW
             assert result.requires_principal_confirmation is False
-            mock_repo.update_status.assert_called_once()
-            # Verify principal_confirmed_at is set
-            call_kwargs = mock_repo.update_status.call_args[1]
-            assert "principal_confirmed_at" in call_kwargs
+            mock_repo.consume_token_and_advance.assert_called_once()
+            # Verify principal_confirmed_at is set when the applicant is the principal
+            call_kwargs = mock_repo.consume_token_and_advance.call_args[1]
+            assert call_kwargs["principal_overrides"]["status"] == ApplicationStatus.PENDING_REVIEW
+            assert "principal_confirmed_at" in call_kwargs["principal_overrides"]
 
     @pytest.mark.asyncio
     async def test_verify_applicant_non_principal_needs_principal_confirmation(
@@ -236,26 +282,30 @@ class TestVerifyApplicant:
                 "app.modules.school_applications.service.send_principal_confirmation"
             ) as mock_email,
         ):
-            mock_repo.get_by_token = AsyncMock(return_value=sample_verification_token)
-            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model_non_principal)
-            mock_repo.mark_token_used = AsyncMock()
-            mock_repo.update_status = AsyncMock()
-            mock_repo.create_token = AsyncMock()
+            mock_repo.consume_token_and_advance = AsyncMock(
+                return_value=sample_application_model_non_principal
+            )
             mock_email.return_value = True
 
             result = await verify_applicant(mock_db, "raw_token_value")
 
             assert result.status == ApplicationStatus.AWAITING_PRINCIPAL_CONFIRMATION
             assert result.requires_principal_confirmation is True
-            assert result.principal_email_hint is not None
-            # Should create a new token for principal
-            mock_repo.create_token.assert_called_once()
+            assert result.principal_email_hint == "p***@test.com"
+            # The principal's token is created by the same statement, and the
+            # emailed plain token matches the stored hash
+            token_hash, token_type, _ = mock_repo.consume_token_and_advance.call_args.kwargs[
+                "next_token"
+            ]
+            assert token_type == TokenType.PRINCIPAL_CONFIRMATION
+            assert token_hash == hash_token(mock_email.call_args.kwargs["token"])
 
     @pytest.mark.asyncio
     async def test_verify_applicant_invalid_token(self, mock_db):
         """Raises InvalidTokenError when token not found."""
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_token = AsyncMock(return_value=None)
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=None)
+            mock_repo.get_token_with_application_view = AsyncMock(return_value=None)
 
             with pytest.raises(InvalidTokenError):
                 await verify_applicant(mock_db, "invalid_token")
@@ -268,7 +318,10 @@ class TestVerifyApplicant:
         expired_token.application_id = sample_application_model.id
 
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_token = AsyncMock(return_value=expired_token)
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=None)
+            mock_repo.get_token_with_application_view = AsyncMock(
+                return_value=(expired_token, sample_application_model)
+            )
 
             with pytest.raises(TokenExpiredError):
                 await verify_applicant(mock_db, "expired_token")
@@ -279,7 +332,10 @@ class TestVerifyApplicant:
         used_token.application_id = sample_application_model.id
 
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_token = AsyncMock(return_value=used_token)
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=None)
+            mock_repo.get_token_with_application_view = AsyncMock(
+                return_value=(used_token, sample_application_model)
+            )
 
             with pytest.raises(TokenAlreadyUsedError):
                 await verify_applicant(mock_db, "used_token")
@@ -293,12 +349,81 @@ class TestVerifyApplicant:
         sample_verification_token.application_id = sample_application_model.id
 
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_token = AsyncMock(return_value=sample_verification_token)
-            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=None)
+            mock_repo.get_token_with_application_view = AsyncMock(
+                return_value=(sample_verification_token, sample_application_model)
+            )
 
             with pytest.raises(InvalidApplicationStateError):
                 await verify_applicant(mock_db, "token")
 
+    @pytest.mark.asyncio
+    async def test_verify_applicant_coalesces_concurrent_duplicates(
+        self,
+        mock_db,
+        sample_application_model,
+    ):
+        """Concurrent requests for the same token share one consumption."""
+        sample_application_model.applicant_is_principal = True
+
+        async def slow_consume(*_args, **_kwargs):
+            await asyncio.sleep(0)
+            return sample_application_model
+
+        with (
+            patch("app.modules.school_applications.service.repository") as mock_repo,
+            patch(
+                "app.modules.school_applications.service.send_application_under_review"
+            ) as mock_email,
+        ):
+            mock_repo.consume_token_and_advance = AsyncMock(side_effect=slow_consume)
+            mock_email.return_value = True
+
+            first, second = await asyncio.gather(
+                verify_applicant(mock_db, "raw_token_value"),
+                verify_applicant(mock_db, "raw_token_value"),
+            )
+
+            assert first == second
+            mock_repo.consume_token_and_advance.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_verify_applicant_duplicate_retries_when_first_is_cancelled(
+        self,
+        mock_db,
+        sample_application_model,
+    ):
+        """A duplicate waiting on a cancelled request runs the consumption itself."""
+        sample_application_model.applicant_is_principal = True
+        first_started = asyncio.Event()
+
+        async def consume(*_args, **_kwargs):
+            if not first_started.is_set():
+                first_started.set()
+                await asyncio.Event().wait()  # Never finishes; cancelled below
+            return sample_application_model
+
+        with (
+            patch("app.modules.school_applications.service.repository") as mock_repo,
+            patch(
+                "app.modules.school_applications.service.send_application_under_review"
+            ) as mock_email,
+        ):
+            mock_repo.consume_token_and_advance = AsyncMock(side_effect=consume)
+            mock_email.return_value = True
+
+            first = asyncio.create_task(verify_applicant(mock_db, "raw_token_value"))
+            await first_started.wait()
+            second = asyncio.create_task(verify_applicant(mock_db, "raw_token_value"))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            result = await second
+
+            assert first.cancelled()
+            assert result.status == ApplicationStatus.PENDING_REVIEW
+            assert mock_repo.consume_token_and_advance.call_count == 2
+
 
 class TestConfirmPrincipal:
     """Tests for confirm_principal function."""
@@ -322,17 +447,16 @@ class TestConfirmPrincipal:
                 "app.modules.school_applications.service.send_application_under_review"
             ) as mock_email,
         ):
-            mock_repo.get_by_token = AsyncMock(return_value=sample_principal_token)
-            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model_non_principal)
-            mock_repo.mark_token_used = AsyncMock()
-            mock_repo.update_status = AsyncMock()
+            mock_repo.consume_token_and_advance = AsyncMock(
+                return_value=sample_application_model_non_principal
+            )
             mock_email.return_value = True
 
             result = await confirm_principal(mock_db, "principal_token")
 
             assert result.status == ApplicationStatus.PENDING_REVIEW
             assert result.school_name == "Test School"
-            mock_repo.update_status.assert_called_once()
+            mock_repo.consume_token_and_advance.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_confirm_principal_wrong_state(
@@ -348,8 +472,10 @@ class TestConfirmPrincipal:
         sample_principal_token.application_id = sample_application_model_non_principal.id
 
         with patch("app.modules.school_applications.service.repository") as mock_repo:
-            mock_repo.get_by_token = AsyncMock(return_value=sample_principal_token)
-            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model_non_principal)
+            mock_repo.consume_token_and_advance = AsyncMock(return_value=None)
+            mock_repo.get_token_with_application_view = AsyncMock(
+                return_value=(sample_principal_token, sample_application_model_non_principal)
+            )
 
             with pytest.raises(InvalidApplicationStateError):
                 await confirm_principal(mock_db, "token")
@@ -373,8 +499,7 @@ class TestResendVerification:
             ) as mock_email,
         ):
             mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
-            mock_repo.delete_tokens_for_application = AsyncMock()
-            mock_repo.create_token = AsyncMock()
+            mock_repo.replace_tokens = AsyncMock()
             mock_email.return_value = True
 
             result = await resend_verification(
@@ -386,8 +511,7 @@ class TestResendVerification:
 
             assert "resent" in result.message.lower()
             assert result.expires_at is not None
-            mock_repo.delete_tokens_for_application.assert_called_once()
-            mock_repo.create_token.assert_called_once()
+            mock_repo.replace_tokens.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_resend_verification_wrong_email(
@@ -396,7 +520,7 @@ class TestResendVerification:
         mock_redis,
         sample_application_model,
     ):
-        """Raises InvalidEmailError when email doesn't match."""
+        """Raises InvalidEmailError when email doesn't match, without charging the limit."""
         with patch("app.modules.school_applications.service.repository") as mock_repo:
             mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
 
@@ -408,6 +532,8 @@ class TestResendVerification:
                     mock_redis,
                 )
 
+            mock_redis.evalsha.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_resend_verification_already_verified(
         self,
@@ -437,8 +563,9 @@ class TestResendVerification:
     ):
         """Raises RateLimitExceededError when too many requests."""
         mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value="3")  # At limit
-        mock_redis.ttl = AsyncMock(return_value=1800)
+        # At limit: oldest request in the window was made 30 minutes ago
+        oldest = time.time() - 1800
+        mock_redis.evalsha = AsyncMock(return_value=[str(oldest), oldest])
 
         with patch("app.modules.school_applications.service.repository") as mock_repo:
             mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
@@ -451,7 +578,36 @@ class TestResendVerification:
                     mock_redis,
                 )
 
-            assert exc_info.value.retry_after_seconds > 0
+            # Oldest entry leaves the window in ~30 minutes, plus up to a minute of jitter
+            assert 1800 <= exc_info.value.retry_after_seconds <= 1800 + 60
+            # Keyed by the application's raw UUID bytes
+            key = mock_redis.evalsha.call_args.args[2]
+            assert key == b"rl:resend:" + sample_application_model.id.bytes
+
+    @pytest.mark.asyncio
+    async def test_resend_verification_rate_limit_script_not_cached(
+        self,
+        mock_db,
+        sample_application_model,
+    ):
+        """Falls back to EVAL when the server doesn't have the script cached."""
+        mock_redis = AsyncMock()
+        oldest = time.time() - 1800
+        mock_redis.evalsha = AsyncMock(side_effect=NoScriptError("No matching script"))
+        mock_redis.eval = AsyncMock(return_value=[str(oldest), oldest])
+
+        with patch("app.modules.school_applications.service.repository") as mock_repo:
+            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
+
+            with pytest.raises(RateLimitExceededError):
+                await resend_verification(
+                    mock_db,
+                    sample_application_model.id,
+                    "principal@test.com",
+                    mock_redis,
+                )
+
+            mock_redis.eval.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_resend_verification_fails_when_redis_unavailable(
@@ -496,6 +652,10 @@ class TestResendVerification:
 class TestGetApplicationStatus:
     """Tests for get_application_status function."""
 
+    def test_every_status_has_label_and_description(self):
+        """STATUS_TEXT covers every status, so lookups need no fallback."""
+        assert set(STATUS_TEXT) == set(ApplicationStatus)
+
     @pytest.mark.asyncio
     async def test_get_status_success(
         self,
@@ -523,15 +683,15 @@ class TestGetApplicationStatus:
         mock_db,
         sample_application_model,
     ):
-        """Email comparison should be case-insensitive."""
+        """Email comparison should ignore case and surrounding whitespace."""
         with patch("app.modules.school_applications.service.repository") as mock_repo:
             mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
 
-            # Use different case
+            # Use different case and stray whitespace
             result = await get_application_status(
                 mock_db,
                 sample_application_model.id,
-                "PRINCIPAL@TEST.COM",
+                " PRINCIPAL@TEST.COM ",
             )
 
             assert result.id == sample_application_model.id
@@ -608,3 +768,69 @@ class TestGetApplicationStatus:
 
             step_names = [step.name for step in result.steps]
             assert "Principal Confirmed" in step_names
+
+    @pytest.mark.asyncio
+    async def test_get_status_serves_repeat_polls_from_cache(
+        self,
+        mock_db,
+        sample_application_model,
+    ):
+        """A repeat poll with the same email skips the database; another email doesn't."""
+        with patch("app.modules.school_applications.service.repository") as mock_repo:
+            mock_repo.get_by_id = AsyncMock(return_value=sample_application_model)
+
+            first = await get_application_status(
+                mock_db,
+                sample_application_model.id,
+                "principal@test.com",
+            )
+            second = await get_application_status(
+                mock_db,
+                sample_application_model.id,
+                "Principal@Test.com",
+            )
+
+            assert second is first
+            mock_repo.get_by_id.assert_awaited_once()
+
+            with pytest.raises(InvalidEmailError):
+                await get_application_status(
+                    mock_db,
+                    sample_application_model.id,
+                    "hacker@evil.com",
+                )
+
+
+class TestDrainPendingEmails:
+    """Tests for drain_pending_emails function."""
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_background_sends(
+        self,
+        mock_db,
+        sample_application_create,
+        sample_application_model,
+    ):
+        """Emails dispatched by a request finish before drain returns."""
+        sent = asyncio.Event()
+
+        async def slow_send(**_kwargs):
+            await asyncio.sleep(0)
+            sent.set()
+            return True
+
+        with (
+            patch("app.modules.school_applications.service.repository") as mock_repo,
+            patch(
+                "app.modules.school_applications.service.send_applicant_verification",
+                side_effect=slow_send,
+            ),
+        ):
+            mock_repo.create_with_token = AsyncMock(return_value=sample_application_model)
+
+            await submit_application(mock_db, sample_application_create)
+            assert not sent.is_set()
+
+            await drain_pending_emails()
+
+            assert sent.is_set()